@@ -1,4 +1,4 @@
-from course_work import analyze
+from course_work.cli import analyze
 
 
-analyze()
\ No newline at end of file
+analyze()
@@ -1,77 +1,33 @@
-import click
-import json
-from course_work.core.models.AbstractSyntaxTree2 import ASTException
-from course_work.core.models.FiniteStateMachine import FiniteStateMachineException
-from course_work.core.parsers.LexicalAnalyzer import LexicalAnalyzer, LexemeIterator
-from course_work.core.parsers.SyntaxAnalyzer import SyntaxAnalyzer, SyntaxException
-from course_work.utils.errors_handler import handle_error
-
-# Path to state file
-STATES_JSON_PATH = "./course_work/states.json"
-
-lexical_table = {
-    "keywords": ["true", "false", "program", "var", "end", "begin", "int", "float", "bool", "if", "else", "for", "to",
-                 "step", "next", "while", "readln", "writeln"],
-    "limiters": ["!=", "==", "<", "<=", ">", ">=", "+", "-", "||", "*", "/", "&&", ",", "!", ";", "(", ")", "[", "]", "{", "}", ":=", "@"],
-    "numbers": [],
-    "identifiers": [],
+__version__ = "1.0.0"
+
+# Names of package are imported on first access, so importing course_work or any of its modules does not import
+# click, parsers and backends. Name -> module defining it
+_EXPORTS = {
+    "analyze": "course_work.cli",
+    "run_analysis": "course_work.cli",
+    "read_string": "course_work.cli",
+    "read_tokens": "course_work.cli",
+    "execute_program": "course_work.cli",
+    "execute_batch_program": "course_work.cli",
+    "execute_sandboxed": "course_work.cli",
+    "Analyzer": "course_work.core.Analyzer",
+    "AnalysisError": "course_work.core.Analyzer",
+    "AnalysisResult": "course_work.core.Analyzer",
+    "STATES_JSON_PATH": "course_work.core.Analyzer",
+    "optimize_tree": "course_work.core.Analyzer",
+    "RESERVED_WORDS": "course_work.core.data.LexicalTable",
 }
 
-def read_string(string):
-    """
-    Generator to read string symbol by symbol
-
-    :param string: string to iterate
-    """
-    for c in string:
-        yield c
-    yield "@"
-
-@click.command()
-@click.argument('file_path', type=click.Path(exists=True, readable=True))
-def analyze(file_path):
-    """
-    Code analyzer
-
-    :param file_path: Path to file to analyze
-    """
-
-    # Reading code
-    with open(file_path, encoding='utf-8') as f:
-        original_text = f.read()
-        text = original_text.replace("\n", " ") + " "
-
-    # Reading states for state machine
-    try:
-        with open(STATES_JSON_PATH, encoding="utf-8") as f:
-            states = json.load(f)
-    except FileNotFoundError:
-        click.echo(f"Ошибка: файл {STATES_JSON_PATH} не найден.")
-        return
-    except json.JSONDecodeError as e:
-        click.echo(f"Ошибка чтения JSON файла {STATES_JSON_PATH}: {e}")
-        return
 
-    # Initializing analyzers
-    lexer = LexicalAnalyzer(states, lexical_table, read_string(text))
-    lex_iterator = LexemeIterator(lexer)
-    p = SyntaxAnalyzer(lexer.lexical_table, lex_iterator)
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-    # Making analyze
-    try:
-        p.parse()
-        p.AST.root.semantic_check()
-        click.echo("Программа корректна. Абстрактное синтаксическое дерево программы:")
-        click.echo(p.AST.root.to_string())
-    except SyntaxException as e:
-        click.echo("Возникла синтаксическая ошибка!")
-        click.echo(handle_error(e, original_text))
-    except ASTException as e:
-        click.echo("Возникла семантическая ошибка!")
-        click.echo(handle_error(e, original_text))
-    except FiniteStateMachineException as e:
-        click.echo("Возникла лексическая ошибка!")
-        click.echo(e.message)
 
-if __name__ == "__main__":
-    analyze()
+def __dir__():
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,731 @@
+# Command line interface. Modules of analysis stages are imported inside functions when they are needed, so
+# --help and --version do not import them
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import click
+
+from course_work import __version__
+
+if TYPE_CHECKING:
+    from course_work.core.parsers.LexicalAnalyzer import LexicalAnalyzer, LexemeIterator
+    from course_work.core.parsers.PipelinedLexer import PipelinedLexemeIterator
+    from course_work.core.parsers.SyntaxAnalyzer import SyntaxAnalyzer
+    from course_work.core.runtime.Sandbox import Limits
+    from course_work.utils.profiler import Profiler
+    from course_work.utils.records import RecordWriter
+
+
+def read_string(string):
+    """
+    Generator to read string symbol by symbol
+
+    :param string: string to iterate
+    """
+    for c in string:
+        yield c
+    yield "@"
+
+
+def read_file(stream, chunk_size: int = 1 << 16):
+    """
+    Generator to read text stream symbol by symbol without reading it whole, the same symbols as read_string gives
+    for text of stream with new lines replaced by spaces and space added
+
+    :param stream: text stream
+    :param chunk_size: number of symbols read at once
+    """
+    while chunk := stream.read(chunk_size):
+        yield from chunk.replace("\n", " ")
+    yield " "
+    yield "@"
+
+
+def read_tokens(stream):
+    """
+    Generator to read whitespace separated tokens of readln input
+
+    :param stream: text stream
+    """
+    for line in stream:
+        yield from line.split()
+
+
+@click.command()
+@click.version_option(__version__, message="%(prog)s %(version)s")
+@click.argument('file_path', type=click.Path(exists=True, readable=True))
+@click.option('--profile', is_flag=True, help="Print time and counters of every analysis stage")
+@click.option('--profile-json', type=click.Path(dir_okay=False, writable=True), default=None,
+              help="Write profiling report to JSON file")
+@click.option('--profile-memory', is_flag=True,
+              help="Also measure peak memory while profiling, tracing of memory makes stages several times slower")
+@click.option('--expressions', type=click.Choice(["recursive", "pratt"]), default="recursive",
+              help="Expression parser: recursive descent or operator-precedence with flat chains")
+@click.option('--parser', 'parser_kind', type=click.Choice(["recursive", "table"]), default="recursive",
+              help="Syntax parser: recursive descent or table-driven LL(1) parser built from grammar file")
+@click.option('--save-ast', type=click.Path(dir_okay=False, writable=True), default=None,
+              help="Write checked tree and variables table to file in binary format")
+@click.option('--format', 'output_format', type=click.Choice(["text", "json", "ndjson"]), default="text",
+              help="Output format: text, JSON document or NDJSON stream of tokens and nodes. Records are written as "
+                   "soon as they are produced, but the tree is kept in memory unless --stream is given")
+@click.option('-O', '--optimize', type=click.IntRange(0, 3), default=0,
+              help="Optimization level: 0 - none, 1 - remove unreachable code, 2 - also remove dead stores and "
+                   "share common subexpressions, 3 - also optimize loops")
+@click.option('--check', type=click.Choice(["lex", "syntax", "semantic"]), default=None,
+              help="Only check program and print verdict: lex - tokens, syntax - grammar without building tree, "
+                   "semantic - full check")
+@click.option('--stream', is_flag=True,
+              help="Parse, check and print program one top-level operator at a time with memory independent of "
+                   "program length, verdict is printed at the end")
+@click.option('--pipeline', is_flag=True,
+              help="Run lexer in separate process at the same time as parser, tokens are passed through shared memory")
+@click.option('--run', is_flag=True, help="Execute program instead of printing tree")
+@click.option('--input', 'input_path', type=click.Path(exists=True, dir_okay=False, readable=True), default=None,
+              help="File with values read by readln (default: standard input)")
+@click.option('--emit-ir', is_flag=True,
+              help="Print intermediate representation in SSA form instead of tree, IR passes depend on -O level")
+@click.option('--backend', type=click.Choice(["tree", "ir", "batch"]), default="tree",
+              help="Execution backend for --run: tree interpreter, intermediate representation or batch of runs "
+                   "with NumPy, every non-empty line of input is values of one run, empty input is one run")
+@click.option('--max-instructions', type=click.IntRange(1), default=None,
+              help="Stop tree interpreter after this number of executed operators and expression nodes")
+@click.option('--time-limit', type=click.FloatRange(0, min_open=True), default=None,
+              help="Stop tree interpreter after this number of seconds")
+@click.option('--max-output', type=click.IntRange(0), default=None,
+              help="Stop tree interpreter when writeln output exceeds this number of bytes")
+@click.option('--profile-run', is_flag=True,
+              help="Print program annotated with executions and time of its lines after execution by tree interpreter")
+@click.option('--profile-run-json', type=click.Path(dir_okay=False, writable=True), default=None,
+              help="Write JSON report of hot operators of program executed by tree interpreter to file")
+def analyze(file_path, profile, profile_json, expressions, parser_kind, save_ast, output_format, optimize, check, stream, pipeline,
+            run, input_path, emit_ir, backend, max_instructions, time_limit, max_output, profile_run, profile_run_json,
+            profile_memory):
+    """
+    Code analyzer
+
+    Check program in FILE_PATH and print its syntax tree, or only check it (--check), execute it (--run) or print its
+    intermediate representation (--emit-ir)
+    """
+    from course_work.utils.profiler import Profiler
+
+    if stream and (run or emit_ir or save_ast is not None or optimize or check is not None or parser_kind != "recursive"):
+        raise click.UsageError("--stream can not be used with --run, --emit-ir, --save-ast, -O, --check or --parser")
+    if parser_kind == "table" and expressions == "pratt":
+        raise click.UsageError("--parser table builds full expressions, it can not be used with --expressions pratt")
+    if pipeline and (stream or check == "lex"):
+        raise click.UsageError("--pipeline can not be used with --stream or --check lex")
+    if check is not None and (optimize or run or emit_ir or save_ast is not None):
+        raise click.UsageError("--check only prints verdict, it can not be used with -O, --run, --emit-ir or --save-ast")
+    if emit_ir and run:
+        raise click.UsageError("--emit-ir prints program instead of executing it, it can not be used with --run")
+    if not run and (input_path is not None or backend != "tree"):
+        raise click.UsageError("--input and --backend require --run")
+    if (max_instructions, time_limit, max_output) != (None, None, None) and (not run or backend != "tree"):
+        raise click.UsageError("--max-instructions, --time-limit and --max-output require --run with --backend tree")
+    if profile_memory and not (profile or profile_json is not None):
+        raise click.UsageError("--profile-memory requires --profile or --profile-json")
+    limits = None
+    if (profile_run or profile_run_json is not None) and (not run or backend != "tree" or
+                                                          (max_instructions, time_limit, max_output) != (None, None, None)):
+        raise click.UsageError("--profile-run and --profile-run-json require --run with --backend tree and can not be "
+                               "used with --max-instructions, --time-limit or --max-output")
+    if (max_instructions, time_limit, max_output) != (None, None, None):
+        from course_work.core.runtime.Sandbox import Limits
+        limits = Limits(max_instructions, time_limit, max_output)
+    profiler = Profiler(enabled=profile or profile_json is not None, trace_memory=profile_memory)
+    profiler.start()
+
+    try:
+        if stream:
+            run_streaming_analysis(file_path, profiler, expressions, output_format)
+        else:
+            run_analysis(file_path, profiler, expressions, save_ast, output_format, optimize, run, input_path,
+                         emit_ir, backend, limits, check, pipeline, parser_kind, profile_run, profile_run_json)
+    finally:
+        profiler.stop()
+
+    if profile:
+        # Profiling table is not mixed with machine-readable output
+        click.echo(profiler.format_table(), err=output_format != "text")
+    if profile_json is not None:
+        with open(profile_json, "w", encoding="utf-8") as f:
+            f.write(profiler.to_json())
+
+
+def run_analysis(file_path,
+                 profiler: "Profiler",
+                 expressions: str = "recursive",
+                 save_ast: str | None = None,
+                 output_format: str = "text",
+                 optimize: int = 0,
+                 run: bool = False,
+                 input_path: str | None = None,
+                 emit_ir: bool = False,
+                 backend: str = "tree",
+                 limits: "Limits | None" = None,
+                 check: str | None = None,
+                 pipeline: bool = False,
+                 parser_kind: str = "recursive",
+                 profile_run: bool = False,
+                 profile_run_json: str | None = None,
+                 ):
+    """
+    Analyze file and echo result of mode: verdict of check, output of execution, IR or tree
+
+    :param file_path: Path to file to analyze
+    :param profiler: Profiler object measuring stages
+    :param expressions: expression parser, "recursive" or "pratt"
+    :param save_ast: path to write binary tree
+    :param output_format: output format, "text", "json" or "ndjson"
+    :param optimize: optimization level, 0 - no optimizations
+    :param run: execute program instead of printing tree
+    :param input_path: path of file with readln values, standard input is used if None
+    :param emit_ir: print intermediate representation instead of tree
+    :param backend: execution backend, "tree", "ir" or "batch"
+    :param limits: budgets of execution, tree is executed in sandbox if given
+    :param check: only check program up to level and print verdict: "lex", "syntax" or "semantic"
+    :param pipeline: run lexer in separate process, lexical table of parser is filled by tokens of lexer
+    :param parser_kind: syntax parser, "recursive" or "table"
+    :param profile_run: print program annotated with executions and time of its lines after execution
+    :param profile_run_json: path to write JSON report of hot operators of execution
+    """
+    import json
+    from course_work.core.Analyzer import STATES_JSON_PATH
+    from course_work.core.exceptions import (
+        ASTException,
+        FiniteStateMachineException,
+        PipelineException,
+        RuntimeException,
+        SyntaxException,
+    )
+    from course_work.utils.errors_handler import handle_error
+
+    # Reading code
+    with profiler.stage("reading"):
+        with open(file_path, encoding='utf-8') as f:
+            original_text = f.read()
+            text = original_text.replace("\n", " ") + " "
+    profiler.source_size = len(original_text)
+
+    # Reading states for state machine
+    try:
+        with profiler.stage("load_states"):
+            with open(STATES_JSON_PATH, encoding="utf-8") as f:
+                states = json.load(f)
+    except FileNotFoundError:
+        click.echo(f"Ошибка: файл {STATES_JSON_PATH} не найден.")
+        return
+    except json.JSONDecodeError as e:
+        click.echo(f"Ошибка чтения JSON файла {STATES_JSON_PATH}: {e}")
+        return
+
+    analysis = make_analysis(original_text, text, states, profiler, expressions, output_format, check, pipeline,
+                             parser_kind)
+    writer = analysis.writer
+
+    # Making analyze
+    try:
+        if check is not None:
+            check_program(analysis, check)
+        else:
+            changes = prepare_tree(analysis, save_ast, optimize)
+            if run:
+                run_program(analysis, optimize, input_path, backend, limits, profile_run, profile_run_json)
+            elif emit_ir:
+                print_ir(analysis, optimize)
+            else:
+                print_tree(analysis, expressions, optimize, changes)
+        if writer is not None:
+            writer.finish_ok()
+    except SyntaxException as e:
+        if writer is not None:
+            writer.finish_error("syntax", e.message, e.lexeme.lexeme_pointer)
+            return
+        click.echo("Возникла синтаксическая ошибка!")
+        click.echo(handle_error(e, original_text))
+    except ASTException as e:
+        if writer is not None:
+            writer.finish_error("semantic", e.message, e.lexeme.lexeme_pointer)
+            return
+        click.echo("Возникла семантическая ошибка!")
+        click.echo(handle_error(e, original_text))
+    except RuntimeException as e:
+        if writer is not None:
+            writer.finish_error("runtime", e.message, e.lexeme.lexeme_pointer if e.lexeme else None)
+            return
+        click.echo("Возникла ошибка выполнения!")
+        click.echo(handle_error(e, original_text))
+    except FiniteStateMachineException as e:
+        if writer is not None:
+            writer.finish_error("lexical", e.message, e.pointer)
+            return
+        click.echo("Возникла лексическая ошибка!")
+        click.echo(e.message)
+    except PipelineException as e:
+        if writer is not None:
+            writer.finish_error("pipeline", e.message, None)
+            return
+        click.echo("Возникла ошибка конвейера!")
+        click.echo(e.message)
+    finally:
+        if pipeline:
+            analysis.lex_iterator.close()
+
+
+# Analyzers of one file and where their results go, shared by modes of run_analysis
+@dataclass
+class Analysis:
+    original_text: str
+    profiler: "Profiler"
+    lexer: "LexicalAnalyzer | None"     # None if lexer runs in separate process
+    lex_iterator: "LexemeIterator | PipelinedLexemeIterator"
+    parser: "SyntaxAnalyzer"
+    writer: "RecordWriter | None"       # None for text output
+
+
+def make_analysis(original_text: str,
+                  text: str,
+                  states: dict,
+                  profiler: "Profiler",
+                  expressions: str,
+                  output_format: str,
+                  check: str | None,
+                  pipeline: bool,
+                  parser_kind: str,
+                  ) -> Analysis:
+    """
+    Create lexer and parser of text chosen by options
+
+    :param original_text: text of file
+    :param text: text of file prepared for lexer
+    :param states: states of lexer
+    :param profiler: Profiler object measuring stages
+    :param expressions: expression parser, "recursive" or "pratt"
+    :param output_format: output format, "text", "json" or "ndjson"
+    :param check: check level or None
+    :param pipeline: run lexer in separate process
+    :param parser_kind: syntax parser, "recursive" or "table"
+    :return: Analysis object
+    """
+    from course_work.core.data.LexicalTable import RESERVED_WORDS
+    from course_work.core.parsers.LexicalAnalyzer import LexicalAnalyzer, LexemeIterator
+    from course_work.core.parsers.SyntaxAnalyzer import SyntaxAnalyzer
+
+    if pipeline:
+        from course_work.core.parsers.PipelinedLexer import PipelinedLexemeIterator
+        lexer = None
+        lex_iterator = PipelinedLexemeIterator(states, RESERVED_WORDS, text)
+        lexical_table = lex_iterator.lexical_table
+    else:
+        lexer = LexicalAnalyzer(states, RESERVED_WORDS, read_string(text))
+        lex_iterator = LexemeIterator(lexer)
+        lexical_table = lexer.lexical_table
+    if parser_kind == "table":
+        from course_work.core.parsers.TableSyntaxAnalyzer import TableSyntaxAnalyzer
+        p = TableSyntaxAnalyzer(lexical_table, lex_iterator)
+    elif check == "syntax":
+        # Tree is not needed to check syntax
+        from course_work.core.parsers.SyntaxRecognizer import SyntaxRecognizer
+        p = SyntaxRecognizer(lexical_table, lex_iterator)
+    elif expressions == "pratt":
+        from course_work.core.parsers.PrattSyntaxAnalyzer import PrattSyntaxAnalyzer
+        p = PrattSyntaxAnalyzer(lexical_table, lex_iterator)
+    else:
+        p = SyntaxAnalyzer(lexical_table, lex_iterator)
+    profiler.instrument(lexer, lex_iterator, p)
+
+    # Tokens and nodes are written as soon as they are produced
+    writer = None
+    if output_format != "text":
+        from course_work.utils.records import RecordWriter
+        writer = RecordWriter(sys.stdout, ndjson=output_format == "ndjson")
+        if check is None:
+            writer.instrument(lex_iterator, p)
+    return Analysis(original_text, profiler, lexer, lex_iterator, p, writer)
+
+
+def check_program(analysis: Analysis, check: str):
+    """
+    Check program up to level and echo verdict, errors are raised
+
+    :param analysis: Analysis object
+    :param check: check level, "lex", "syntax" or "semantic"
+    """
+    with analysis.profiler.stage("checking"):
+        if check == "lex":
+            # Lexemes are not needed, state machine is only run to the end of text
+            lexer = analysis.lexer
+            while not lexer.finished:
+                lexer.make_step()
+        else:
+            analysis.parser.parse()
+            if check == "semantic":
+                analysis.parser.AST.root.semantic_check()
+    if analysis.writer is None:
+        click.echo("Программа корректна.")
+
+
+def prepare_tree(analysis: Analysis, save_ast: str | None, optimize: int) -> list:
+    """
+    Parse, check, save and optimize tree
+
+    :param analysis: Analysis object
+    :param save_ast: path to write binary tree
+    :param optimize: optimization level
+    :return: changes made by optimization
+    """
+    from course_work.core.Analyzer import optimize_tree
+
+    profiler = analysis.profiler
+    p = analysis.parser
+    with profiler.stage("parsing"):
+        p.parse()
+    profiler.count_nodes(p.AST.root)
+    with profiler.stage("semantic_check"):
+        p.AST.root.semantic_check()
+    # Checked tree is saved before optimization, temporary variables are not in lexical table
+    if save_ast is not None:
+        with profiler.stage("serialization"):
+            from course_work.core.models.ASTSerializer import dumps
+            with open(save_ast, "wb") as f:
+                f.write(dumps(p.AST, p.lexical_table))
+    with profiler.stage("optimization"):
+        changes = optimize_tree(p.AST, optimize)
+    if analysis.writer is not None:
+        for change in changes:
+            analysis.writer.write({
+                "record": "optimization",
+                "kind": change.kind,
+                "offset": change.pointer,
+                "description": change.description,
+            })
+    return changes
+
+
+def lower_program(analysis: Analysis, optimize: int):
+    """
+    Lower checked tree to IR and run IR passes of optimization level
+
+    :param analysis: Analysis object
+    :param optimize: optimization level
+    :return: IR function
+    """
+    with analysis.profiler.stage("lowering"):
+        from course_work.core.ir.Lowering import lower
+        from course_work.core.ir.PassManager import PassManager
+        function = lower(analysis.parser.AST)
+    with analysis.profiler.stage("ir_passes"):
+        PassManager.for_level(optimize).run(function)
+    return function
+
+
+def print_ir(analysis: Analysis, optimize: int):
+    function = lower_program(analysis, optimize)
+    if analysis.writer is not None:
+        analysis.writer.write({"record": "ir", "text": function.to_string()})
+        return
+    click.echo("Программа корректна. Промежуточное представление программы:")
+    click.echo(function.to_string())
+
+
+def print_tree(analysis: Analysis, expressions: str, optimize: int, changes: list):
+    """
+    Echo checked tree and changes made by optimization, nodes of records are already written
+
+    :param analysis: Analysis object
+    :param expressions: expression parser, "recursive" or "pratt"
+    :param optimize: optimization level
+    :param changes: changes made by optimization
+    """
+    if analysis.writer is not None:
+        return
+    with analysis.profiler.stage("to_string"):
+        root = analysis.parser.AST.root
+        if expressions == "pratt":
+            from course_work.core.parsers.PrattSyntaxAnalyzer import expand
+            root = expand(root)
+        tree_text = root.to_string()
+    click.echo("Программа корректна. Абстрактное синтаксическое дерево программы:")
+    click.echo(tree_text)
+    if optimize:
+        click.echo(f"Оптимизация (уровень {optimize}), изменений: {len(changes)}")
+        for change in changes:
+            line = analysis.original_text.count("\n", 0, change.pointer or 0) + 1
+            click.echo(f"  строка {line}: {change.description}")
+
+
+def run_program(analysis: Analysis,
+                optimize: int,
+                input_path: str | None,
+                backend: str,
+                limits: "Limits | None",
+                profile_run: bool,
+                profile_run_json: str | None,
+                ):
+    """
+    Execute checked tree by backend and echo its output, runtime error is raised after output
+
+    :param analysis: Analysis object
+    :param optimize: optimization level
+    :param input_path: path of file with readln values, standard input is used if None
+    :param backend: execution backend, "tree", "ir" or "batch"
+    :param limits: budgets of execution, tree is executed in sandbox if given
+    :param profile_run: print program annotated with executions and time of its lines after execution
+    :param profile_run_json: path to write JSON report of hot operators of execution
+    """
+    if backend == "batch":
+        run_batch(analysis, input_path)
+    elif limits is not None:
+        run_sandboxed(analysis, input_path, limits)
+    elif profile_run or profile_run_json is not None:
+        run_profiled(analysis, input_path, profile_run, profile_run_json)
+    else:
+        program = lower_program(analysis, optimize) if backend == "ir" else analysis.parser.AST
+        with analysis.profiler.stage("execution"):
+            result = execute_program(program, input_path)
+        if analysis.writer is not None:
+            echo_output(analysis, result.output)
+        elif result.output or result.error is None:
+            click.echo("\n".join(result.output))
+        if result.error is not None:
+            raise result.error
+
+
+def echo_output(analysis: Analysis, output: list[str]):
+    if analysis.writer is not None:
+        for line in output:
+            analysis.writer.write({"record": "output", "line": line})
+    elif output:
+        click.echo("\n".join(output))
+
+
+def run_batch(analysis: Analysis, input_path: str | None):
+    from course_work.utils.errors_handler import handle_error
+
+    writer = analysis.writer
+    with analysis.profiler.stage("execution"):
+        result = execute_batch_program(analysis.parser.AST, input_path)
+    for i, (output, error) in enumerate(zip(result.outputs, result.errors), start=1):
+        if writer is not None:
+            for line in output:
+                writer.write({"record": "output", "run": i, "line": line})
+            if error is not None:
+                writer.write({
+                    "record": "error",
+                    "run": i,
+                    "kind": "runtime",
+                    "message": error.message,
+                    "offset": error.lexeme.lexeme_pointer if error.lexeme else None,
+                })
+            continue
+        click.echo(f"Запуск {i}:")
+        if output:
+            click.echo("\n".join(output))
+        if error is not None:
+            click.echo("Возникла ошибка выполнения!")
+            click.echo(handle_error(error, analysis.original_text))
+
+
+def run_sandboxed(analysis: Analysis, input_path: str | None, limits: "Limits"):
+    with analysis.profiler.stage("execution"):
+        result = execute_sandboxed(analysis.parser.AST, input_path, limits)
+    echo_output(analysis, result.output)
+    if analysis.writer is not None:
+        analysis.writer.write({"record": "usage", **result.usage.to_dict()})
+    else:
+        usage = result.usage
+        click.echo(f"Использовано: инструкций {usage.instructions}, время {usage.seconds:.3f} с, "
+                   f"вывод {usage.output} байт", err=True)
+    if result.error is not None:
+        raise result.error
+
+
+def run_profiled(analysis: Analysis, input_path: str | None, profile_run: bool, profile_run_json: str | None):
+    from course_work.utils.execution_profile import build_report, format_listing, to_json
+
+    with analysis.profiler.stage("execution"):
+        result = execute_profiled(analysis.parser.AST, input_path)
+    report = build_report(result, analysis.original_text)
+    echo_output(analysis, result.output)
+    if profile_run:
+        # Listing is not mixed with machine-readable output
+        click.echo(format_listing(report, analysis.original_text), err=analysis.writer is not None)
+    if profile_run_json is not None:
+        with open(profile_run_json, "w", encoding="utf-8") as f:
+            f.write(to_json(report))
+    if result.error is not None:
+        raise result.error
+
+
+def run_streaming_analysis(file_path,
+                           profiler: "Profiler",
+                           expressions: str = "recursive",
+                           output_format: str = "text",
+                           ):
+    """
+    Analyze file one top-level operator at a time and echo every checked part of tree as soon as it is checked.
+    Program text and tree are not kept, so memory does not depend on program length
+
+    :param file_path: Path to file to analyze
+    :param profiler: Profiler object measuring stages
+    :param expressions: expression parser, "recursive" or "pratt"
+    :param output_format: output format, "text", "json" or "ndjson"
+    """
+    import json
+    from course_work.core.Analyzer import STATES_JSON_PATH
+    from course_work.core.data.LexicalTable import RESERVED_WORDS
+    from course_work.core.exceptions import ASTException, FiniteStateMachineException, SyntaxException
+    from course_work.core.parsers.LexicalAnalyzer import LexicalAnalyzer, LexemeIterator
+    from course_work.core.parsers.StreamingAnalyzer import StreamingAnalyzer
+    from course_work.core.parsers.SyntaxAnalyzer import SyntaxAnalyzer
+    from course_work.utils.errors_handler import handle_file_error
+
+    with profiler.stage("load_states"):
+        with open(STATES_JSON_PATH, encoding="utf-8") as f:
+            states = json.load(f)
+
+    with open(file_path, encoding="utf-8") as source:
+        lexer = LexicalAnalyzer(states, RESERVED_WORDS, read_file(source))
+        lex_iterator = LexemeIterator(lexer)
+        if expressions == "pratt":
+            from course_work.core.parsers.PrattSyntaxAnalyzer import PrattSyntaxAnalyzer, expand
+            p = PrattSyntaxAnalyzer(lexer.lexical_table, lex_iterator)
+        else:
+            p = SyntaxAnalyzer(lexer.lexical_table, lex_iterator)
+        profiler.instrument(lexer, lex_iterator, p)
+
+        writer = None
+        if output_format != "text":
+            from course_work.utils.records import RecordWriter
+            writer = RecordWriter(sys.stdout, ndjson=output_format == "ndjson")
+            writer.instrument(lex_iterator, p)
+
+        try:
+            # Tree is printed in parts, together they are the same as tree printed by run_analysis
+            current_key = None
+            with profiler.stage("streaming"):
+                for key, node in StreamingAnalyzer(p).parse():
+                    if writer is not None:
+                        # Top-level nodes have no parent record, program node is not written
+                        writer.release(node)
+                        continue
+                    if current_key is None:
+                        click.echo("ProgramNode(")
+                    elif key != current_key:
+                        click.echo(" )")
+                    if key != current_key:
+                        click.echo(f" {key}: (")
+                        current_key = key
+                    click.echo((expand(node) if expressions == "pratt" else node).to_string(2), nl=False)
+            # Space added after text is read too
+            profiler.source_size = lexer.pointer - 1
+            if writer is not None:
+                writer.finish_ok()
+            else:
+                click.echo(" )\n)ProgramNodeEnd\n")
+                click.echo("Программа корректна.")
+        except SyntaxException as e:
+            if writer is not None:
+                writer.finish_error("syntax", e.message, e.lexeme.lexeme_pointer)
+                return
+            click.echo("Возникла синтаксическая ошибка!")
+            click.echo(handle_file_error(e, file_path))
+        except ASTException as e:
+            if writer is not None:
+                writer.finish_error("semantic", e.message, e.lexeme.lexeme_pointer)
+                return
+            click.echo("Возникла семантическая ошибка!")
+            click.echo(handle_file_error(e, file_path))
+        except FiniteStateMachineException as e:
+            if writer is not None:
+                writer.finish_error("lexical", e.message, e.pointer)
+                return
+            click.echo("Возникла лексическая ошибка!")
+            click.echo(e.message)
+
+
+def execute_batch_program(tree, input_path: str | None = None):
+    """
+    Execute checked tree over many inputs, every non-empty line of input is values of one run. Input without such
+    lines is one run without values, as for other backends
+
+    :param tree: checked syntax tree
+    :param input_path: path of file with readln values, standard input is used if None
+    :return: BatchResult object
+    """
+    from course_work.core.runtime.BatchExecutor import execute_batch
+
+    def read_runs(stream) -> list[list[str]]:
+        return [line.split() for line in stream if line.strip()] or [[]]
+
+    if input_path is None:
+        return execute_batch(tree, read_runs(sys.stdin))
+    with open(input_path, encoding="utf-8") as f:
+        return execute_batch(tree, read_runs(f))
+
+
+def execute_sandboxed(tree, input_path: str | None, limits: "Limits"):
+    """
+    Execute checked tree in sandbox
+
+    :param tree: checked syntax tree
+    :param input_path: path of file with readln values, standard input is used if None
+    :param limits: budgets of execution
+    :return: SandboxResult object
+    """
+    from course_work.core.runtime.Sandbox import Sandbox
+
+    if input_path is None:
+        return Sandbox(tree, read_tokens(sys.stdin), limits).run()
+    with open(input_path, encoding="utf-8") as f:
+        return Sandbox(tree, read_tokens(f), limits).run()
+
+
+def execute_profiled(tree, input_path: str | None = None):
+    """
+    Execute checked tree counting executions and time of operators
+
+    :param tree: checked syntax tree
+    :param input_path: path of file with readln values, standard input is used if None
+    :return: ProfiledRun object
+    """
+    from course_work.core.runtime.OperatorProfiler import run_profiled
+
+    if input_path is None:
+        return run_profiled(tree, read_tokens(sys.stdin))
+    with open(input_path, encoding="utf-8") as f:
+        return run_profiled(tree, read_tokens(f))
+
+
+def execute_program(program, input_path: str | None = None):
+    """
+    Execute checked tree or IR function
+
+    :param program: checked syntax tree or IR function
+    :param input_path: path of file with readln values, standard input is used if None
+    :return: ExecutionResult object, lines written before runtime error are kept with the error
+    """
+    from course_work.core.exceptions import RuntimeException
+    from course_work.core.models.AbstractSyntaxTree2 import AbstractSyntaxTree
+    from course_work.core.runtime.values import ExecutionResult
+    if isinstance(program, AbstractSyntaxTree):
+        from course_work.core.runtime.Interpreter import Interpreter as backend
+    else:
+        from course_work.core.ir.Executor import Executor as backend
+
+    def run(inputs) -> ExecutionResult:
+        executor = backend(program, inputs)
+        try:
+            return ExecutionResult(executor.run())
+        except RuntimeException as e:
+            return ExecutionResult(executor.output, e)
+
+    if input_path is None:
+        return run(read_tokens(sys.stdin))
+    with open(input_path, encoding="utf-8") as f:
+        return run(read_tokens(f))
+
+
+if __name__ == "__main__":
+    analyze()
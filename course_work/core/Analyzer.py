@@ -0,0 +1,166 @@
+import itertools
+import json
+import os
+import time
+from dataclasses import dataclass, field
+
+from course_work.core.data.LexicalTable import LexicalTable, RESERVED_WORDS
+from course_work.core.exceptions import ASTException, FiniteStateMachineException, SyntaxException
+from course_work.core.models.AbstractSyntaxTree2 import AbstractSyntaxTree
+from course_work.core.models.FiniteStateMachine import Automaton
+from course_work.core.optimization.changes import Change
+from course_work.core.parsers.LexicalAnalyzer import LexicalAnalyzer, LexemeIterator
+from course_work.core.parsers.PrattSyntaxAnalyzer import PrattSyntaxAnalyzer, expand
+from course_work.core.parsers.SyntaxAnalyzer import SyntaxAnalyzer
+
+# Path to state file, it does not depend on working directory
+STATES_JSON_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "states.json")
+
+
+def optimize_tree(tree: AbstractSyntaxTree, level: int) -> list[Change]:
+    """
+    Run optimization passes of level on checked tree
+
+    :param tree: checked syntax tree, it is changed in place
+    :param level: optimization level, 0 - no optimizations
+    :return: list of changes
+    """
+    if level <= 0:
+        return []
+    # Passes are imported only when needed, they are not used by most runs
+    from course_work.core.optimization.CommonSubexpressions import share_common_subexpressions
+    from course_work.core.optimization.DeadCodeElimination import eliminate_dead_code
+    from course_work.core.optimization.LoopOptimization import optimize_loops
+
+    changes = eliminate_dead_code(tree, level)
+    if level >= 3:
+        changes += optimize_loops(tree)
+    # Shared nodes must not be changed by other passes, so common subexpressions are shared last
+    if level >= 2:
+        changes += share_common_subexpressions(tree)
+    return changes
+
+
+# Error stopping analysis
+@dataclass
+class AnalysisError:
+    kind: str                   # "encoding", "lexical", "syntax" or "semantic"
+    message: str
+    offset: int | None          # position in text
+    line: int | None = None     # line number, from 1
+    column: int | None = None   # column number, from 1
+
+
+# Result of analysis of one program
+@dataclass
+class AnalysisResult:
+    text: str
+    tree: AbstractSyntaxTree | None = None
+    lexical_table: LexicalTable | None = None
+    changes: list[Change] = field(default_factory=list)
+    error: AnalysisError | None = None
+    seconds: float = 0.0
+    expressions: str = "recursive"
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def tree_string(self) -> str | None:
+        """
+        Get printed tree, the same as printed by command line analyzer
+
+        :return: tree string or None if analysis failed
+        """
+        if self.tree is None or self.error is not None:
+            return None
+        root = expand(self.tree.root) if self.expressions == "pratt" else self.tree.root
+        return root.to_string()
+
+
+# Reusable analyzer of programs. States are loaded and compiled once, every call creates only its own lexical table,
+# analyzers and tree, so one object can be used by many threads at once.
+class Analyzer:
+    def __init__(self,
+                 states: dict | Automaton | str | None = None,
+                 expressions: str = "recursive",
+                 optimize: int = 0,
+                 ):
+        """
+        Initialize analyzer
+
+        :param states: states of lexical state machine, automaton compiled from them or path of states file,
+        states file of package is used if None
+        :param expressions: expression parser, "recursive" or "pratt"
+        :param optimize: optimization level, 0 - no optimizations
+        """
+        if states is None or isinstance(states, (str, os.PathLike)):
+            with open(STATES_JSON_PATH if states is None else states, encoding="utf-8") as f:
+                states = json.load(f)
+        self.automaton = states if isinstance(states, Automaton) else Automaton(states)
+        self.expressions = expressions
+        self.optimize = optimize
+
+    def analyze_text(self, text: str) -> AnalysisResult:
+        """
+        Analyze program text
+
+        :param text: program text
+        :return: result with checked tree or error
+        """
+        start = time.perf_counter()
+        result = AnalysisResult(text, expressions=self.expressions)
+        symbols = itertools.chain(text.replace("\n", " ") + " ", "@")
+        try:
+            lexer = LexicalAnalyzer(self.automaton, RESERVED_WORDS, symbols)
+            lex_iterator = LexemeIterator(lexer)
+            if self.expressions == "pratt":
+                p = PrattSyntaxAnalyzer(lexer.lexical_table, lex_iterator)
+            else:
+                p = SyntaxAnalyzer(lexer.lexical_table, lex_iterator)
+            result.lexical_table = lexer.lexical_table
+            result.tree = p.AST
+            p.parse()
+            p.AST.root.semantic_check()
+            result.changes = optimize_tree(p.AST, self.optimize)
+        except (FiniteStateMachineException, SyntaxException, ASTException) as e:
+            result.error = self.make_error(text, e.kind, e.message, e.pointer)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def analyze_bytes(self, data: bytes, encoding: str = "utf-8") -> AnalysisResult:
+        """
+        Analyze program text given as bytes
+
+        :param data: encoded program text
+        :param encoding: encoding of text
+        :return: result with checked tree or error
+        """
+        try:
+            text = data.decode(encoding)
+        except UnicodeDecodeError as e:
+            result = AnalysisResult("", expressions=self.expressions)
+            result.error = AnalysisError("encoding", f"Текст не является текстом в кодировке {encoding}!", e.start)
+            return result
+        return self.analyze_text(text)
+
+    def analyze_file(self, path: str | os.PathLike, encoding: str = "utf-8") -> AnalysisResult:
+        """
+        Analyze program file
+
+        :param path: path of file
+        :param encoding: encoding of file
+        :return: result with checked tree or error
+        :raise OSError: if file can not be read
+        """
+        with open(path, "rb") as f:
+            return self.analyze_bytes(f.read(), encoding)
+
+    @staticmethod
+    def make_error(text: str, kind: str, message: str, offset: int | None) -> AnalysisError:
+        if offset is None:
+            return AnalysisError(kind, message, None)
+        # Lexeme of the end of text points after the last symbol
+        position = max(min(offset, len(text)), 0)
+        line_start = text.rfind("\n", 0, position) + 1
+        return AnalysisError(kind, message, offset, text.count("\n", 0, line_start) + 1, position - line_start + 1)
@@ -0,0 +1,134 @@
+from course_work.core.models.AbstractSyntaxTree2 import (
+    Node,
+    CompositeOperatorNode,
+    ConditionalOperatorNode,
+    ConditionalLoopOperatorNode,
+    FixedLoopOperatorNode,
+)
+
+
+# Basic block: straight-line sequence of elements, element is a simple operator (assignment, read, write),
+# an expression evaluated by control operator (condition of if/while, bound and step of for) or FixedLoopOperatorNode
+# itself standing for comparison of loop variable with bound
+class BasicBlock:
+    def __init__(self, index: int):
+        self.index = index
+        self.elements: list[Node] = []
+        self.successors: list["BasicBlock"] = []
+        self.predecessors: list["BasicBlock"] = []
+
+    def __repr__(self):
+        return f"BasicBlock({self.index}, elements={len(self.elements)}, " \
+               f"successors={[block.index for block in self.successors]})"
+
+
+# Control-flow graph of operator nodes
+class ControlFlowGraph:
+    def __init__(self):
+        self.blocks: list[BasicBlock] = []
+        self.entry = self.new_block()
+        self.exit = self.entry
+
+    @classmethod
+    def build(cls, operators: list[Node]) -> "ControlFlowGraph":
+        """
+        Build graph of operators sequence
+
+        :param operators: operator nodes, for example operators of ProgramNode
+        :return: ControlFlowGraph object
+        """
+        graph = cls()
+        graph.exit = graph.add_operators(operators, graph.entry)
+        return graph
+
+    def new_block(self) -> BasicBlock:
+        block = BasicBlock(len(self.blocks))
+        self.blocks.append(block)
+        return block
+
+    @staticmethod
+    def add_edge(source: BasicBlock, target: BasicBlock):
+        source.successors.append(target)
+        target.predecessors.append(source)
+
+    def add_operators(self, operators: list[Node], block: BasicBlock) -> BasicBlock:
+        for operator in operators:
+            block = self.add_operator(operator, block)
+        return block
+
+    def add_operator(self, node: Node | None, block: BasicBlock) -> BasicBlock:
+        """
+        Add operator to graph
+
+        :param node: operator node
+        :param block: block where control is before operator
+        :return: block where control is after operator
+        """
+        if node is None:
+            return block
+
+        if isinstance(node, CompositeOperatorNode):
+            return self.add_operators(node.children['operators'], block)
+
+        if isinstance(node, ConditionalOperatorNode):
+            block.elements.append(node.children['if'])
+            join = self.new_block()
+            for branch in (node.children['then'], node.children['else']):
+                if branch is None:
+                    self.add_edge(block, join)
+                    continue
+                branch_block = self.new_block()
+                self.add_edge(block, branch_block)
+                self.add_edge(self.add_operator(branch, branch_block), join)
+            return join
+
+        if isinstance(node, ConditionalLoopOperatorNode):
+            head = self.new_block()
+            self.add_edge(block, head)
+            head.elements.append(node.children['while'])
+            return self.add_loop(head, node.children['do'])
+
+        if isinstance(node, FixedLoopOperatorNode):
+            # Bound and step are evaluated before every iteration
+            block.elements.append(node.children['for'])
+            head = self.new_block()
+            self.add_edge(block, head)
+            head.elements.append(node)
+            head.elements.append(node.children['to'])
+            if node.children['step'] is not None:
+                head.elements.append(node.children['step'])
+            return self.add_loop(head, node.children['do'])
+
+        block.elements.append(node)
+        return block
+
+    def add_loop(self, head: BasicBlock, body: Node | None) -> BasicBlock:
+        body_block = self.new_block()
+        self.add_edge(head, body_block)
+        body_end = self.add_operator(body, body_block)
+        self.add_edge(body_end, head)
+        exit_block = self.new_block()
+        self.add_edge(head, exit_block)
+        return exit_block
+
+    def reverse_postorder(self) -> list[BasicBlock]:
+        """
+        Get blocks reachable from entry in reverse postorder
+
+        :return: list of blocks
+        """
+        order = []
+        visited = {self.entry.index}
+        stack = [(self.entry, iter(self.entry.successors))]
+        while stack:
+            block, successors = stack[-1]
+            for successor in successors:
+                if successor.index not in visited:
+                    visited.add(successor.index)
+                    stack.append((successor, iter(successor.successors)))
+                    break
+            else:
+                stack.pop()
+                order.append(block)
+        order.reverse()
+        return order
@@ -0,0 +1,139 @@
+from course_work.core.analysis.ControlFlowGraph import ControlFlowGraph
+from course_work.core.data.SymbolTable import SymbolTable
+from course_work.core.data.variables import Variable
+from course_work.core.models.AbstractSyntaxTree2 import (
+    ASTException,
+    Node,
+    AssignmentOperatorNode,
+    FactorNode,
+    FixedLoopOperatorNode,
+    ReadOperationNode,
+)
+from course_work.core.models.Visitor import child_nodes
+
+# State of analysis is a bit vector of definitely assigned slots: bit i is set if variable with slot i has value.
+# Unknown state (top of lattice) is -1, i.e. all bits set
+UNKNOWN = -1
+
+
+def collect_uses(node: Node, uses: list[FactorNode]) -> list[FactorNode]:
+    """
+    Collect factors reading variables in expression
+
+    :param node: expression node
+    :param uses: list to add factors to
+    :return: uses list
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, FactorNode) and isinstance(getattr(node, "value", None), Variable):
+            uses.append(node)
+        stack.extend(child_nodes(node))
+    return uses
+
+
+def element_effect(element: Node) -> tuple[list[FactorNode], int]:
+    """
+    Get variables read and assigned by block element
+
+    :param element: operator or expression node
+    :return: factors reading variables and bit vector of assigned slots
+    """
+    if isinstance(element, AssignmentOperatorNode):
+        uses = collect_uses(element.children['expression'], []) if element.children['expression'] else []
+        return uses, 1 << element.identifier_variable.slot
+    if isinstance(element, ReadOperationNode):
+        assigned = 0
+        for variable in element.children['values']:
+            assigned |= 1 << variable.slot
+        return [], assigned
+    if isinstance(element, FixedLoopOperatorNode):
+        # Loop variable is assigned by header assignment
+        return [], 0
+    return collect_uses(element, []), 0
+
+
+# Forward must-analysis of definitely assigned variables over control-flow graph
+class DefiniteAssignment:
+    def __init__(self, graph: ControlFlowGraph, entry_state: int = 0):
+        """
+        Initialize analysis
+
+        :param graph: control-flow graph
+        :param entry_state: bit vector of slots assigned before entry
+        """
+        self.graph = graph
+        self.entry_state = entry_state
+        self.effects = [[element_effect(element) for element in block.elements] for block in graph.blocks]
+        self.gen = [0] * len(graph.blocks)
+        for block in graph.blocks:
+            for _, assigned in self.effects[block.index]:
+                self.gen[block.index] |= assigned
+        self.states_in: list[int | None] = [None] * len(graph.blocks)
+        self.states_out: list[int | None] = [None] * len(graph.blocks)
+
+    def solve(self):
+        # Blocks are visited in reverse postorder, so states of acyclic parts are final after the first pass
+        # and every loop needs one more pass
+        order = self.graph.reverse_postorder()
+        changed = True
+        while changed:
+            changed = False
+            for block in order:
+                if block is self.graph.entry:
+                    state = self.entry_state
+                else:
+                    state = UNKNOWN
+                    for predecessor in block.predecessors:
+                        predecessor_state = self.states_out[predecessor.index]
+                        if predecessor_state is not None:
+                            state &= predecessor_state
+                if state != self.states_in[block.index]:
+                    self.states_in[block.index] = state
+                    self.states_out[block.index] = state | self.gen[block.index]
+                    changed = True
+
+    def violations(self) -> list[FactorNode]:
+        """
+        Get reads of variables which are not definitely assigned
+
+        :return: list of factors
+        """
+        result = []
+        for block in self.graph.blocks:
+            state = self.states_in[block.index]
+            if state is None:
+                continue
+            for uses, assigned in self.effects[block.index]:
+                for factor in uses:
+                    if not state >> factor.value.slot & 1:
+                        result.append(factor)
+                state |= assigned
+        return result
+
+    def exit_state(self) -> int:
+        state = self.states_out[self.graph.exit.index]
+        return self.entry_state if state is None else state
+
+
+def check_definite_assignment(operators: list[Node], symbols: SymbolTable, entry_state: int = 0) -> int:
+    """
+    Check that every variable is assigned on all paths before it is read
+
+    :param operators: operator nodes
+    :param symbols: symbol table, its initialization flags are set to state after operators
+    :param entry_state: bit vector of slots assigned before operators
+    :return: bit vector of slots definitely assigned after operators
+    """
+    analysis = DefiniteAssignment(ControlFlowGraph.build(operators), entry_state)
+    analysis.solve()
+    violations = analysis.violations()
+    if violations:
+        first = min(violations, key=lambda factor: factor.starting_lexeme.lexeme_pointer or 0)
+        raise ASTException("Переменная использована до инициализации!", first.starting_lexeme)
+
+    state = analysis.exit_state()
+    for slot in range(len(symbols)):
+        symbols.initialized[slot] = state >> slot & 1
+    return state
@@ -0,0 +1,75 @@
+from course_work.core.analysis.ControlFlowGraph import ControlFlowGraph
+from course_work.core.analysis.DefiniteAssignment import collect_uses
+from course_work.core.models.AbstractSyntaxTree2 import (
+    Node,
+    AssignmentOperatorNode,
+    FixedLoopOperatorNode,
+    ReadOperationNode,
+)
+
+
+def uses_mask(node: Node | None) -> int:
+    mask = 0
+    if node is not None:
+        for factor in collect_uses(node, []):
+            mask |= 1 << factor.value.slot
+    return mask
+
+
+def element_liveness(element: Node) -> tuple[int, int]:
+    """
+    Get variables read and assigned by block element
+
+    :param element: operator or expression node
+    :return: bit vectors of read and assigned slots
+    """
+    if isinstance(element, AssignmentOperatorNode):
+        return uses_mask(element.children['expression']), 1 << element.identifier_variable.slot
+    if isinstance(element, ReadOperationNode):
+        assigned = 0
+        for variable in element.children['values']:
+            assigned |= 1 << variable.slot
+        return 0, assigned
+    if isinstance(element, FixedLoopOperatorNode):
+        # Loop variable is compared with bound and incremented
+        return 1 << element.children['for'].identifier_variable.slot, 0
+    return uses_mask(element), 0
+
+
+# Backward may-analysis of live variables over control-flow graph, variable is live if its value can be read later
+class Liveness:
+    def __init__(self, graph: ControlFlowGraph):
+        """
+        Initialize analysis
+
+        :param graph: control-flow graph
+        """
+        self.graph = graph
+        self.effects = [[element_liveness(element) for element in block.elements] for block in graph.blocks]
+        self.used = [0] * len(graph.blocks)         # slots read in block before assignment
+        self.assigned = [0] * len(graph.blocks)
+        for block in graph.blocks:
+            used = assigned = 0
+            for element_used, element_assigned in self.effects[block.index]:
+                used |= element_used & ~assigned
+                assigned |= element_assigned
+            self.used[block.index] = used
+            self.assigned[block.index] = assigned
+        self.live_in = [0] * len(graph.blocks)
+        self.live_out = [0] * len(graph.blocks)
+
+    def solve(self):
+        order = self.graph.reverse_postorder()
+        order.reverse()
+        changed = True
+        while changed:
+            changed = False
+            for block in order:
+                live_out = 0
+                for successor in block.successors:
+                    live_out |= self.live_in[successor.index]
+                live_in = self.used[block.index] | (live_out & ~self.assigned[block.index])
+                if live_in != self.live_in[block.index] or live_out != self.live_out[block.index]:
+                    self.live_in[block.index] = live_in
+                    self.live_out[block.index] = live_out
+                    changed = True
@@ -1,31 +1,81 @@
+from dataclasses import dataclass, field
+
 from course_work.core.data.lexemes import (
     LexemeType,
     LexemeTableType,
 )
 
-# Class of lexical table
+
+def index_strings(strings: tuple[str, ...]) -> dict[str, int]:
+    indices = {}
+    for i, string in enumerate(strings):
+        indices.setdefault(string, i)
+    return indices
+
+
+# Keywords and limiters of language. They are the same for every program, so one object is shared by all analyses,
+# indices are never changed after creation
+@dataclass(frozen=True)
+class ReservedWords:
+    keywords: tuple[str, ...]
+    limiters: tuple[str, ...]
+    keyword_indices: dict[str, int] = field(init=False, repr=False, compare=False)
+    limiter_indices: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "keywords", tuple(self.keywords))
+        object.__setattr__(self, "limiters", tuple(self.limiters))
+        object.__setattr__(self, "keyword_indices", index_strings(self.keywords))
+        object.__setattr__(self, "limiter_indices", index_strings(self.limiters))
+
+
+# Keywords and limiters of the language in order of LexemeType
+RESERVED_WORDS = ReservedWords(
+    keywords=("true", "false", "program", "var", "end", "begin", "int", "float", "bool", "if", "else", "for", "to",
+              "step", "next", "while", "readln", "writeln"),
+    limiters=("!=", "==", "<", "<=", ">", ">=", "+", "-", "||", "*", "/", "&&", ",", "!", ";", "(", ")", "[", "]", "{",
+              "}", ":=", "@"),
+)
+
+
+# Class of lexical table: shared reserved words and numbers and identifiers of one analyzed program
 class LexicalTable:
-    keywords: list[str]
-    limiters: list[str]
     numbers: list[str]
     identifiers: list[str]
 
-    def __init__(self, table: dict[str, list[str]]):
+    def __init__(self, table: ReservedWords | dict[str, list[str]]):
         """
         Initialize lexical table
 
-        :param table: lexical table dict with 4 keys: keywords, limiters, numbers, identifiers
+        :param table: reserved words, or lexical table dict with 4 keys: keywords, limiters, numbers, identifiers.
+        Lists of dict are copied, so table does not change them
         """
+        self.numbers = []
+        self.identifiers = []
+        self.number_indices: dict[str, int] = {}
+        self.identifier_indices: dict[str, int] = {}
+        if isinstance(table, ReservedWords):
+            self.reserved = table
+            return
 
         # Trying to parse lexical table file, raise exception if can not
         try:
-            self.keywords = table['keywords']
-            self.limiters = table['limiters']
-            self.numbers = table['numbers']
-            self.identifiers = table['identifiers']
+            self.reserved = ReservedWords(table['keywords'], table['limiters'])
+            for number in table['numbers']:
+                self.add_number(number)
+            for identifier in table['identifiers']:
+                self.add_identifier(identifier)
         except Exception as e:
             raise Exception("Wrong lexical table format")
 
+    @property
+    def keywords(self) -> tuple[str, ...]:
+        return self.reserved.keywords
+
+    @property
+    def limiters(self) -> tuple[str, ...]:
+        return self.reserved.limiters
+
     def check_identifier_is_keyword(self, identifier: str) -> bool:
         """
         Check if identifier is keyword
@@ -33,7 +83,7 @@ class LexicalTable:
         :param identifier: identifier string
         :return: if identifier is keyword
         """
-        return identifier in self.keywords
+        return identifier in self.reserved.keyword_indices
 
     def add_identifier(self, identifier: str):
         """
@@ -41,7 +91,8 @@ class LexicalTable:
 
         :param identifier: new identifier to add
         """
-        if identifier not in self.identifiers:
+        if identifier not in self.identifier_indices:
+            self.identifier_indices[identifier] = len(self.identifiers)
             self.identifiers.append(identifier)
 
     def add_number(self, number: str):
@@ -50,9 +101,18 @@ class LexicalTable:
 
         :param number: new number to add
         """
-        if number not in self.numbers:
+        if number not in self.number_indices:
+            self.number_indices[number] = len(self.numbers)
             self.numbers.append(number)
 
+    def clear_numbers(self):
+        """
+        Remove numbers from lexical table. Lexemes already read keep their values, so numbers can be released when
+        lexemes referring to them are converted
+        """
+        self.numbers.clear()
+        self.number_indices.clear()
+
     def get_lexeme_tuple(self, lexeme_string: str, pointer: int) -> tuple[int, int, int]:
         """
         Get lexeme tuple by lexeme string
@@ -63,18 +123,18 @@ class LexicalTable:
         """
         lexeme_table_number: int = 1
         lexeme_number: int = 0
-        if lexeme_string in self.keywords:
+        if lexeme_string in self.reserved.keyword_indices:
             lexeme_table_number = 1
-            lexeme_number = self.keywords.index(lexeme_string)
-        elif lexeme_string in self.limiters:
+            lexeme_number = self.reserved.keyword_indices[lexeme_string]
+        elif lexeme_string in self.reserved.limiter_indices:
             lexeme_table_number = 2
-            lexeme_number = self.limiters.index(lexeme_string)
-        elif lexeme_string in self.numbers:
+            lexeme_number = self.reserved.limiter_indices[lexeme_string]
+        elif lexeme_string in self.number_indices:
             lexeme_table_number = 3
-            lexeme_number = self.numbers.index(lexeme_string)
-        elif lexeme_string in self.identifiers:
+            lexeme_number = self.number_indices[lexeme_string]
+        elif lexeme_string in self.identifier_indices:
             lexeme_table_number = 4
-            lexeme_number = self.identifiers.index(lexeme_string)
+            lexeme_number = self.identifier_indices[lexeme_string]
 
         return lexeme_table_number, lexeme_number, pointer
 
@@ -0,0 +1,144 @@
+from dataclasses import dataclass, field
+
+from course_work.core.data.variables import Variable, VariableType
+
+
+# Definition and use sites of one variable, in source order. Sites are not linked: which definitions reach a use
+# depends on control flow, see analyses over ControlFlowGraph
+@dataclass
+class VariableSites:
+    variable: Variable
+    declaration: int | None                             # pointer of declaration
+    definitions: list[int] = field(default_factory=list)  # pointers of assignments and reads, in source order
+    uses: list[int] = field(default_factory=list)         # pointers of reads of value, in source order
+
+
+# Class of symbol table: declared variables with dense slot indices and their definition and use sites
+class SymbolTable:
+    def __init__(self):
+        self.variables: list[Variable] = []             # slot -> variable
+        self.slots: dict[str, int] = {}                 # name -> slot
+        self.declarations: list[int | None] = []        # slot -> pointer of declaration
+        self.definitions: list[list[int]] = []          # slot -> pointers of definitions
+        self.uses: list[list[int]] = []                 # slot -> pointers of uses
+        self.initialized = bytearray()                  # slot -> 1 if variable has value
+        self.sites: dict[int, int] = {}                 # pointer of any site -> slot
+        self.temporaries = 0
+        # If false, definitions and uses are not recorded, memory of table depends only on number of variables
+        self.record_sites = True
+
+    def __len__(self) -> int:
+        return len(self.variables)
+
+    def __contains__(self, variable_name: str) -> bool:
+        return variable_name in self.slots
+
+    def declare(self, variable_name: str, variable_type: VariableType, pointer: int | None = None) -> Variable:
+        """
+        Add variable to table and assign next slot to it
+
+        :param variable_name: name of variable
+        :param variable_type: type of variable
+        :param pointer: pointer of declaration lexeme
+        :return: declared variable
+        """
+        slot = len(self.variables)
+        variable = Variable(variable_name=variable_name, variable_type=variable_type, slot=slot)
+        self.variables.append(variable)
+        self.slots[variable_name] = slot
+        self.declarations.append(pointer)
+        self.definitions.append([])
+        self.uses.append([])
+        self.initialized.append(0)
+        if pointer is not None:
+            self.sites[pointer] = slot
+        return variable
+
+    def declare_temporary(self, variable_type: VariableType) -> Variable:
+        """
+        Add variable created by optimization, its name can not clash with identifiers
+
+        :param variable_type: type of variable
+        :return: declared variable
+        """
+        self.temporaries += 1
+        return self.declare(f"${self.temporaries}", variable_type)
+
+    def lookup(self, variable_name: str) -> Variable | None:
+        """
+        Get variable by name
+
+        :param variable_name: name of variable
+        :return: variable or None if it is not declared
+        """
+        slot = self.slots.get(variable_name)
+        return None if slot is None else self.variables[slot]
+
+    def get(self, variable_name: str) -> Variable:
+        return self.variables[self.slots[variable_name]]
+
+    def add_definition(self, slot: int, pointer: int | None):
+        """
+        Record site where variable gets value (assignment or read)
+
+        :param slot: slot of variable
+        :param pointer: pointer of identifier lexeme
+        """
+        if pointer is not None and self.record_sites:
+            self.definitions[slot].append(pointer)
+            self.sites[pointer] = slot
+
+    def add_use(self, slot: int, pointer: int | None):
+        """
+        Record site where value of variable is used
+
+        :param slot: slot of variable
+        :param pointer: pointer of identifier lexeme
+        """
+        if pointer is not None and self.record_sites:
+            self.uses[slot].append(pointer)
+            self.sites[pointer] = slot
+
+    def set_initialized(self, slot: int):
+        self.initialized[slot] = 1
+
+    def is_initialized(self, slot: int) -> bool:
+        return self.initialized[slot] == 1
+
+    def symbol_at(self, pointer: int) -> Variable | None:
+        """
+        Get variable which declaration, definition or use starts at pointer
+
+        :param pointer: pointer of identifier lexeme
+        :return: variable or None if there is no variable at pointer
+        """
+        slot = self.sites.get(pointer)
+        return None if slot is None else self.variables[slot]
+
+    def references(self, slot: int) -> list[int]:
+        """
+        Get all sites of variable: declaration, definitions and uses
+
+        :param slot: slot of variable
+        :return: sorted pointers of sites
+        """
+        declaration = self.declarations[slot]
+        return sorted(
+            ([] if declaration is None else [declaration]) + self.definitions[slot] + self.uses[slot]
+        )
+
+    def variable_sites(self, slot: int) -> VariableSites:
+        return VariableSites(
+            variable=self.variables[slot],
+            declaration=self.declarations[slot],
+            definitions=sorted(self.definitions[slot]),
+            uses=sorted(self.uses[slot]),
+        )
+
+    def all_variable_sites(self) -> list[VariableSites]:
+        """
+        Get definition and use sites of all variables
+
+        :return: list of sites, index is slot of variable
+        """
+        return [self.variable_sites(slot) for slot in range(len(self.variables))]
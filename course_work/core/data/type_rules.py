@@ -0,0 +1,87 @@
+from course_work.core.data.lexemes import LexemeType
+from course_work.core.data.LexicalTable import RESERVED_WORDS
+from course_work.core.data.variables import VariableType
+
+# Types of operands. Value of "==" and "!=" has no type, it is None
+OPERAND_TYPES = (VariableType.TYPE_INT, VariableType.TYPE_FLOAT, VariableType.TYPE_BOOL, None)
+TYPES_COUNT = len(OPERAND_TYPES)
+OPERATIONS_COUNT = len(LexemeType)
+
+# Result type is the type of the first operand
+FIRST = "first"
+
+NUMERIC = (VariableType.TYPE_INT, VariableType.TYPE_FLOAT)
+LOGICAL = (VariableType.TYPE_BOOL,)
+
+# Typing rules of binary operations: operation -> (types of first operand, types of second operand, result type).
+# Operands of operations without rules only must have the same type, their result has no type
+OPERATION_RULES = {
+    LexemeType.LIM_LT: (NUMERIC, NUMERIC, VariableType.TYPE_BOOL),
+    LexemeType.LIM_LTE: (NUMERIC, NUMERIC, VariableType.TYPE_BOOL),
+    LexemeType.LIM_GT: (NUMERIC, NUMERIC, VariableType.TYPE_BOOL),
+    LexemeType.LIM_GTE: (NUMERIC, NUMERIC, VariableType.TYPE_BOOL),
+    LexemeType.LIM_PLUS: (NUMERIC, NUMERIC, FIRST),
+    LexemeType.LIM_MINUS: (NUMERIC, NUMERIC, FIRST),
+    LexemeType.LIM_OR: (LOGICAL, LOGICAL, VariableType.TYPE_BOOL),
+    LexemeType.LIM_MUL: (NUMERIC, NUMERIC, FIRST),
+    LexemeType.LIM_DIV: (NUMERIC, NUMERIC, FIRST),
+    LexemeType.LIM_AND: (LOGICAL, LOGICAL, VariableType.TYPE_BOOL),
+}
+
+
+def compile_rule(operation: LexemeType,
+                 first_type: VariableType | None,
+                 second_type: VariableType | None,
+                 ) -> tuple[VariableType | None, str | None]:
+    """
+    Get result of operation and error of operand types
+
+    :param operation: type of operation lexeme
+    :param first_type: type of the first operand
+    :param second_type: type of the second operand
+    :return: result type and error message, None if operand types are correct
+    """
+    rule = OPERATION_RULES.get(operation)
+    if rule is None:
+        result = None
+    else:
+        result = first_type if rule[2] == FIRST else rule[2]
+    if first_type != second_type:
+        return result, "Типы операндов должны совпадать"
+    if rule is None:
+        return result, None
+    value = RESERVED_WORDS.limiters[operation.value - len(RESERVED_WORDS.keywords)]
+    if first_type not in rule[0]:
+        return result, (f"Операция \"{value}\" поддерживает для первого операнда только типы: "
+                        f"{', '.join(t.value for t in rule[0])}")
+    if second_type not in rule[1]:
+        return result, (f"Операция \"{value}\" поддерживает для второго операнда только типы: "
+                        f"{', '.join(t.value for t in rule[1])}")
+    return result, None
+
+
+# Matrix of typing rules of all operations and operand types, it is built once:
+# index (operation * TYPES_COUNT + index of first type) * TYPES_COUNT + index of second type -> (result type, error)
+TYPE_RULES: tuple[tuple[VariableType | None, str | None], ...] = tuple(
+    compile_rule(operation, first_type, second_type)
+    for operation in LexemeType
+    for first_type in OPERAND_TYPES
+    for second_type in OPERAND_TYPES
+)
+
+
+def operation_rule(operation: int,
+                   first_type: VariableType | None,
+                   second_type: VariableType | None,
+                   ) -> tuple[VariableType | None, str | None]:
+    """
+    Get typing rule of operation
+
+    :param operation: integer code of operation lexeme type
+    :param first_type: type of the first operand
+    :param second_type: type of the second operand
+    :return: result type and error message, None if operand types are correct
+    """
+    return TYPE_RULES[
+        (operation * TYPES_COUNT + OPERAND_TYPES.index(first_type)) * TYPES_COUNT + OPERAND_TYPES.index(second_type)
+    ]
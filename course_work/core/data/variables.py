@@ -14,3 +14,4 @@ class VariableType(Enum):
 class Variable:
     variable_name: str
     variable_type: VariableType
+    slot: int = -1          # index in symbol table, -1 for variables outside of it
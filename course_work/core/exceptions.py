@@ -0,0 +1,49 @@
+from course_work.core.data.lexemes import Lexeme
+
+
+# Base of all errors of program analysis and execution. Modules of analyzers re-export their exceptions, so
+# catching AnalysisException or one of its subclasses works whichever module it is imported from
+class AnalysisException(Exception):
+    kind = "analysis"
+
+    def __init__(self, message: str, lexeme: Lexeme | None = None, *args):
+        self.lexeme = lexeme
+        self.message = message
+        self.pointer: int | None = lexeme.lexeme_pointer if lexeme is not None else None   # position in text
+        super().__init__(self.message, *args)
+
+
+class FiniteStateMachineException(AnalysisException):
+    kind = "lexical"
+
+    def __init__(self, message: str, pointer: int = 0, *args):
+        super().__init__(message, None, *args)
+        self.pointer = pointer
+
+
+class SyntaxException(AnalysisException):
+    kind = "syntax"
+
+
+class ASTException(AnalysisException):
+    kind = "semantic"
+
+
+class RuntimeException(AnalysisException):
+    kind = "runtime"
+
+
+class IRException(AnalysisException):
+    kind = "ir"
+
+
+class ASTSerializerException(AnalysisException):
+    kind = "serialization"
+
+
+class PipelineException(AnalysisException):
+    kind = "pipeline"
+
+
+class GrammarException(AnalysisException):
+    kind = "grammar"
@@ -0,0 +1,48 @@
+from course_work.core.ir.IntermediateRepresentation import Function, OP_COPY, OP_PHI
+
+
+# Pass replacing uses of copies and trivial phis with their sources
+class CopyPropagation:
+    name = "copy-propagation"
+
+    def run(self, function: Function) -> int:
+        """
+        Run pass
+
+        :param function: IR function, it is changed in place
+        :return: number of removed instructions
+        """
+        replacements: dict[int, int] = {}
+
+        def resolve(register: int) -> int:
+            while register in replacements:
+                register = replacements[register]
+            return register
+
+        removed = set()
+        changed = True
+        while changed:
+            changed = False
+            for block in function.blocks:
+                for index in block.instructions:
+                    if index in removed:
+                        continue
+                    opcode = function.opcodes[index]
+                    result = function.results[index]
+                    if opcode == OP_COPY:
+                        # Source of copy dominates it, so it dominates all uses of copy
+                        replacements[result] = resolve(function.first[index])
+                    elif opcode == OP_PHI:
+                        # Phi which operands are one register and phi itself
+                        operands = {resolve(register) for register in function.operands(index)} - {result}
+                        if len(operands) != 1:
+                            continue
+                        replacements[result] = operands.pop()
+                    else:
+                        continue
+                    removed.add(index)
+                    changed = True
+
+        function.replace_operands(replacements)
+        function.remove_instructions(removed)
+        return len(removed)
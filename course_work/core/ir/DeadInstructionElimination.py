@@ -0,0 +1,48 @@
+from course_work.core.ir.IntermediateRepresentation import (
+    Function,
+    OP_CONST,
+    OP_DIV,
+    OP_PHI,
+    PURE_OPCODES,
+)
+
+
+# Pass removing instructions which results are never used. Division is kept unless divisor is a non-zero constant,
+# because it can stop program with error.
+class DeadInstructionElimination:
+    name = "dce"
+
+    def run(self, function: Function) -> int:
+        """
+        Run pass
+
+        :param function: IR function, it is changed in place
+        :return: number of removed instructions
+        """
+        live = set()
+        worklist = []
+        for block in function.blocks:
+            for index in block.instructions:
+                if not self.is_removable(function, index):
+                    live.add(index)
+                    worklist.append(index)
+
+        while worklist:
+            index = worklist.pop()
+            for register in function.operands(index):
+                definition = function.definitions[register]
+                if definition >= 0 and definition not in live:
+                    live.add(definition)
+                    worklist.append(definition)
+
+        removed = {index for block in function.blocks for index in block.instructions if index not in live}
+        function.remove_instructions(removed)
+        return len(removed)
+
+    @staticmethod
+    def is_removable(function: Function, index: int) -> bool:
+        opcode = function.opcodes[index]
+        if opcode == OP_DIV:
+            divisor = function.definitions[function.second[index]]
+            return function.opcodes[divisor] == OP_CONST and function.constants[function.first[divisor]] != 0
+        return opcode in PURE_OPCODES or opcode == OP_PHI
@@ -0,0 +1,99 @@
+from course_work.core.ir.IntermediateRepresentation import Function
+
+
+def reverse_postorder(function: Function) -> list[int]:
+    """
+    Get blocks reachable from entry in reverse postorder
+
+    :param function: IR function
+    :return: list of block indices
+    """
+    order = []
+    visited = {function.entry}
+    stack = [(function.entry, iter(function.successors(function.entry)))]
+    while stack:
+        block, successors = stack[-1]
+        for successor in successors:
+            if successor not in visited:
+                visited.add(successor)
+                stack.append((successor, iter(function.successors(successor))))
+                break
+        else:
+            stack.pop()
+            order.append(block)
+    order.reverse()
+    return order
+
+
+# Dominator tree of blocks, iterative algorithm of Cooper, Harvey and Kennedy
+class DominatorTree:
+    def __init__(self, function: Function):
+        self.function = function
+        self.order = reverse_postorder(function)
+        self.positions = {block: position for position, block in enumerate(self.order)}
+        self.idom: list[int] = [-1] * len(function.blocks)      # immediate dominator, -1 for entry and unreachable
+        self.children: list[list[int]] = [[] for _ in function.blocks]
+        self.solve()
+
+    def solve(self):
+        entry = self.function.entry
+        positions = self.positions
+        idom = {entry: entry}
+        changed = True
+        while changed:
+            changed = False
+            for block in self.order[1:]:
+                new_idom = None
+                for predecessor in self.function.blocks[block].predecessors:
+                    if predecessor not in idom:
+                        continue
+                    if new_idom is None:
+                        new_idom = predecessor
+                        continue
+                    # Intersection of dominator paths
+                    first, second = predecessor, new_idom
+                    while first != second:
+                        while positions[first] > positions[second]:
+                            first = idom[first]
+                        while positions[second] > positions[first]:
+                            second = idom[second]
+                    new_idom = first
+                if idom.get(block) != new_idom:
+                    idom[block] = new_idom
+                    changed = True
+
+        for block, dominator in idom.items():
+            if block != entry:
+                self.idom[block] = dominator
+                self.children[dominator].append(block)
+
+    def is_reachable(self, block: int) -> bool:
+        return block in self.positions
+
+    def dominates(self, first: int, second: int) -> bool:
+        """
+        Check if every path from entry to second block goes through first block
+
+        :param first: index of block
+        :param second: index of block
+        :return: True if first dominates second
+        """
+        while second != first:
+            if second == self.function.entry or second < 0:
+                return False
+            second = self.idom[second]
+        return True
+
+    def preorder(self) -> list[int]:
+        """
+        Get reachable blocks in preorder of dominator tree, dominators go before dominated blocks
+
+        :return: list of block indices
+        """
+        order = []
+        stack = [self.function.entry]
+        while stack:
+            block = stack.pop()
+            order.append(block)
+            stack.extend(reversed(self.children[block]))
+        return order
@@ -0,0 +1,156 @@
+from typing import Callable, Iterable
+
+from course_work.core.data.lexemes import LexemeType
+from course_work.core.data.variables import Variable
+from course_work.core.ir.IntermediateRepresentation import (
+    Function,
+    OP_CONST,
+    OP_UNDEF,
+    OP_COPY,
+    OP_PHI,
+    OP_READ,
+    OP_WRITE,
+    OP_NOT,
+    OP_ADD,
+    OP_SUB,
+    OP_MUL,
+    OP_DIV,
+    OP_AND,
+    OP_OR,
+    OP_EQ,
+    OP_NE,
+    OP_LT,
+    OP_LE,
+    OP_GT,
+    OP_GE,
+    OP_JUMP,
+    OP_BRANCH,
+    OP_RETURN,
+)
+from course_work.core.runtime.values import (
+    RuntimeException,
+    BINARY_OPERATIONS,
+    format_value,
+    parse_value,
+)
+
+# Operations of binary opcodes, same as operations of tree interpreter
+BINARY_FUNCTIONS = {
+    OP_ADD: BINARY_OPERATIONS[LexemeType.LIM_PLUS],
+    OP_SUB: BINARY_OPERATIONS[LexemeType.LIM_MINUS],
+    OP_MUL: BINARY_OPERATIONS[LexemeType.LIM_MUL],
+    OP_DIV: BINARY_OPERATIONS[LexemeType.LIM_DIV],
+    OP_AND: BINARY_OPERATIONS[LexemeType.LIM_AND],
+    OP_OR: BINARY_OPERATIONS[LexemeType.LIM_OR],
+    OP_EQ: BINARY_OPERATIONS[LexemeType.LIM_EQ],
+    OP_NE: BINARY_OPERATIONS[LexemeType.LIM_NE],
+    OP_LT: BINARY_OPERATIONS[LexemeType.LIM_LT],
+    OP_LE: BINARY_OPERATIONS[LexemeType.LIM_LTE],
+    OP_GT: BINARY_OPERATIONS[LexemeType.LIM_GT],
+    OP_GE: BINARY_OPERATIONS[LexemeType.LIM_GTE],
+}
+
+
+# Execution backend of IR function
+class Executor:
+    def __init__(self, function: Function, inputs: Iterable[str] | Callable[[Variable], str | None] = ()):
+        """
+        Initialize executor
+
+        :param function: IR function
+        :param inputs: tokens read by readln, one token per variable, or function returning token for variable
+        """
+        self.function = function
+        if callable(inputs):
+            self.read_token = inputs
+        else:
+            tokens = iter(inputs)
+            self.read_token = lambda variable: next(tokens, None)
+        self.registers: list = []
+        self.output: list[str] = []
+
+    def run(self) -> list[str]:
+        """
+        Execute function
+
+        :return: lines written by writeln
+        :raise RuntimeException: on runtime error
+        """
+        function = self.function
+        opcodes, results = function.opcodes, function.results
+        first, second, third = function.first, function.second, function.third
+        arguments, constants = function.arguments, function.constants
+        registers = self.registers = [None] * len(function.register_types)
+        self.output = []
+        blocks = [block.instructions for block in function.blocks]
+        # Position of every predecessor in list of block predecessors, it selects operands of phis
+        positions = [{predecessor: i for i, predecessor in enumerate(block.predecessors)}
+                     for block in function.blocks]
+
+        previous = -1
+        block = function.entry
+        while True:
+            instructions = blocks[block]
+            start = 0
+            if previous >= 0:
+                # Phis are evaluated simultaneously
+                position = positions[block][previous]
+                values = []
+                while opcodes[instructions[start]] == OP_PHI:
+                    values.append(registers[arguments[second[instructions[start]] + position]])
+                    start += 1
+                for i in range(start):
+                    registers[results[instructions[i]]] = values[i]
+
+            for i in range(start, len(instructions)):
+                index = instructions[i]
+                opcode = opcodes[index]
+                if opcode in BINARY_FUNCTIONS:
+                    try:
+                        registers[results[index]] = BINARY_FUNCTIONS[opcode](registers[first[index]],
+                                                                             registers[second[index]])
+                    except ZeroDivisionError:
+                        raise RuntimeException("Деление на ноль!", function.lexemes[index])
+                elif opcode == OP_COPY:
+                    registers[results[index]] = registers[first[index]]
+                elif opcode == OP_CONST:
+                    registers[results[index]] = constants[first[index]]
+                elif opcode == OP_NOT:
+                    registers[results[index]] = not registers[first[index]]
+                elif opcode == OP_READ:
+                    registers[results[index]] = self.read(function.variables[first[index]], index)
+                elif opcode == OP_WRITE:
+                    offset = second[index]
+                    self.output.append(" ".join(format_value(registers[register])
+                                                for register in arguments[offset:offset + third[index]]))
+                elif opcode == OP_UNDEF:
+                    registers[results[index]] = None
+                elif opcode == OP_JUMP:
+                    previous, block = block, first[index]
+                elif opcode == OP_BRANCH:
+                    previous, block = block, second[index] if registers[first[index]] else third[index]
+                elif opcode == OP_RETURN:
+                    return self.output
+
+    def read(self, variable: Variable, index: int):
+        text = self.read_token(variable)
+        if text is None:
+            raise RuntimeException("Недостаточно входных данных для readln!", self.function.lexemes[index])
+        try:
+            return parse_value(text, variable.variable_type)
+        except ValueError:
+            raise RuntimeException(
+                f"Значение \"{text}\" не является значением типа \"{variable.variable_type.value}\"!",
+                self.function.lexemes[index],
+            )
+
+
+def execute(function: Function, inputs: Iterable[str] | Callable[[Variable], str | None] = ()) -> list[str]:
+    """
+    Execute IR function
+
+    :param function: IR function
+    :param inputs: tokens read by readln or function returning token for variable
+    :return: lines written by writeln
+    """
+    return Executor(function, inputs).run()
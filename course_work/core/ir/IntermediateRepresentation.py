@@ -0,0 +1,394 @@
+from array import array
+
+from course_work.core.data.lexemes import Lexeme, LexemeType
+from course_work.core.data.variables import Variable, VariableType
+from course_work.core.exceptions import IRException
+from course_work.core.runtime.values import format_value
+
+# Opcodes of instructions
+OP_NOP = 0          # removed instruction
+OP_CONST = 1        # result := constants[first]
+OP_UNDEF = 2        # result := value of variable before initialization
+OP_COPY = 3         # result := first
+OP_PHI = 4          # result := arguments[second + i] when control comes from i-th predecessor
+OP_READ = 5         # result := value read by readln for variables[first]
+OP_WRITE = 6        # writeln arguments[second : second + third]
+OP_NOT = 7
+OP_ADD = 8
+OP_SUB = 9
+OP_MUL = 10
+OP_DIV = 11
+OP_AND = 12
+OP_OR = 13
+OP_EQ = 14
+OP_NE = 15
+OP_LT = 16
+OP_LE = 17
+OP_GT = 18
+OP_GE = 19
+OP_JUMP = 20        # go to block first
+OP_BRANCH = 21      # go to block second if first is true, else to block third
+OP_RETURN = 22
+
+OPCODE_NAMES = [
+    "nop", "const", "undef", "copy", "phi", "read", "write", "not", "add", "sub", "mul", "div", "and", "or",
+    "eq", "ne", "lt", "le", "gt", "ge", "jump", "branch", "return",
+]
+
+# Opcodes of binary operations by lexeme type of operation
+BINARY_OPCODES = {
+    LexemeType.LIM_NE: OP_NE,
+    LexemeType.LIM_EQ: OP_EQ,
+    LexemeType.LIM_LT: OP_LT,
+    LexemeType.LIM_LTE: OP_LE,
+    LexemeType.LIM_GT: OP_GT,
+    LexemeType.LIM_GTE: OP_GE,
+    LexemeType.LIM_PLUS: OP_ADD,
+    LexemeType.LIM_MINUS: OP_SUB,
+    LexemeType.LIM_OR: OP_OR,
+    LexemeType.LIM_MUL: OP_MUL,
+    LexemeType.LIM_DIV: OP_DIV,
+    LexemeType.LIM_AND: OP_AND,
+}
+
+ARITHMETIC_OPCODES = frozenset({OP_ADD, OP_SUB, OP_MUL, OP_DIV})
+LOGICAL_OPCODES = frozenset({OP_AND, OP_OR})
+COMPARISON_OPCODES = frozenset({OP_EQ, OP_NE, OP_LT, OP_LE, OP_GT, OP_GE})
+BINARY_OPCODE_SET = ARITHMETIC_OPCODES | LOGICAL_OPCODES | COMPARISON_OPCODES
+COMMUTATIVE_OPCODES = frozenset({OP_ADD, OP_MUL, OP_AND, OP_OR, OP_EQ, OP_NE})
+TERMINATOR_OPCODES = frozenset({OP_JUMP, OP_BRANCH, OP_RETURN})
+# Instructions which results depend only on operands
+PURE_OPCODES = frozenset({OP_CONST, OP_UNDEF, OP_COPY, OP_NOT}) | BINARY_OPCODE_SET
+
+# Codes of register types
+TYPE_NONE = -1
+TYPE_INT = 0
+TYPE_FLOAT = 1
+TYPE_BOOL = 2
+
+TYPE_CODES = {
+    VariableType.TYPE_INT: TYPE_INT,
+    VariableType.TYPE_FLOAT: TYPE_FLOAT,
+    VariableType.TYPE_BOOL: TYPE_BOOL,
+}
+TYPE_NAMES = ["int", "float", "bool"]
+
+
+# Basic block of function: indices of instructions, phis first and terminator last
+class Block:
+    def __init__(self, index: int):
+        self.index = index
+        self.instructions = array('i')
+        self.predecessors: list[int] = []       # order of predecessors is order of phi arguments
+
+    def __repr__(self):
+        return f"Block({self.index}, instructions={len(self.instructions)}, predecessors={self.predecessors})"
+
+
+# Function in three-address code, SSA form: every register is assigned by exactly one instruction.
+# Instructions are stored in parallel arrays, instruction is an index in them.
+class Function:
+    def __init__(self, variables: list[Variable]):
+        """
+        Initialize empty function
+
+        :param variables: variables of symbol table, slot is index
+        """
+        self.variables = variables
+        self.blocks: list[Block] = []
+        self.entry = 0
+
+        # Instructions
+        self.opcodes = array('B')
+        self.results = array('i')               # register assigned by instruction or -1
+        self.first = array('i')
+        self.second = array('i')
+        self.third = array('i')
+        self.lexemes: list[Lexeme | None] = []  # source lexeme for error messages and line numbers
+
+        # Operand lists of phi and write instructions
+        self.arguments = array('i')
+
+        # Registers
+        self.register_types = array('b')
+        self.register_names: list[str] = []     # variable name and version, empty for temporaries
+        self.definitions = array('i')           # register -> instruction assigning it
+
+        # Constant pool
+        self.constants: list = []
+        self.constant_indices: dict[tuple[int, str], int] = {}
+
+    def __len__(self) -> int:
+        return sum(len(block.instructions) for block in self.blocks)
+
+    # Building
+    def new_block(self) -> int:
+        self.blocks.append(Block(len(self.blocks)))
+        return len(self.blocks) - 1
+
+    def new_register(self, type_code: int, name: str = "") -> int:
+        self.register_types.append(type_code)
+        self.register_names.append(name)
+        self.definitions.append(-1)
+        return len(self.register_types) - 1
+
+    def add_edge(self, source: int, target: int):
+        self.blocks[target].predecessors.append(source)
+
+    def constant(self, type_code: int, value) -> int:
+        """
+        Get index of constant in pool, equal constants share index
+
+        :param type_code: code of constant type
+        :param value: runtime value
+        :return: index in pool
+        """
+        key = (type_code, repr(value))
+        index = self.constant_indices.get(key)
+        if index is None:
+            index = self.constant_indices[key] = len(self.constants)
+            self.constants.append(value)
+        return index
+
+    def add_instruction(self, opcode: int, result: int = -1, first: int = -1, second: int = -1, third: int = -1,
+                        lexeme: Lexeme | None = None) -> int:
+        """
+        Add instruction to storage without placing it in block
+
+        :return: index of instruction
+        """
+        index = len(self.opcodes)
+        self.opcodes.append(opcode)
+        self.results.append(result)
+        self.first.append(first)
+        self.second.append(second)
+        self.third.append(third)
+        self.lexemes.append(lexeme)
+        if result >= 0:
+            self.definitions[result] = index
+        return index
+
+    def emit(self, block: int, opcode: int, type_code: int = TYPE_NONE, first: int = -1, second: int = -1,
+             third: int = -1, lexeme: Lexeme | None = None, name: str = "") -> int:
+        """
+        Append instruction to the end of block
+
+        :param block: index of block
+        :param opcode: opcode of instruction
+        :param type_code: type of result, TYPE_NONE for instructions without result
+        :param first: first operand
+        :param second: second operand
+        :param third: third operand
+        :param lexeme: source lexeme
+        :param name: name of result register
+        :return: result register or -1
+        """
+        result = -1 if type_code == TYPE_NONE else self.new_register(type_code, name)
+        index = self.add_instruction(opcode, result, first, second, third, lexeme)
+        self.blocks[block].instructions.append(index)
+        return result
+
+    def emit_list(self, block: int, opcode: int, registers: list[int], type_code: int = TYPE_NONE,
+                  lexeme: Lexeme | None = None, name: str = "") -> int:
+        """
+        Append instruction with operand list (phi or write) to the end of block
+
+        :return: result register or -1
+        """
+        start = len(self.arguments)
+        self.arguments.extend(registers)
+        return self.emit(block, opcode, type_code, -1, start, len(registers), lexeme, name)
+
+    def insert_phi(self, block: int, type_code: int, name: str = "") -> int:
+        """
+        Insert phi without operands after other phis of block, operands are set by set_arguments
+
+        :return: result register
+        """
+        result = self.new_register(type_code, name)
+        index = self.add_instruction(OP_PHI, result, -1, len(self.arguments), 0)
+        instructions = self.blocks[block].instructions
+        position = 0
+        while position < len(instructions) and self.opcodes[instructions[position]] == OP_PHI:
+            position += 1
+        instructions.insert(position, index)
+        return result
+
+    def set_arguments(self, index: int, registers: list[int]):
+        start = len(self.arguments)
+        self.arguments.extend(registers)
+        self.second[index] = start
+        self.third[index] = len(registers)
+
+    # Access
+    def operands(self, index: int) -> list[int]:
+        """
+        Get registers read by instruction
+
+        :param index: index of instruction
+        :return: list of registers
+        """
+        opcode = self.opcodes[index]
+        if opcode == OP_PHI or opcode == OP_WRITE:
+            start = self.second[index]
+            return self.arguments[start:start + self.third[index]].tolist()
+        if opcode in BINARY_OPCODE_SET:
+            return [self.first[index], self.second[index]]
+        if opcode == OP_COPY or opcode == OP_NOT or opcode == OP_BRANCH:
+            return [self.first[index]]
+        return []
+
+    def successors(self, block: int) -> list[int]:
+        instructions = self.blocks[block].instructions
+        if not instructions:
+            return []
+        index = instructions[-1]
+        opcode = self.opcodes[index]
+        if opcode == OP_JUMP:
+            return [self.first[index]]
+        if opcode == OP_BRANCH:
+            return [self.second[index], self.third[index]]
+        return []
+
+    def block_of(self) -> array:
+        """
+        Get block of every instruction
+
+        :return: array, index is instruction, -1 for instructions not placed in blocks
+        """
+        blocks = array('i', [-1]) * len(self.opcodes)
+        for block in self.blocks:
+            for index in block.instructions:
+                blocks[index] = block.index
+        return blocks
+
+    def use_counts(self) -> array:
+        counts = array('i', [0]) * len(self.register_types)
+        for block in self.blocks:
+            for index in block.instructions:
+                for register in self.operands(index):
+                    counts[register] += 1
+        return counts
+
+    # Changing
+    def replace_operands(self, replacements: dict[int, int]):
+        """
+        Replace registers read by all instructions
+
+        :param replacements: register -> register replacing it, chains are followed
+        """
+        if not replacements:
+            return
+
+        def resolve(register: int) -> int:
+            while register in replacements:
+                register = replacements[register]
+            return register
+
+        for block in self.blocks:
+            for index in block.instructions:
+                opcode = self.opcodes[index]
+                if opcode == OP_PHI or opcode == OP_WRITE:
+                    start = self.second[index]
+                    for position in range(start, start + self.third[index]):
+                        self.arguments[position] = resolve(self.arguments[position])
+                elif opcode in BINARY_OPCODE_SET:
+                    self.first[index] = resolve(self.first[index])
+                    self.second[index] = resolve(self.second[index])
+                elif opcode == OP_COPY or opcode == OP_NOT or opcode == OP_BRANCH:
+                    self.first[index] = resolve(self.first[index])
+
+    def remove_instructions(self, removed: set[int]):
+        """
+        Remove instructions from blocks
+
+        :param removed: indices of instructions
+        """
+        if not removed:
+            return
+        for block in self.blocks:
+            if any(index in removed for index in block.instructions):
+                block.instructions = array('i', (index for index in block.instructions if index not in removed))
+        for index in removed:
+            self.opcodes[index] = OP_NOP
+            if self.results[index] >= 0:
+                self.definitions[self.results[index]] = -1
+
+    def compact(self):
+        """
+        Drop removed instructions, unused registers and operand lists from storage, renumbering the rest
+        """
+        old = (self.opcodes, self.results, self.first, self.second, self.third, self.lexemes, self.arguments,
+               self.register_types, self.register_names)
+        opcodes, results, first, second, third, lexemes, arguments, register_types, register_names = old
+        self.opcodes, self.results = array('B'), array('i')
+        self.first, self.second, self.third = array('i'), array('i'), array('i')
+        self.lexemes, self.arguments = [], array('i')
+        self.register_types, self.register_names, self.definitions = array('b'), [], array('i')
+
+        registers: dict[int, int] = {}
+        for block in self.blocks:
+            for index in block.instructions:
+                if results[index] >= 0:
+                    registers[results[index]] = self.new_register(register_types[results[index]],
+                                                                  register_names[results[index]])
+
+        for block in self.blocks:
+            instructions = array('i')
+            for index in block.instructions:
+                opcode = opcodes[index]
+                a, b, c = first[index], second[index], third[index]
+                if opcode == OP_PHI or opcode == OP_WRITE:
+                    start = len(self.arguments)
+                    self.arguments.extend(registers[register] for register in arguments[b:b + c])
+                    b = start
+                elif opcode in BINARY_OPCODE_SET:
+                    a, b = registers[a], registers[b]
+                elif opcode == OP_COPY or opcode == OP_NOT or opcode == OP_BRANCH:
+                    a = registers[a]
+                result = registers[results[index]] if results[index] >= 0 else -1
+                instructions.append(self.add_instruction(opcode, result, a, b, c, lexemes[index]))
+            block.instructions = instructions
+
+    # Printing
+    def register_string(self, register: int) -> str:
+        name = self.register_names[register]
+        return f"%{name}" if name else f"%{register}"
+
+    def instruction_string(self, index: int, block: Block | None = None) -> str:
+        opcode = self.opcodes[index]
+        name = OPCODE_NAMES[opcode]
+        a, b, c = self.first[index], self.second[index], self.third[index]
+        if opcode == OP_CONST:
+            operands = format_value(self.constants[a])
+        elif opcode == OP_READ:
+            operands = self.variables[a].variable_name
+        elif opcode == OP_PHI:
+            predecessors = block.predecessors if block is not None else ["?"] * c
+            operands = ", ".join(
+                f"[{self.register_string(register)}, b{predecessor}]"
+                for register, predecessor in zip(self.arguments[b:b + c], predecessors)
+            )
+        elif opcode == OP_JUMP:
+            operands = f"b{a}"
+        elif opcode == OP_BRANCH:
+            operands = f"{self.register_string(a)}, b{b}, b{c}"
+        else:
+            operands = ", ".join(self.register_string(register) for register in self.operands(index))
+
+        s = f"{name} {operands}".rstrip()
+        result = self.results[index]
+        if result >= 0:
+            s = f"{self.register_string(result)}: {TYPE_NAMES[self.register_types[result]]} = " + s
+        return s
+
+    def to_string(self, indent=0) -> str:
+        s = ""
+        for block in self.blocks:
+            s += " " * indent + f"b{block.index}:"
+            if block.predecessors:
+                s += "    ; предшественники: " + ", ".join(f"b{predecessor}" for predecessor in block.predecessors)
+            s += "\n"
+            for index in block.instructions:
+                s += " " * (indent + 2) + self.instruction_string(index, block) + "\n"
+        return s
@@ -0,0 +1,366 @@
+from course_work.core.data.variables import Variable, VariableType
+from course_work.core.ir.IntermediateRepresentation import (
+    Function,
+    OP_CONST,
+    OP_UNDEF,
+    OP_COPY,
+    OP_READ,
+    OP_WRITE,
+    OP_NOT,
+    OP_ADD,
+    OP_AND,
+    OP_OR,
+    OP_LT,
+    OP_GT,
+    OP_GE,
+    OP_JUMP,
+    OP_BRANCH,
+    OP_RETURN,
+    BINARY_OPCODES,
+    COMPARISON_OPCODES,
+    TYPE_CODES,
+    TYPE_BOOL,
+)
+from course_work.core.models.AbstractSyntaxTree2 import (
+    AbstractSyntaxTree,
+    Node,
+    CompositeOperatorNode,
+    ConditionalOperatorNode,
+    ConditionalLoopOperatorNode,
+    FixedLoopOperatorNode,
+    AssignmentOperatorNode,
+    OperationsNode,
+    FactorNode,
+    UnaryOperationNode,
+    ReadOperationNode,
+    WriteOperationNode,
+)
+from course_work.core.optimization.ConstantFolding import NOT_CONSTANT, evaluate_constant
+from course_work.core.runtime.values import literal_value
+
+
+# Lowering of checked tree to IR function in SSA form. Phis are placed while blocks are built, with the algorithm of
+# Braun et al. "Simple and Efficient Construction of Static Single Assignment Form": a block is sealed when all its
+# predecessors are known, reads of variables in unsealed blocks get incomplete phis, trivial phis are removed.
+class Lowering:
+    def __init__(self, tree: AbstractSyntaxTree):
+        """
+        Initialize lowering
+
+        :param tree: checked (and possibly optimized) syntax tree
+        """
+        self.tree = tree
+        self.function = Function(tree.symbols.variables)
+        self.current: list[dict[int, int]] = [{} for _ in tree.symbols.variables]   # slot -> block -> register
+        self.versions = [0] * len(tree.symbols.variables)
+        self.sealed: set[int] = set()
+        self.incomplete: dict[int, dict[int, int]] = {}     # block -> slot -> phi register
+        self.phis: dict[int, tuple[int, list[int]]] = {}    # phi register -> (block, operands)
+        self.replacements: dict[int, int] = {}              # removed phi -> register replacing it
+        self.undefined: dict[int, int] = {}                 # type code -> undef register
+        self.filling: set[int] = set()                      # phis which operands are being added
+        self.users: dict[int, set[int]] = {}                # register -> phis using it
+        # Shared expression nodes are lowered once per block
+        self.shared = {id(node) for node in tree.shared_expressions}
+        self.expressions: dict[tuple[int, int], int] = {}   # (block, id of node) -> register
+
+    def run(self) -> Function:
+        """
+        Lower tree
+
+        :return: IR function
+        """
+        function = self.function
+        function.entry = function.new_block()
+        self.seal(function.entry)
+        block = self.lower_operators(self.tree.root.children['operators'], function.entry)
+        function.emit(block, OP_RETURN)
+
+        # Operands of phis are written when all of them are known
+        function.replace_operands(self.replacements)
+        removed = set()
+        for phi, (block, operands) in self.phis.items():
+            index = function.definitions[phi]
+            if phi in self.replacements:
+                removed.add(index)
+            else:
+                function.set_arguments(index, [self.resolve(register) for register in operands])
+        function.remove_instructions(removed)
+        function.compact()
+        return function
+
+    # Variables
+    def new_name(self, variable: Variable) -> str:
+        self.versions[variable.slot] += 1
+        return f"{variable.variable_name}.{self.versions[variable.slot]}"
+
+    def resolve(self, register: int) -> int:
+        while register in self.replacements:
+            register = self.replacements[register]
+        return register
+
+    def write_variable(self, slot: int, block: int, register: int):
+        self.current[slot][block] = register
+
+    def read_variable(self, slot: int, block: int) -> int:
+        register = self.current[slot].get(block)
+        if register is not None:
+            return self.resolve(register)
+
+        variable = self.function.variables[slot]
+        type_code = TYPE_CODES[variable.variable_type]
+        predecessors = self.function.blocks[block].predecessors
+        if block not in self.sealed:
+            register = self.function.insert_phi(block, type_code, self.new_name(variable))
+            self.phis[register] = (block, [])
+            self.incomplete.setdefault(block, {})[slot] = register
+        elif len(predecessors) == 1:
+            register = self.read_variable(slot, predecessors[0])
+        elif not predecessors:
+            # Definite assignment check guarantees that such value is never used
+            register = self.undefined_register(type_code)
+        else:
+            register = self.function.insert_phi(block, type_code, self.new_name(variable))
+            self.phis[register] = (block, [])
+            self.write_variable(slot, block, register)
+            register = self.add_phi_operands(slot, register)
+        self.write_variable(slot, block, register)
+        return register
+
+    def undefined_register(self, type_code: int) -> int:
+        register = self.undefined.get(type_code)
+        if register is None:
+            function = self.function
+            register = self.undefined[type_code] = function.new_register(type_code)
+            index = function.add_instruction(OP_UNDEF, register)
+            function.blocks[function.entry].instructions.insert(0, index)
+        return register
+
+    def add_phi_operands(self, slot: int, phi: int) -> int:
+        block, operands = self.phis[phi]
+        self.filling.add(phi)
+        for predecessor in self.function.blocks[block].predecessors:
+            operand = self.read_variable(slot, predecessor)
+            operands.append(operand)
+            self.users.setdefault(operand, set()).add(phi)
+        self.filling.discard(phi)
+        return self.remove_trivial_phi(phi)
+
+    def remove_trivial_phi(self, phi: int) -> int:
+        """
+        Replace phi which operands are the same register or phi itself
+
+        :param phi: phi register
+        :return: phi or register replacing it
+        """
+        same = None
+        for operand in self.phis[phi][1]:
+            operand = self.resolve(operand)
+            if operand == same or operand == phi:
+                continue
+            if same is not None:
+                return phi
+            same = operand
+        if same is None:
+            same = self.undefined_register(self.function.register_types[phi])
+
+        # Phis using removed phi can become trivial, phis with partially added operands are checked later
+        users = self.users.pop(phi, set())
+        users.discard(phi)
+        self.replacements[phi] = same
+        self.users.setdefault(same, set()).update(users)
+        for user in users:
+            if user not in self.replacements and user not in self.filling:
+                self.remove_trivial_phi(user)
+        return self.resolve(same)
+
+    def seal(self, block: int):
+        for slot, phi in self.incomplete.pop(block, {}).items():
+            self.add_phi_operands(slot, phi)
+        self.sealed.add(block)
+
+    def jump(self, source: int, target: int):
+        self.function.emit(source, OP_JUMP, first=target)
+        self.function.add_edge(source, target)
+
+    def branch(self, source: int, condition: int, then_block: int, else_block: int):
+        self.function.emit(source, OP_BRANCH, first=condition, second=then_block, third=else_block)
+        self.function.add_edge(source, then_block)
+        self.function.add_edge(source, else_block)
+
+    # Operators
+    def lower_operators(self, operators: list[Node], block: int) -> int:
+        for operator in operators:
+            block = self.lower_operator(operator, block)
+        return block
+
+    def lower_operator(self, node: Node | None, block: int) -> int:
+        """
+        Lower operator
+
+        :param node: operator node
+        :param block: block where control is before operator
+        :return: block where control is after operator
+        """
+        function = self.function
+        if node is None:
+            return block
+
+        if isinstance(node, CompositeOperatorNode):
+            return self.lower_operators(node.children['operators'], block)
+
+        if isinstance(node, AssignmentOperatorNode):
+            self.assign(node, block)
+            return block
+
+        if isinstance(node, ReadOperationNode):
+            for variable in node.children['values']:
+                register = function.emit(block, OP_READ, TYPE_CODES[variable.variable_type], variable.slot,
+                                         lexeme=node.starting_lexeme, name=self.new_name(variable))
+                self.write_variable(variable.slot, block, register)
+            return block
+
+        if isinstance(node, WriteOperationNode):
+            registers = [self.lower_expression(expression, block) for expression in node.children['expressions']]
+            function.emit_list(block, OP_WRITE, registers, lexeme=node.starting_lexeme)
+            return block
+
+        if isinstance(node, ConditionalOperatorNode):
+            condition = self.lower_expression(node.children['if'], block)
+            join = function.new_block()
+            then_block = function.new_block()
+            else_block = join if node.children['else'] is None else function.new_block()
+            self.branch(block, condition, then_block, else_block)
+            self.seal(then_block)
+            self.jump(self.lower_operator(node.children['then'], then_block), join)
+            if node.children['else'] is not None:
+                self.seal(else_block)
+                self.jump(self.lower_operator(node.children['else'], else_block), join)
+            self.seal(join)
+            return join
+
+        if isinstance(node, ConditionalLoopOperatorNode):
+            head = function.new_block()
+            self.jump(block, head)
+            condition = self.lower_expression(node.children['while'], head)
+            body = function.new_block()
+            exit_block = function.new_block()
+            self.branch(head, condition, body, exit_block)
+            self.seal(body)
+            self.jump(self.lower_operator(node.children['do'], body), head)
+            self.seal(head)
+            self.seal(exit_block)
+            return exit_block
+
+        if isinstance(node, FixedLoopOperatorNode):
+            return self.lower_fixed_loop(node, block)
+
+        raise TypeError(f"Неизвестный оператор {type(node).__name__}")
+
+    def assign(self, node: AssignmentOperatorNode, block: int):
+        variable = node.identifier_variable
+        value = self.lower_expression(node.children['expression'], block)
+        register = self.function.emit(block, OP_COPY, TYPE_CODES[variable.variable_type], value,
+                                      lexeme=node.starting_lexeme, name=self.new_name(variable))
+        self.write_variable(variable.slot, block, register)
+
+    def lower_fixed_loop(self, node: FixedLoopOperatorNode, block: int) -> int:
+        # Bound and step are evaluated before every iteration, loop variable is incremented after body
+        function = self.function
+        header = node.children['for']
+        variable = header.identifier_variable
+        type_code = TYPE_CODES[variable.variable_type]
+        self.assign(header, block)
+
+        head = function.new_block()
+        self.jump(block, head)
+        bound = self.lower_expression(node.children['to'], head)
+        step_node = node.children['step']
+        if step_node is None:
+            step_value = 1
+            step = self.constant(head, type_code, 1.0 if variable.variable_type == VariableType.TYPE_FLOAT else 1)
+        else:
+            step_value = evaluate_constant(step_node)
+            step = self.lower_expression(step_node, head)
+        value = self.read_variable(variable.slot, head)
+
+        if step_value is NOT_CONSTANT or isinstance(step_value, bool):
+            # Direction of loop is known only at run time
+            forward = function.emit(head, OP_GE, TYPE_BOOL, step, self.constant(head, function.register_types[step], 0))
+            backward = function.emit(head, OP_NOT, TYPE_BOOL, forward)
+            after = function.emit(head, OP_AND, TYPE_BOOL, forward,
+                                  function.emit(head, OP_GT, TYPE_BOOL, value, bound))
+            before = function.emit(head, OP_AND, TYPE_BOOL, backward,
+                                   function.emit(head, OP_LT, TYPE_BOOL, value, bound))
+            finished = function.emit(head, OP_OR, TYPE_BOOL, after, before)
+        else:
+            finished = function.emit(head, OP_GT if step_value >= 0 else OP_LT, TYPE_BOOL, value, bound)
+
+        body = function.new_block()
+        exit_block = function.new_block()
+        self.branch(head, finished, exit_block, body)
+        self.seal(body)
+        body_end = self.lower_operator(node.children['do'], body)
+        value = self.read_variable(variable.slot, body_end)
+        register = function.emit(body_end, OP_ADD, type_code, value, step, lexeme=node.starting_lexeme,
+                                 name=self.new_name(variable))
+        self.write_variable(variable.slot, body_end, register)
+        self.jump(body_end, head)
+        self.seal(head)
+        self.seal(exit_block)
+        return exit_block
+
+    # Expressions
+    def constant(self, block: int, type_code: int, value) -> int:
+        return self.function.emit(block, OP_CONST, type_code, self.function.constant(type_code, value))
+
+    def lower_expression(self, node: Node, block: int) -> int:
+        """
+        Lower expression, operands of all operations are evaluated
+
+        :param node: expression node
+        :param block: block where expression is evaluated
+        :return: register with value of expression
+        """
+        if id(node) not in self.shared:
+            return self.lower_node(node, block)
+        register = self.expressions.get((block, id(node)))
+        if register is None:
+            register = self.expressions[(block, id(node))] = self.lower_node(node, block)
+        return register
+
+    def lower_node(self, node: Node, block: int) -> int:
+        function = self.function
+        if isinstance(node, OperationsNode):
+            operands = node.children['operands']
+            result = self.lower_expression(operands[0], block)
+            for i, operation in enumerate(node.children['operations']):
+                second = self.lower_expression(operands[i + 1], block)
+                opcode = BINARY_OPCODES[operation.lexeme_type]
+                type_code = TYPE_BOOL if opcode in COMPARISON_OPCODES else function.register_types[result]
+                result = function.emit(block, opcode, type_code, result, second, lexeme=operation)
+            return result
+
+        if isinstance(node, UnaryOperationNode):
+            return function.emit(block, OP_NOT, TYPE_BOOL, self.lower_expression(node.children['value'], block))
+
+        if isinstance(node, FactorNode):
+            value = node.value
+            if isinstance(value, Variable):
+                return self.read_variable(value.slot, block)
+            if isinstance(value, Node):
+                return self.lower_expression(value, block)
+            literal = literal_value(value)
+            return self.constant(block, TYPE_CODES[node.get_value_type()], literal)
+
+        raise TypeError(f"Неизвестное выражение {type(node).__name__}")
+
+
+def lower(tree: AbstractSyntaxTree) -> Function:
+    """
+    Lower checked tree to IR function in SSA form
+
+    :param tree: checked syntax tree
+    :return: IR function
+    """
+    return Lowering(tree).run()
@@ -0,0 +1,99 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Protocol
+
+from course_work.core.ir.CopyPropagation import CopyPropagation
+from course_work.core.ir.DeadInstructionElimination import DeadInstructionElimination
+from course_work.core.ir.IntermediateRepresentation import Function, IRException
+from course_work.core.ir.ValueNumbering import ValueNumbering
+from course_work.core.ir.Verifier import Verifier
+
+
+class Pass(Protocol):
+    name: str
+
+    def run(self, function: Function) -> int:
+        ...
+
+
+# Factories of passes by name
+PASSES: dict[str, Callable[[], Pass]] = {
+    "copy-propagation": CopyPropagation,
+    "cse": lambda: ValueNumbering(global_scope=False),
+    "gvn": lambda: ValueNumbering(global_scope=True),
+    "dce": DeadInstructionElimination,
+}
+
+# Pass pipelines by optimization level
+PIPELINES = {
+    0: [],
+    1: ["copy-propagation", "dce"],
+    2: ["copy-propagation", "cse", "dce"],
+    3: ["copy-propagation", "gvn", "dce"],
+}
+
+
+# Result of one pass run
+@dataclass
+class PassResult:
+    name: str
+    changes: int
+    seconds: float
+    instructions: int       # number of instructions after pass
+
+
+# Runner of pass sequence, optionally verifying function after every pass
+class PassManager:
+    def __init__(self, passes: list[Pass], verify: bool = False):
+        """
+        Initialize pass manager
+
+        :param passes: passes in order of run
+        :param verify: check function after every pass
+        """
+        self.passes = passes
+        self.verify = verify
+
+    @classmethod
+    def from_names(cls, names: list[str], verify: bool = False) -> "PassManager":
+        """
+        Create pass manager with passes given by names
+
+        :param names: names of passes, see PASSES
+        :param verify: check function after every pass
+        :return: PassManager object
+        :raise IRException: if pass name is unknown
+        """
+        passes = []
+        for name in names:
+            if name not in PASSES:
+                raise IRException(f"Неизвестный проход \"{name}\", доступны: {', '.join(PASSES)}")
+            passes.append(PASSES[name]())
+        return cls(passes, verify)
+
+    @classmethod
+    def for_level(cls, level: int, verify: bool = False) -> "PassManager":
+        return cls.from_names(PIPELINES[min(max(level, 0), max(PIPELINES))], verify)
+
+    def run(self, function: Function) -> list[PassResult]:
+        """
+        Run passes
+
+        :param function: IR function, it is changed in place
+        :return: results of passes
+        :raise IRException: if function is not correct after some pass
+        """
+        results = []
+        for optimization_pass in self.passes:
+            start = time.perf_counter()
+            changes = optimization_pass.run(function)
+            seconds = time.perf_counter() - start
+            if self.verify:
+                errors = Verifier(function).run()
+                if errors:
+                    raise IRException(f"Некорректное промежуточное представление после прохода "
+                                      f"\"{optimization_pass.name}\":\n" + "\n".join(errors))
+            results.append(PassResult(optimization_pass.name, changes, seconds, len(function)))
+        if self.passes:
+            function.compact()
+        return results
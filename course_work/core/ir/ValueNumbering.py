@@ -0,0 +1,130 @@
+from course_work.core.ir.Dominance import DominatorTree
+from course_work.core.ir.IntermediateRepresentation import (
+    Function,
+    OP_CONST,
+    OP_UNDEF,
+    OP_COPY,
+    OP_PHI,
+    OP_NOT,
+    BINARY_OPCODE_SET,
+    COMMUTATIVE_OPCODES,
+)
+
+
+# Pass giving equal numbers to registers with equal values and removing instructions recomputing known values.
+# Local numbering (common subexpression elimination) uses values of the same block, global numbering uses values
+# of dominating blocks, walking the dominator tree with scoped table.
+class ValueNumbering:
+    def __init__(self, global_scope: bool = True):
+        """
+        Initialize pass
+
+        :param global_scope: use values of dominating blocks, else only values of the same block
+        """
+        self.global_scope = global_scope
+        self.name = "gvn" if global_scope else "cse"
+
+    def run(self, function: Function) -> int:
+        """
+        Run pass
+
+        :param function: IR function, it is changed in place
+        :return: number of removed instructions
+        """
+        self.function = function
+        self.replacements: dict[int, int] = {}
+        self.removed: set[int] = set()
+        self.table: dict[tuple, int] = {}
+
+        tree = DominatorTree(function)
+        if self.global_scope:
+            # Entries added by block are removed when its dominator subtree is left
+            stack = [(function.entry, False)]
+            scopes: list[list[tuple]] = []
+            while stack:
+                block, leaving = stack.pop()
+                if leaving:
+                    for key in scopes.pop():
+                        del self.table[key]
+                    continue
+                scopes.append(self.number_block(block))
+                stack.append((block, True))
+                stack.extend((child, False) for child in reversed(tree.children[block]))
+        else:
+            for block in tree.order:
+                self.number_block(block)
+                self.table.clear()
+
+        function.replace_operands(self.replacements)
+        function.remove_instructions(self.removed)
+        return len(self.removed)
+
+    def resolve(self, register: int) -> int:
+        while register in self.replacements:
+            register = self.replacements[register]
+        return register
+
+    def key(self, index: int) -> tuple | None:
+        """
+        Get key of value computed by instruction
+
+        :param index: index of instruction
+        :return: tuple of opcode, type and operands, or None if instruction has side effects
+        """
+        function = self.function
+        opcode = function.opcodes[index]
+        type_code = function.register_types[function.results[index]] if function.results[index] >= 0 else -1
+        if opcode in BINARY_OPCODE_SET:
+            first, second = self.resolve(function.first[index]), self.resolve(function.second[index])
+            if opcode in COMMUTATIVE_OPCODES and second < first:
+                first, second = second, first
+            return opcode, type_code, first, second
+        if opcode == OP_NOT:
+            return opcode, type_code, self.resolve(function.first[index])
+        if opcode == OP_CONST:
+            return opcode, type_code, function.first[index]
+        if opcode == OP_UNDEF:
+            return opcode, type_code
+        return None
+
+    def number_block(self, block: int) -> list[tuple]:
+        """
+        Number values of block instructions
+
+        :param block: index of block
+        :return: keys added to table
+        """
+        function = self.function
+        added = []
+        phis: dict[tuple, int] = {}
+        for index in function.blocks[block].instructions:
+            opcode = function.opcodes[index]
+            result = function.results[index]
+            if opcode == OP_COPY:
+                self.replace(index, self.resolve(function.first[index]))
+                continue
+            if opcode == OP_PHI:
+                # Operands coming by back edges are not numbered yet, equal phis of one block are still found
+                operands = tuple(self.resolve(register) for register in function.operands(index))
+                distinct = set(operands) - {result}
+                if len(distinct) == 1:
+                    self.replace(index, distinct.pop())
+                elif operands in phis:
+                    self.replace(index, phis[operands])
+                else:
+                    phis[operands] = result
+                continue
+            key = self.key(index)
+            if key is None:
+                continue
+            known = self.table.get(key)
+            if known is not None:
+                self.replace(index, known)
+            else:
+                self.table[key] = result
+                added.append(key)
+        return added
+
+    def replace(self, index: int, register: int):
+        self.replacements[self.function.results[index]] = register
+        self.removed.add(index)
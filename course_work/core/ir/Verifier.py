@@ -0,0 +1,170 @@
+from course_work.core.ir.Dominance import DominatorTree
+from course_work.core.ir.IntermediateRepresentation import (
+    Function,
+    IRException,
+    OP_NOP,
+    OP_CONST,
+    OP_COPY,
+    OP_PHI,
+    OP_READ,
+    OP_NOT,
+    OP_BRANCH,
+    ARITHMETIC_OPCODES,
+    LOGICAL_OPCODES,
+    COMPARISON_OPCODES,
+    TERMINATOR_OPCODES,
+    OPCODE_NAMES,
+    TYPE_CODES,
+    TYPE_INT,
+    TYPE_FLOAT,
+    TYPE_BOOL,
+)
+
+NUMERIC_TYPES = (TYPE_INT, TYPE_FLOAT)
+
+
+# Checker of IR function structure: blocks, edges, phis, single assignment, types and dominance of definitions
+class Verifier:
+    def __init__(self, function: Function):
+        self.function = function
+        self.errors: list[str] = []
+
+    def error(self, block: int, index: int | None, message: str):
+        where = f"b{block}" if index is None else f"b{block}: {self.function.instruction_string(index)}"
+        self.errors.append(f"{where}: {message}")
+
+    def run(self) -> list[str]:
+        """
+        Check function
+
+        :return: list of errors, empty if function is correct
+        """
+        function = self.function
+        self.errors = []
+        defined_in: dict[int, tuple[int, int]] = {}    # register -> (block, position)
+
+        for block in function.blocks:
+            if not block.instructions:
+                self.error(block.index, None, "пустой блок")
+                continue
+            for position, index in enumerate(block.instructions):
+                opcode = function.opcodes[index]
+                if opcode == OP_NOP:
+                    self.error(block.index, index, "удалённая инструкция в блоке")
+                if opcode in TERMINATOR_OPCODES and position != len(block.instructions) - 1:
+                    self.error(block.index, index, "переход не в конце блока")
+                if position == len(block.instructions) - 1 and opcode not in TERMINATOR_OPCODES:
+                    self.error(block.index, index, "блок не заканчивается переходом")
+                if opcode == OP_PHI:
+                    if position > 0 and function.opcodes[block.instructions[position - 1]] != OP_PHI:
+                        self.error(block.index, index, "phi после обычной инструкции")
+                    if function.third[index] != len(block.predecessors):
+                        self.error(block.index, index, "число операндов phi не равно числу предшественников")
+                result = function.results[index]
+                if result >= 0:
+                    if result in defined_in:
+                        self.error(block.index, index, "регистр присвоен повторно")
+                    defined_in[result] = (block.index, position)
+                    if function.definitions[result] != index:
+                        self.error(block.index, index, "неверная ссылка регистра на инструкцию")
+                self.check_types(block.index, index)
+
+        self.check_edges()
+        if not self.errors:
+            self.check_dominance(defined_in)
+        return self.errors
+
+    def check_edges(self):
+        function = self.function
+        edges: dict[int, list[int]] = {block.index: [] for block in function.blocks}
+        for block in function.blocks:
+            for successor in function.successors(block.index):
+                if not 0 <= successor < len(function.blocks):
+                    self.error(block.index, None, f"переход в несуществующий блок b{successor}")
+                    continue
+                edges[successor].append(block.index)
+        for block in function.blocks:
+            if sorted(edges[block.index]) != sorted(block.predecessors):
+                self.error(block.index, None, "список предшественников не совпадает с переходами")
+        if function.blocks[function.entry].predecessors:
+            self.error(function.entry, None, "у входного блока есть предшественники")
+
+    def check_types(self, block: int, index: int):
+        function = self.function
+        opcode = function.opcodes[index]
+        types = function.register_types
+        result = function.results[index]
+        result_type = types[result] if result >= 0 else None
+        operand_types = [types[register] for register in function.operands(index)]
+        name = OPCODE_NAMES[opcode]
+
+        if opcode in ARITHMETIC_OPCODES:
+            # Step of for loop may have type other than loop variable, operations mix int and float as in tree
+            if result_type not in NUMERIC_TYPES or any(t not in NUMERIC_TYPES for t in operand_types):
+                self.error(block, index, f"операция {name} требует числовых операндов")
+        elif opcode in LOGICAL_OPCODES or opcode == OP_NOT:
+            if result_type != TYPE_BOOL or any(t != TYPE_BOOL for t in operand_types):
+                self.error(block, index, f"операция {name} требует операндов типа bool")
+        elif opcode in COMPARISON_OPCODES:
+            if result_type != TYPE_BOOL:
+                self.error(block, index, "результат сравнения должен иметь тип bool")
+            elif operand_types[0] != operand_types[1] and \
+                    (operand_types[0] not in NUMERIC_TYPES or operand_types[1] not in NUMERIC_TYPES):
+                self.error(block, index, "сравнение операндов несовместимых типов")
+        elif opcode == OP_COPY or opcode == OP_PHI:
+            if any(t != result_type for t in operand_types):
+                self.error(block, index, "тип операнда не совпадает с типом результата")
+        elif opcode == OP_BRANCH:
+            if operand_types[0] != TYPE_BOOL:
+                self.error(block, index, "условие перехода должно иметь тип bool")
+        elif opcode == OP_CONST:
+            if not 0 <= function.first[index] < len(function.constants):
+                self.error(block, index, "несуществующая константа")
+        elif opcode == OP_READ:
+            variable = function.variables[function.first[index]]
+            if TYPE_CODES[variable.variable_type] != result_type:
+                self.error(block, index, "тип регистра не совпадает с типом переменной")
+
+    def check_dominance(self, defined_in: dict[int, tuple[int, int]]):
+        function = self.function
+        tree = DominatorTree(function)
+        for block in function.blocks:
+            if not tree.is_reachable(block.index):
+                continue
+            for position, index in enumerate(block.instructions):
+                operands = function.operands(index)
+                if function.opcodes[index] == OP_PHI:
+                    # Operand of phi is used at the end of corresponding predecessor
+                    for register, predecessor in zip(operands, block.predecessors):
+                        if not tree.is_reachable(predecessor):
+                            continue
+                        if register not in defined_in:
+                            self.error(block.index, index, f"регистр {function.register_string(register)} не присвоен")
+                        elif not tree.dominates(defined_in[register][0], predecessor):
+                            self.error(block.index, index,
+                                       f"присвоение {function.register_string(register)} не доминирует над b{predecessor}")
+                    continue
+                for register in operands:
+                    if register not in defined_in:
+                        self.error(block.index, index, f"регистр {function.register_string(register)} не присвоен")
+                        continue
+                    definition_block, definition_position = defined_in[register]
+                    if definition_block == block.index:
+                        if definition_position >= position:
+                            self.error(block.index, index,
+                                       f"регистр {function.register_string(register)} используется до присвоения")
+                    elif not tree.dominates(definition_block, block.index):
+                        self.error(block.index, index,
+                                   f"присвоение {function.register_string(register)} не доминирует над использованием")
+
+
+def verify(function: Function):
+    """
+    Check function
+
+    :param function: IR function
+    :raise IRException: if function is not correct
+    """
+    errors = Verifier(function).run()
+    if errors:
+        raise IRException("Некорректное промежуточное представление:\n" + "\n".join(errors))
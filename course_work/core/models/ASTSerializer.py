@@ -0,0 +1,412 @@
+import struct
+
+from course_work.core.data.LexicalTable import LexicalTable
+from course_work.core.data.lexemes import Lexeme, LexemeType
+from course_work.core.data.variables import Variable, VariableType
+from course_work.core.exceptions import ASTSerializerException
+from course_work.core.models.AbstractSyntaxTree2 import (
+    AbstractSyntaxTree,
+    Node,
+    ProgramNode,
+    DescriptionNode,
+    CompositeOperatorNode,
+    ConditionalOperatorNode,
+    ConditionalLoopOperatorNode,
+    FixedLoopOperatorNode,
+    AssignmentOperatorNode,
+    ExpressionNode,
+    OperationsNode,
+    OperandNode,
+    TermNode,
+    FactorNode,
+    UnaryOperationNode,
+    ReadOperationNode,
+    WriteOperationNode,
+)
+from course_work.core.models.Visitor import NODE, NODES, OPTIONAL, Visitor, child_fields
+
+# Signature and version of binary format
+MAGIC = b"FLT\x02"
+
+# Codes of node kinds, 0 is absent node
+NODE_KINDS: dict[type, int] = {
+    ProgramNode: 1,
+    DescriptionNode: 2,
+    CompositeOperatorNode: 3,
+    ConditionalOperatorNode: 4,
+    ConditionalLoopOperatorNode: 5,
+    FixedLoopOperatorNode: 6,
+    AssignmentOperatorNode: 7,
+    ExpressionNode: 8,
+    OperandNode: 9,
+    TermNode: 10,
+    FactorNode: 11,
+    UnaryOperationNode: 12,
+    ReadOperationNode: 13,
+    WriteOperationNode: 14,
+}
+NODE_CLASSES: dict[int, type] = {code: node_class for node_class, code in NODE_KINDS.items()}
+
+# Keys of children holding lists of nodes, written after starting lexeme
+NODE_LISTS: dict[type, tuple[str, ...]] = {
+    node_class: tuple(key for key, kind in child_fields(node_class) if kind == NODES) for node_class in NODE_KINDS
+}
+
+# Keys of children holding single nodes, written after other data of node
+NODE_SLOTS: dict[type, tuple[str, ...]] = {
+    node_class: tuple(key for key, kind in child_fields(node_class) if kind in (NODE, OPTIONAL))
+    for node_class in NODE_KINDS
+}
+
+# Codes of variable types
+VARIABLE_TYPES = list(VariableType)
+
+# Tags of FactorNode values
+FACTOR_NONE = 0
+FACTOR_VARIABLE = 1
+FACTOR_BOOL = 2
+FACTOR_FLOAT = 3
+FACTOR_INT = 4
+FACTOR_NODE = 5
+
+DOUBLE = struct.Struct("<d")
+
+
+# Writer of binary tree representation. Node is written as kind, starting lexeme, lists of child nodes, data of node
+# written by visiting method and single child nodes
+class ASTWriter(Visitor):
+    def __init__(self, tree: AbstractSyntaxTree, lexical_table: LexicalTable):
+        """
+        Initialize writer
+
+        :param tree: checked syntax tree
+        :param lexical_table: lexical table, source of the shared string table
+        """
+        self.tree = tree
+        self.lexical_table = lexical_table
+        self.buffer = bytearray()
+        self.last_lexeme: Lexeme | None = None
+        self.last_pointer = 0
+        self.strings = (
+            [*lexical_table.keywords, *lexical_table.limiters, *lexical_table.numbers, *lexical_table.identifiers]
+        )
+        self.string_indexes = {string: i for i, string in reversed(list(enumerate(self.strings)))}
+
+    def write_varint(self, value: int):
+        while value > 0x7F:
+            self.buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.buffer.append(value)
+
+    def write_string(self, string: str):
+        if string not in self.string_indexes:
+            raise ASTSerializerException(f"Строка \"{string}\" отсутствует в лексической таблице")
+        self.write_varint(self.string_indexes[string])
+
+    def write_lexeme(self, lexeme: Lexeme):
+        # Lexeme equal to the previous one (wrapper nodes share starting lexeme) is written as 0,
+        # otherwise type code + 1, string index and pointer delta from previous lexeme
+        if lexeme is self.last_lexeme or lexeme == self.last_lexeme:
+            self.write_varint(0)
+            return
+        pointer = -1 if lexeme.lexeme_pointer is None else lexeme.lexeme_pointer
+        delta = pointer - self.last_pointer
+        self.write_varint(lexeme.lexeme_type.value + 1)
+        self.write_string(lexeme.lexeme_value)
+        self.write_varint(delta * 2 if delta >= 0 else -delta * 2 - 1)
+        self.last_lexeme = lexeme
+        self.last_pointer = pointer
+
+    def write_header(self):
+        self.buffer += MAGIC
+        for part in (
+            self.lexical_table.keywords,
+            self.lexical_table.limiters,
+            self.lexical_table.numbers,
+            self.lexical_table.identifiers,
+        ):
+            self.write_varint(len(part))
+            for string in part:
+                encoded = string.encode("utf-8")
+                self.write_varint(len(encoded))
+                self.buffer += encoded
+
+        symbols = self.tree.symbols
+        self.write_varint(len(symbols))
+        for variable in symbols.variables:
+            self.write_string(variable.variable_name)
+            self.write_varint(VARIABLE_TYPES.index(variable.variable_type))
+            self.write_varint(symbols.initialized[variable.slot])
+            declaration = symbols.declarations[variable.slot]
+            self.write_varint(0 if declaration is None else declaration + 1)
+            self.write_pointers(symbols.definitions[variable.slot])
+            self.write_pointers(symbols.uses[variable.slot])
+
+    def write_pointers(self, pointers: list[int]):
+        # Sites are written as zigzag deltas from the previous one
+        self.write_varint(len(pointers))
+        last = 0
+        for pointer in pointers:
+            delta = pointer - last
+            self.write_varint(delta * 2 if delta >= 0 else -delta * 2 - 1)
+            last = pointer
+
+    def write_node(self, node: Node | None):
+        if node is None:
+            self.write_varint(0)
+            return
+        node_class = type(node)
+        if node_class not in NODE_KINDS:
+            raise ASTSerializerException(f"Неизвестный тип узла {node_class.__name__}")
+        self.write_varint(NODE_KINDS[node_class])
+        self.write_lexeme(node.starting_lexeme)
+        for key in NODE_LISTS[node_class]:
+            self.write_nodes(node.children[key])
+        self.visit(node)
+        for key in NODE_SLOTS[node_class]:
+            self.write_node(node.children[key])
+
+    def generic_visit(self, node: Node):
+        # Node has no data besides children
+        pass
+
+    def visit_DescriptionNode(self, node: DescriptionNode):
+        self.write_lexeme(node.variable_type_lexeme)
+        self.write_varint(len(node.variables_names))
+        for name in node.variables_names:
+            self.write_string(name)
+
+    def visit_AssignmentOperatorNode(self, node: AssignmentOperatorNode):
+        self.write_string(node.identifier_variable.variable_name)
+
+    def visit_OperationsNode(self, node: OperationsNode):
+        self.write_varint(len(node.children['operations']))
+        for lexeme in node.children['operations']:
+            self.write_lexeme(lexeme)
+
+    def visit_FactorNode(self, node: FactorNode):
+        self.write_factor_value(getattr(node, "value", None))
+
+    def visit_ReadOperationNode(self, node: ReadOperationNode):
+        self.write_varint(len(node.children['values']))
+        for variable in node.children['values']:
+            self.write_string(variable.variable_name)
+
+    def write_nodes(self, nodes: list[Node]):
+        self.write_varint(len(nodes))
+        for node in nodes:
+            self.write_node(node)
+
+    def write_factor_value(self, value):
+        if value is None:
+            self.write_varint(FACTOR_NONE)
+        elif isinstance(value, Variable):
+            self.write_varint(FACTOR_VARIABLE)
+            self.write_string(value.variable_name)
+        elif isinstance(value, bool):
+            self.write_varint(FACTOR_BOOL)
+            self.write_varint(int(value))
+        elif isinstance(value, float):
+            self.write_varint(FACTOR_FLOAT)
+            self.buffer += DOUBLE.pack(value)
+        elif isinstance(value, str):
+            self.write_varint(FACTOR_INT)
+            self.write_string(value)
+        else:
+            self.write_varint(FACTOR_NODE)
+            self.write_node(value)
+
+    def write(self) -> bytes:
+        """
+        Serialize tree
+
+        :return: binary representation of tree
+        """
+        self.buffer = bytearray()
+        self.last_lexeme = None
+        self.last_pointer = 0
+        self.write_header()
+        self.write_node(self.tree.root)
+        return bytes(self.buffer)
+
+
+# Reader of binary tree representation
+class ASTReader:
+    def __init__(self, data: bytes):
+        """
+        Initialize reader
+
+        :param data: binary representation of tree
+        """
+        self.data = data
+        self.position = 0
+        self.strings: list[str] = []
+        self.last_lexeme: Lexeme | None = None
+        self.last_pointer = 0
+        self.tree = AbstractSyntaxTree()
+        self.lexical_table: LexicalTable | None = None
+
+    def read_varint(self) -> int:
+        result = 0
+        shift = 0
+        try:
+            while True:
+                byte = self.data[self.position]
+                self.position += 1
+                result |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    return result
+                shift += 7
+        except IndexError:
+            raise ASTSerializerException("Неожиданный конец данных")
+
+    def read_string(self) -> str:
+        index = self.read_varint()
+        if index >= len(self.strings):
+            raise ASTSerializerException(f"Неверный индекс строки {index}")
+        return self.strings[index]
+
+    def read_lexeme(self) -> Lexeme:
+        code = self.read_varint()
+        if code == 0:
+            if self.last_lexeme is None:
+                raise ASTSerializerException("Ссылка на отсутствующую лексему")
+            return self.last_lexeme
+        lexeme_type = LexemeType(code - 1)
+        lexeme_value = self.read_string()
+        delta = self.read_varint()
+        pointer = self.last_pointer + (delta // 2 if delta % 2 == 0 else -(delta + 1) // 2)
+        self.last_lexeme = Lexeme(
+            lexeme_value=lexeme_value,
+            lexeme_type=lexeme_type,
+            lexeme_pointer=None if pointer == -1 else pointer,
+        )
+        self.last_pointer = pointer
+        return self.last_lexeme
+
+    def read_header(self):
+        if self.data[:len(MAGIC)] != MAGIC:
+            raise ASTSerializerException("Неверный формат данных")
+        self.position = len(MAGIC)
+
+        parts = []
+        for _ in range(4):
+            part = []
+            for _ in range(self.read_varint()):
+                length = self.read_varint()
+                part.append(self.data[self.position:self.position + length].decode("utf-8"))
+                self.position += length
+            parts.append(part)
+            self.strings += part
+        self.lexical_table = LexicalTable({
+            "keywords": parts[0],
+            "limiters": parts[1],
+            "numbers": parts[2],
+            "identifiers": parts[3],
+        })
+
+        symbols = self.tree.symbols
+        for _ in range(self.read_varint()):
+            variable_name = self.read_string()
+            variable_type = VARIABLE_TYPES[self.read_varint()]
+            initialized = self.read_varint()
+            declaration = self.read_varint()
+            variable = symbols.declare(variable_name, variable_type, declaration - 1 if declaration else None)
+            if initialized:
+                symbols.set_initialized(variable.slot)
+            for pointer in self.read_pointers():
+                symbols.add_definition(variable.slot, pointer)
+            for pointer in self.read_pointers():
+                symbols.add_use(variable.slot, pointer)
+
+    def read_pointers(self) -> list[int]:
+        pointers = []
+        last = 0
+        for _ in range(self.read_varint()):
+            delta = self.read_varint()
+            last += delta // 2 if delta % 2 == 0 else -(delta + 1) // 2
+            pointers.append(last)
+        return pointers
+
+    def read_node(self) -> Node | None:
+        kind = self.read_varint()
+        if kind == 0:
+            return None
+        if kind not in NODE_CLASSES:
+            raise ASTSerializerException(f"Неизвестный код узла {kind}")
+        node_class = NODE_CLASSES[kind]
+        node = node_class(self.tree, self.read_lexeme())
+        for key in NODE_LISTS[node_class]:
+            node.children[key] = self.read_nodes()
+
+        if node_class is DescriptionNode:
+            node.variable_type_lexeme = self.read_lexeme()
+            node.variables_names = [self.read_string() for _ in range(self.read_varint())]
+        elif node_class is AssignmentOperatorNode:
+            node.identifier_variable = self.tree.get_variable(self.read_string())
+        elif node_class in (ExpressionNode, OperandNode, TermNode):
+            node.children['operations'] = [self.read_lexeme() for _ in range(self.read_varint())]
+        elif node_class is FactorNode:
+            self.read_factor_value(node)
+        elif node_class is ReadOperationNode:
+            node.children['values'] = [self.tree.get_variable(self.read_string()) for _ in range(self.read_varint())]
+
+        for key in NODE_SLOTS[node_class]:
+            node.children[key] = self.read_node()
+
+        return node
+
+    def read_nodes(self) -> list[Node]:
+        return [self.read_node() for _ in range(self.read_varint())]
+
+    def read_factor_value(self, node: FactorNode):
+        tag = self.read_varint()
+        if tag == FACTOR_VARIABLE:
+            node.value = self.tree.get_variable(self.read_string())
+        elif tag == FACTOR_BOOL:
+            node.value = bool(self.read_varint())
+        elif tag == FACTOR_FLOAT:
+            node.value = DOUBLE.unpack_from(self.data, self.position)[0]
+            self.position += DOUBLE.size
+        elif tag == FACTOR_INT:
+            node.value = self.read_string()
+        elif tag == FACTOR_NODE:
+            node.value = self.read_node()
+        elif tag != FACTOR_NONE:
+            raise ASTSerializerException(f"Неизвестный тип значения множителя {tag}")
+
+    def read(self) -> tuple[AbstractSyntaxTree, LexicalTable]:
+        """
+        Deserialize tree
+
+        :return: syntax tree and lexical table
+        :raise ASTSerializerException: if data is malformed
+        """
+        try:
+            self.read_header()
+            self.tree.root = self.read_node()
+        except (UnicodeDecodeError, IndexError, ValueError, KeyError, struct.error) as e:
+            raise ASTSerializerException(f"Повреждённые данные на смещении {self.position}: {e}")
+        return self.tree, self.lexical_table
+
+
+def dumps(tree: AbstractSyntaxTree, lexical_table: LexicalTable) -> bytes:
+    """
+    Serialize syntax tree and variables table to compact binary format
+
+    :param tree: syntax tree
+    :param lexical_table: lexical table of program
+    :return: binary representation
+    """
+    return ASTWriter(tree, lexical_table).write()
+
+
+def loads(data: bytes) -> tuple[AbstractSyntaxTree, LexicalTable]:
+    """
+    Rebuild syntax tree from binary format without parsing
+
+    :param data: binary representation
+    :return: syntax tree and lexical table
+    :raise ASTSerializerException: if data is malformed
+    """
+    return ASTReader(data).read()
@@ -1,13 +1,7 @@
 from typing import Optional, Union
 from course_work.core.data.variables import Variable, VariableType
 from course_work.core.data.lexemes import LexemeType, Lexeme
-
-
-class ASTException(Exception):
-    def __init__(self, message: str, lexeme: Lexeme | None = None, *args):
-        self.lexeme = lexeme
-        self.message = message
-        super().__init__(self.message, *args)
+from course_work.core.exceptions import ASTException
 
 
 class Node:
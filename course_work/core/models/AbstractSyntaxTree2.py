@@ -1,13 +1,9 @@
 from typing import Union
 from course_work.core.data.variables import Variable, VariableType
+from course_work.core.data.SymbolTable import SymbolTable
+from course_work.core.data.type_rules import operation_rule
 from course_work.core.data.lexemes import LexemeType, Lexeme
-
-
-class ASTException(Exception):
-    def __init__(self, message: str, lexeme: Lexeme | None = None, *args):
-        self.lexeme = lexeme
-        self.message = message
-        super().__init__(self.message, *args)
+from course_work.core.exceptions import ASTException
 
 
 class Node:
@@ -40,26 +36,8 @@ class Node:
         return VariableType.TYPE_INT
 
     def to_string(self, indent=0):
-        s = " " * indent + self.get_title()
-        if self.children:
-            s += "(\n"
-            for key in self.children:
-                if isinstance(self.children[key], Node):
-                    s += " " * (indent + 1) + f"{key}:\n" + self.children[key].to_string(indent + 2)
-                elif isinstance(self.children[key], list):
-                    if self.children[key]:
-                        s += " " * (indent + 1) + f"{key}: (\n"
-                        for child in self.children[key]:
-                            if isinstance(child, Node):
-                                s += child.to_string(indent + 2)
-                            elif isinstance(child, Lexeme):
-                                s += " " * (indent + 2) + f"Lexeme({child.lexeme_value})"
-                        s += " " * (indent + 1) + ")\n"
-                elif isinstance(self.children[key], Lexeme):
-                    s += " " * (indent + 1) + f"{key}: Lexeme({self.children[key].lexeme_value})"
-            s += " " * indent + ")" + self.__class__.__name__ + "End\n"
-
-        return s
+        from course_work.core.models.TreePrinter import to_string
+        return to_string(self, indent)
 
 
 class ProgramNode(Node):
@@ -77,6 +55,10 @@ class ProgramNode(Node):
     def add_operator_node(self, operator_node):
         self.children['operators'].append(operator_node)
 
+    def semantic_check(self) -> None:
+        super().semantic_check()
+        self.tree.check_definite_assignment(self.children['operators'])
+
 
 class DescriptionNode(Node):
     def __init__(self, tree: "AbstractSyntaxTree", starting_lexeme: Lexeme):
@@ -102,9 +84,6 @@ class DescriptionNode(Node):
         s += "; ".join(name for name in self.variables_names) + "\n"
         return s
 
-    def to_string(self, indent=0):
-        return " " * indent + self.get_title()
-
 
 class OperatorNode(Node):
     pass
@@ -212,6 +191,7 @@ class AssignmentOperatorNode(OperatorNode):
         if not self.tree.check_variable_exists(identifier_lexeme.lexeme_value):
             self.raise_exception("Неизвестная переменная!")
         self.identifier_variable = self.tree.get_variable(identifier_lexeme.lexeme_value)
+        self.tree.symbols.add_definition(self.identifier_variable.slot, identifier_lexeme.lexeme_pointer)
 
     def set_expression_node(self, expression_node: "ExpressionNode"):
         self.children['expression'] = expression_node
@@ -220,7 +200,6 @@ class AssignmentOperatorNode(OperatorNode):
         super().semantic_check()
         if self.identifier_variable.variable_type != self.children['expression'].get_value_type():
             self.raise_exception("Несоответствие типов переменной и значения выражения")
-        self.tree.add_variable_value(self.identifier_variable.variable_name)
 
     def get_title(self):
         return f"AssignmentOperator:\t{self.identifier_variable.variable_name} := "
@@ -235,56 +214,23 @@ class OperationsNode(Node):
             "operations": [],
         }
 
-        self.operations_config = {
-            LexemeType.LIM_EQ.value: {
-                "first": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "second": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "return": "first",  # can be first/second/VariableType
-            }
-        }
-
     def semantic_check(self):
         super().semantic_check()
-        for i in range(len(self.children['operations'])):
-            operation_lexeme_type = self.children['operations'][i].lexeme_type
-            type_equals = self.children['operands'][i].get_value_type() == self.children['operands'][i + 1].get_value_type()
-            if not type_equals:
-                self.raise_exception("Типы операндов должны совпадать")
-            first_operand_type = self.children['operands'][i].get_value_type()
-            second_operand_type = self.children['operands'][i + 1].get_value_type()
-
-            if operation_lexeme_type.value in self.operations_config:
-                correct_first_operand = any(
-                    variable_type == first_operand_type for variable_type in
-                    self.operations_config[operation_lexeme_type.value]["first"]
-                )
-                if not correct_first_operand:
-                    first_operand_types = ", ".join(t.value for t in
-                                                    self.operations_config[operation_lexeme_type.value]["first"])
-                    self.raise_exception(f"Операция \"{self.children['operations'][i].lexeme_value}\" поддерживает для "
-                                         f"первого операнда только типы: {first_operand_types}")
-                correct_second_operand = any(
-                    variable_type == second_operand_type for variable_type in
-                    self.operations_config[operation_lexeme_type.value]["second"]
-                )
-                if not correct_second_operand:
-                    second_operand_types = ", ".join(t.value for t in
-                                                     self.operations_config[operation_lexeme_type.value]["second"])
-                    self.raise_exception(f"Операция \"{self.children['operations'][i].lexeme_value}\" поддерживает для "
-                                         f"второго операнда только типы: {second_operand_types}")
+        operands = self.children['operands']
+        operations = self.children['operations']
+        if not operations:
+            return
+        operand_types = [operand.get_value_type() for operand in operands]
+        for i in range(len(operations)):
+            error = operation_rule(operations[i].lexeme_type._value_, operand_types[i], operand_types[i + 1])[1]
+            if error is not None:
+                self.raise_exception(error)
 
     def get_value_type(self):
         if len(self.children['operands']) == 1:
             return self.children['operands'][0].get_value_type()
-        else:
-            operation_lexeme_type = self.children['operations'][0].lexeme_type
-            if operation_lexeme_type.value in self.operations_config:
-                if self.operations_config[operation_lexeme_type.value]['return'] == 'first':
-                    return self.children['operands'][0].get_value_type()
-                elif self.operations_config[operation_lexeme_type.value]['return'] == 'second':
-                    return self.children['operands'][1].get_value_type()
-                else:
-                    return self.operations_config[operation_lexeme_type.value]['return']
+        first_type = self.children['operands'][0].get_value_type()
+        return operation_rule(self.children['operations'][0].lexeme_type._value_, first_type, first_type)[0]
 
 
 class ExpressionNode(OperationsNode):
@@ -296,29 +242,6 @@ class ExpressionNode(OperationsNode):
             "operations": [],
         }
 
-        self.operations_config = {
-            LexemeType.LIM_LT.value: {
-                "first": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "second": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "return": VariableType.TYPE_BOOL,
-            },
-            LexemeType.LIM_LTE.value: {
-                "first": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "second": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "return": VariableType.TYPE_BOOL,
-            },
-            LexemeType.LIM_GT.value: {
-                "first": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "second": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "return": VariableType.TYPE_BOOL,
-            },
-            LexemeType.LIM_GTE.value: {
-                "first": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "second": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "return": VariableType.TYPE_BOOL,
-            }
-        }
-
     def add_operand_node(self, operand_node: "OperandNode"):
         self.children['operands'].append(operand_node)
 
@@ -335,24 +258,6 @@ class OperandNode(OperationsNode):
             "operations": [],
         }
 
-        self.operations_config = {
-            LexemeType.LIM_PLUS.value: {
-                "first": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "second": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "return": "first",
-            },
-            LexemeType.LIM_MINUS.value: {
-                "first": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "second": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "return": "first",
-            },
-            LexemeType.LIM_OR.value: {
-                "first": [VariableType.TYPE_BOOL],
-                "second": [VariableType.TYPE_BOOL],
-                "return": VariableType.TYPE_BOOL,
-            },
-        }
-
     def add_term_node(self, term_node: "TermNode"):
         self.children['operands'].append(term_node)
 
@@ -369,24 +274,6 @@ class TermNode(OperationsNode):
             "operations": [],
         }
 
-        self.operations_config = {
-            LexemeType.LIM_MUL.value: {
-                "first": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "second": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "return": "first",
-            },
-            LexemeType.LIM_DIV.value: {
-                "first": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "second": [VariableType.TYPE_INT, VariableType.TYPE_FLOAT],
-                "return": "first",
-            },
-            LexemeType.LIM_AND.value: {
-                "first": [VariableType.TYPE_BOOL],
-                "second": [VariableType.TYPE_BOOL],
-                "return": VariableType.TYPE_BOOL,
-            },
-        }
-
     def add_factor_node(self, term_node: "FactorNode"):
         self.children['operands'].append(term_node)
 
@@ -407,10 +294,11 @@ class FactorNode(Node):
                 else:
                     self.value = str(value.lexeme_value)
             else:
-                if self.tree.check_variable_exists(value.lexeme_value):
-                    self.value = self.tree.get_variable(value.lexeme_value)
-                else:
+                variable = self.tree.symbols.lookup(value.lexeme_value)
+                if variable is None:
                     self.raise_exception("Неизвестная переменная!", value)
+                self.value = variable
+                self.tree.symbols.add_use(variable.slot, value.lexeme_pointer)
         else:
             self.value = value
 
@@ -428,20 +316,6 @@ class FactorNode(Node):
     def semantic_check(self):
         if isinstance(self.value, Node):
             self.value.semantic_check()
-        if isinstance(self.value, Variable):
-            if not self.tree.check_variable_has_value(self.value.variable_name):
-                self.raise_exception("Переменная использована до инициализации!")
-
-    def to_string(self, indent=0):
-        s = " " * indent + "FactorNode("
-        if isinstance(self.value, ExpressionNode) or isinstance(self.value, ExpressionNode):
-            s += "\n" + self.value.to_string(indent + 1) + " " * indent
-        elif isinstance(self.value, Variable):
-            s += f"[{self.get_value_type().value}]: Variable(" + self.value.variable_name + ")"
-        else:
-            s += f"[{self.get_value_type().value}]: " + str(self.value)
-        s += ")FactorNodeEnd\n"
-        return s
 
 
 class UnaryOperationNode(Node):
@@ -452,7 +326,7 @@ class UnaryOperationNode(Node):
         }
 
     def set_value(self, value: "FactorNode"):
-        self.children[value] = value
+        self.children['value'] = value
 
     def semantic_check(self) -> None:
         if self.children['value'].get_value_type() != VariableType.TYPE_BOOL:
@@ -473,26 +347,17 @@ class ReadOperationNode(Node):
         }
 
     def semantic_check(self) -> None:
-        for value in self.children['values']:
-            self.tree.add_variable_value(value.variable_name)
+        pass
 
     def add_variable(self, variable_lexeme: Lexeme):
-        if self.tree.check_variable_exists(variable_lexeme.lexeme_value):
-            self.children['values'].append(Variable(
-                variable_name=variable_lexeme.lexeme_value,
-                variable_type=self.tree.get_variable(variable_lexeme.lexeme_value).variable_type
-            ))
-        else:
+        variable = self.tree.symbols.lookup(variable_lexeme.lexeme_value)
+        if variable is None:
             self.raise_exception(
                 "Неизвестная переменная!",
                 lexeme=variable_lexeme
             )
-
-    def to_string(self, indent=0):
-        s = super().to_string(indent) + f", variables: "
-        s += "; ".join(variable.variable_name for variable in self.children['values']) + "\n"
-
-        return s
+        self.children['values'].append(variable)
+        self.tree.symbols.add_definition(variable.slot, variable_lexeme.lexeme_pointer)
 
 
 class WriteOperationNode(Node):
@@ -510,37 +375,36 @@ class WriteOperationNode(Node):
 class AbstractSyntaxTree:
     def __init__(self):
 
-        self.variables_dict: dict = {}
-        self.variables_with_values = set()
+        self.symbols = SymbolTable()
         self.root = None
+        # Expression nodes placed in several places of one basic block by common subexpression elimination
+        self.shared_expressions: list[Node] = []
 
     def add_variable(self,
                      variable_lexeme: Lexeme,
                      variable_type_lexeme: Lexeme,
-                     ) -> None:
+                     ) -> Variable:
         """
-        Add variable to variables list
+        Add variable to symbol table
 
         :param variable_lexeme: lexeme presenting variable
         :param variable_type_lexeme: lexeme presenting variable type (for example, "int")
+        :return: declared variable
         """
-        variable = Variable(
+        return self.symbols.declare(
             variable_name=variable_lexeme.lexeme_value,
-            variable_type=(
-                VariableType(variable_type_lexeme.lexeme_value)
-            )
+            variable_type=VariableType(variable_type_lexeme.lexeme_value),
+            pointer=variable_lexeme.lexeme_pointer,
         )
 
-        self.variables_dict[variable.variable_name] = variable
-
     def check_variable_exists(self, variable_name: str) -> bool:
         """
-        Check if variable exists in variable list
+        Check if variable exists in symbol table
 
         :param variable_name: name of variable to check
         :return: if variable exists or not
         """
-        return variable_name in self.variables_dict
+        return variable_name in self.symbols
 
     def get_variable(self, variable_name: str) -> Variable:
         """
@@ -549,22 +413,15 @@ class AbstractSyntaxTree:
         :param variable_name: name of variable to get
         :return: variable by name
         """
-        return self.variables_dict[variable_name]
+        return self.symbols.get(variable_name)
 
-    def add_variable_value(self, variable_name: str):
+    def check_definite_assignment(self, operators: list[Node], entry_state: int = 0) -> int:
         """
-        Add value to variable (initialize)
+        Check that variables are read only after assignment on every path of control flow
 
-        :param variable_name: name of variable
+        :param operators: operator nodes
+        :param entry_state: bit vector of variable slots assigned before operators
+        :return: bit vector of variable slots assigned after operators
         """
-        self.variables_with_values.add(variable_name)
-
-    def check_variable_has_value(self, variable_name: str) -> bool:
-        """
-        Check if variable has value
-
-        :param variable_name: name of variable
-        :return: if variable has value or not
-        """
-
-        return variable_name in self.variables_dict and variable_name in self.variables_with_values
+        from course_work.core.analysis.DefiniteAssignment import check_definite_assignment
+        return check_definite_assignment(operators, self.symbols, entry_state)
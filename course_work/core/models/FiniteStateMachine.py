@@ -1,17 +1,53 @@
 import re
 from typing import Generator
 
+from course_work.core.exceptions import FiniteStateMachineException
 
-class FiniteStateMachineException(Exception):
-    def __init__(self, message: str, pointer: int = 0, *args):
-        self.pointer = pointer
-        self.message = message
-        super().__init__(self.message, *args)
+
+# Maximum number of remembered symbols of one state, input with too many distinct symbols is matched every time
+CACHE_SIZE = 4096
+
+
+# States with compiled regexps and remembered transitions by symbol. It does not depend on text, so one object can be
+# shared by many machines, also from different threads: remembered transitions are the same whoever adds them
+class Automaton:
+    def __init__(self, states: dict[str, dict[str, list[str | bool | None]]]):
+        """
+        Initialize automaton
+
+        :param states: states dictionary {state: {regexp: [next_state, functions, move_pointer, error_text]}}
+        """
+        self.states = states
+        self.rules = {
+            state: [(re.compile(regexp), res) for regexp, res in transitions.items()]
+            for state, transitions in states.items()
+        }
+        self.cache: dict[str, dict[str, list[str | bool | None] | None]] = {state: {} for state in states}
+
+    def transition(self, state: str, symbol: str) -> list[str | bool | None] | None:
+        """
+        Get action of state for symbol, the first regexp matching symbol wins
+
+        :param state: current state
+        :param symbol: current symbol
+        :return: actions list or None if no regexp matches
+        """
+        cache = self.cache[state]
+        if symbol in cache:
+            return cache[symbol]
+        res = None
+        for pattern, actions in self.rules[state]:
+            if pattern.fullmatch(symbol):
+                res = actions
+                break
+        if len(cache) < CACHE_SIZE:
+            cache[symbol] = res
+        return res
 
 
 class FiniteStateMachine:
     def __init__(self,
-                 states: dict[str, dict[str, list[str | bool | None]]],
+                 states: dict[str, dict[str, list[str | bool | None]]] | Automaton,
                  symbol_generator: Generator[str, None, None],
                  initial_state: str = "IN",
                  ):
@@ -19,13 +55,16 @@ class FiniteStateMachine:
         Initialize finite state machine
 
         :param states: states dictionary {state: {regexp: [next_state, functions, move_pointer, error_text]}}
+        or automaton compiled from it
         :param initial_state: string of initial state
         """
         self.state = initial_state
         self.accumulator = ""
         self.pointer = 0
+        self.token_start = 0    # Pointer of the first symbol in accumulator
         self.finished = False
-        self.states = states
+        self.automaton = states if isinstance(states, Automaton) else Automaton(states)
+        self.states = self.automaton.states
         self.symbol_generator = symbol_generator
         self.current_symbol = next(self.symbol_generator)
 
@@ -35,11 +74,9 @@ class FiniteStateMachine:
         """
 
         # Searching corresponding regexp
-        for state_regexp in self.states[self.state]:
-            if re.fullmatch(state_regexp, self.current_symbol):
-                res = self.states[self.state][state_regexp]
-                self.handle_res(res)
-                break
+        res = self.automaton.transition(self.state, self.current_symbol)
+        if res is not None:
+            self.handle_res(res)
 
     def handle_res(self, res: list[str | bool | None]):
         """
@@ -57,7 +94,11 @@ class FiniteStateMachine:
         # If move pointer is true, doing it
         if res[2]:
             self.pointer += 1
-            self.current_symbol = next(self.symbol_generator)
+            # End marker is consumed only by states that never end, as comment which is not closed
+            try:
+                self.current_symbol = next(self.symbol_generator)
+            except StopIteration:
+                raise FiniteStateMachineException("Неожиданный конец текста!", pointer=self.pointer) from None
 
         # Checking end state
         if self.state == "END":
@@ -80,6 +121,8 @@ class FiniteStateMachine:
         """
         Add char to accumulator
         """
+        if not self.accumulator:
+            self.token_start = self.pointer
         self.accumulator += self.current_symbol
 
     def error(self, error: str):
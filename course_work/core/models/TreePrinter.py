@@ -0,0 +1,122 @@
+from course_work.core.data.variables import Variable
+from course_work.core.models.AbstractSyntaxTree2 import (
+    Node,
+    DescriptionNode,
+    OperationsNode,
+    FactorNode,
+    ReadOperationNode,
+)
+from course_work.core.models.Visitor import NODES, OPTIONAL, NODE, Visitor, child_fields
+
+
+# Printer of tree text. Node is printed as its title and, if it has children dict, as its child fields in brackets
+# ended by class name. Parts of text are collected in list and joined once
+class TreePrinter(Visitor):
+    def __init__(self):
+        self.parts: list[str] = []
+        self.indent = 0
+
+    def print(self, node: Node, indent: int = 0) -> str:
+        """
+        Get text of tree
+
+        :param node: root of printed subtree
+        :param indent: indent of root
+        :return: text of tree
+        """
+        self.parts = []
+        self.indent = indent
+        self.visit(node)
+        return "".join(self.parts)
+
+    def visit_child(self, node: Node, indent: int):
+        outer = self.indent
+        self.indent = indent
+        self.visit(node)
+        self.indent = outer
+
+    def begin(self, node: Node) -> bool:
+        """
+        Print title of node and open its children
+
+        :param node: printed node
+        :return: True if children are opened and end should be printed
+        """
+        self.parts.append(" " * self.indent + node.get_title())
+        if not node.children:
+            return False
+        self.parts.append("(\n")
+        return True
+
+    def end(self, node: Node):
+        self.parts.append(" " * self.indent + ")" + node.__class__.__name__ + "End\n")
+
+    def print_fields(self, node: Node):
+        indent = self.indent
+        parts = self.parts
+        children = node.children
+        for key, kind in child_fields(node.__class__):
+            if kind == NODES:
+                if children[key]:
+                    parts.append(" " * (indent + 1) + f"{key}: (\n")
+                    for child in children[key]:
+                        self.visit_child(child, indent + 2)
+                    parts.append(" " * (indent + 1) + ")\n")
+            elif kind in (NODE, OPTIONAL) and isinstance(children[key], Node):
+                parts.append(" " * (indent + 1) + f"{key}:\n")
+                self.visit_child(children[key], indent + 2)
+
+    def generic_visit(self, node: Node):
+        if self.begin(node):
+            self.print_fields(node)
+            self.end(node)
+
+    def visit_OperationsNode(self, node: OperationsNode):
+        if not self.begin(node):
+            return
+        self.print_fields(node)
+        operations = node.children['operations']
+        if operations:
+            indent = self.indent
+            self.parts.append(" " * (indent + 1) + "operations: (\n")
+            for lexeme in operations:
+                self.parts.append(" " * (indent + 2) + f"Lexeme({lexeme.lexeme_value})")
+            self.parts.append(" " * (indent + 1) + ")\n")
+        self.end(node)
+
+    def visit_DescriptionNode(self, node: DescriptionNode):
+        self.parts.append(" " * self.indent + node.get_title())
+
+    def visit_FactorNode(self, node: FactorNode):
+        indent = self.indent
+        self.parts.append(" " * indent + "FactorNode(")
+        if isinstance(node.value, Node):
+            self.parts.append("\n")
+            self.visit_child(node.value, indent + 1)
+            self.parts.append(" " * indent)
+        elif isinstance(node.value, Variable):
+            self.parts.append(f"[{node.get_value_type().value}]: Variable(" + node.value.variable_name + ")")
+        else:
+            self.parts.append(f"[{node.get_value_type().value}]: " + str(node.value))
+        self.parts.append(")FactorNodeEnd\n")
+
+    def visit_ReadOperationNode(self, node: ReadOperationNode):
+        # Variables are not nodes, list of them is printed empty and followed by their names
+        if self.begin(node):
+            if node.children['values']:
+                self.parts.append(" " * (self.indent + 1) + "values: (\n")
+                self.parts.append(" " * (self.indent + 1) + ")\n")
+            self.end(node)
+        self.parts.append(", variables: ")
+        self.parts.append("; ".join(variable.variable_name for variable in node.children['values']) + "\n")
+
+
+def to_string(node: Node, indent: int = 0) -> str:
+    """
+    Get text of tree
+
+    :param node: root of printed subtree
+    :param indent: indent of root
+    :return: text of tree
+    """
+    return TreePrinter().print(node, indent)
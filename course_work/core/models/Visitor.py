@@ -0,0 +1,194 @@
+from typing import Callable, Iterator
+
+from course_work.core.exceptions import ASTException
+from course_work.core.models.AbstractSyntaxTree2 import (
+    AssignmentOperatorNode,
+    CompositeOperatorNode,
+    ConditionalLoopOperatorNode,
+    ConditionalOperatorNode,
+    FactorNode,
+    FixedLoopOperatorNode,
+    Node,
+    OperationsNode,
+    ProgramNode,
+    ReadOperationNode,
+    UnaryOperationNode,
+    WriteOperationNode,
+)
+
+# Kinds of child fields
+NODE = 0        # children[key] is node
+NODES = 1       # children[key] is list of nodes
+VALUE = 2       # attribute key of node is node or other value (value of factor)
+OPTIONAL = 3    # children[key] is node or None
+
+# Child fields of node classes in fixed order, the same as order of children dicts. Lexemes and variables in children
+# (operations, read values) are not nodes, so they are not listed. List "children" of Node is never filled, it is not
+# a field
+CHILD_FIELDS: dict[type[Node], tuple[tuple[str, int], ...]] = {
+    Node: (),
+    ProgramNode: (("descriptions", NODES), ("operators", NODES)),
+    CompositeOperatorNode: (("operators", NODES),),
+    ConditionalOperatorNode: (("if", NODE), ("then", NODE), ("else", OPTIONAL)),
+    ConditionalLoopOperatorNode: (("while", NODE), ("do", NODE)),
+    FixedLoopOperatorNode: (("for", NODE), ("to", NODE), ("step", OPTIONAL), ("do", NODE)),
+    AssignmentOperatorNode: (("expression", NODE),),
+    OperationsNode: (("operands", NODES),),
+    FactorNode: (("value", VALUE),),
+    UnaryOperationNode: (("value", NODE),),
+    ReadOperationNode: (),
+    WriteOperationNode: (("expressions", NODES),),
+}
+
+# Fields of every node class met, including subclasses of listed classes: class -> fields
+_fields: dict[type, tuple[tuple[str, int], ...]] = dict(CHILD_FIELDS)
+
+
+def register_children(node_class: type[Node], fields: tuple[tuple[str, int], ...]):
+    """
+    Declare child fields of node class. Subclasses of declared class have the same fields unless they are declared
+
+    :param node_class: node class
+    :param fields: (key, kind) pairs in order of visiting
+    """
+    CHILD_FIELDS[node_class] = fields
+    _fields.clear()
+    _fields.update(CHILD_FIELDS)
+
+
+def child_fields(node_class: type) -> tuple[tuple[str, int], ...]:
+    """
+    Get child fields of node class, they are found once per class
+
+    :param node_class: node class
+    :return: (key, kind) pairs
+    """
+    fields = _fields.get(node_class)
+    if fields is None:
+        fields = next(CHILD_FIELDS[klass] for klass in node_class.__mro__ if klass in CHILD_FIELDS)
+        _fields[node_class] = fields
+    return fields
+
+
+def child_nodes(node: Node) -> list[Node]:
+    """
+    Get child nodes of node in order of its fields
+
+    :param node: node
+    :return: children which are nodes, missing children are skipped
+    """
+    fields = _fields.get(node.__class__)
+    if fields is None:
+        fields = child_fields(node.__class__)
+    children = node.children
+    result = []
+    for key, kind in fields:
+        if kind == NODES:
+            result.extend(children[key])
+        elif kind != VALUE:
+            child = children[key]
+            if child is not None:
+                result.append(child)
+        else:
+            child = getattr(node, key, None)
+            if isinstance(child, Node):
+                result.append(child)
+    return result
+
+
+def walk(root: Node | None) -> Iterator[Node]:
+    """
+    Iterate nodes of tree in pre-order, parent before children. Tree is walked on explicit stack, so its depth is not
+    limited by recursion limit
+
+    :param root: root node, None gives no nodes
+    :return: iterator of nodes
+    """
+    if root is None:
+        return
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        children = child_nodes(node)
+        children.reverse()
+        stack.extend(children)
+
+
+# Base of tree passes. visit calls method visit_<class name> of the nearest class of node having such method, or
+# generic_visit visiting all children. Methods are found on first visit of node class and kept in dispatch table
+# of visitor class
+class Visitor:
+    dispatch_table: dict[type, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.dispatch_table = {}
+
+    @classmethod
+    def find_method(cls, node_class: type) -> Callable:
+        """
+        Find method visiting nodes of class
+
+        :param node_class: node class
+        :return: function taking visitor and node
+        """
+        method = cls.dispatch_table.get(node_class)
+        if method is None:
+            method = next((getattr(cls, "visit_" + klass.__name__) for klass in node_class.__mro__
+                           if hasattr(cls, "visit_" + klass.__name__)), cls.generic_visit)
+            cls.dispatch_table[node_class] = method
+        return method
+
+    def visit(self, node: Node):
+        """
+        Visit node
+
+        :param node: node
+        :return: result of visiting method
+        """
+        method = self.dispatch_table.get(node.__class__)
+        if method is None:
+            method = self.find_method(node.__class__)
+        return method(self, node)
+
+    def generic_visit(self, node: Node):
+        for child in child_nodes(node):
+            self.visit(child)
+
+
+# Visitor changing tree: result of visiting method replaces visited node. None removes node from list or optional
+# field, required child removed by visiting is replaced by result of replace_removed. generic_visit replaces children
+# of node by results of their visiting and returns the node
+class Transformer(Visitor):
+    def generic_visit(self, node: Node) -> Node | None:
+        fields = _fields.get(node.__class__)
+        if fields is None:
+            fields = child_fields(node.__class__)
+        children = node.children
+        for key, kind in fields:
+            if kind == NODES:
+                children[key] = [new_child for new_child in map(self.visit, children[key]) if new_child is not None]
+                continue
+            child = getattr(node, key, None) if kind == VALUE else children[key]
+            if not isinstance(child, Node):
+                continue
+            new_child = self.visit(child)
+            if new_child is None and kind != OPTIONAL:
+                new_child = self.replace_removed(node, key, child)
+            if kind == VALUE:
+                setattr(node, key, new_child)
+            else:
+                children[key] = new_child
+        return node
+
+    def replace_removed(self, node: Node, key: str, child: Node) -> Node:
+        """
+        Get node replacing required child removed by visiting, by default required child can not be removed
+
+        :param node: parent node
+        :param key: key of child field
+        :param child: removed child
+        :return: node placed instead of child
+        """
+        raise ASTException(f"Обязательный дочерний узел \"{key}\" не может быть удалён!", child.starting_lexeme)
@@ -0,0 +1,173 @@
+from course_work.core.data.variables import Variable
+from course_work.core.models.AbstractSyntaxTree2 import (
+    AbstractSyntaxTree,
+    Node,
+    CompositeOperatorNode,
+    ConditionalOperatorNode,
+    ConditionalLoopOperatorNode,
+    FixedLoopOperatorNode,
+    AssignmentOperatorNode,
+    OperationsNode,
+    FactorNode,
+    UnaryOperationNode,
+    ReadOperationNode,
+    WriteOperationNode,
+)
+from course_work.core.models.Visitor import Visitor
+from course_work.core.optimization.changes import Change
+
+# Kind of change
+CHANGE_SHARED = "common_subexpression"      # repeated expression is replaced by the first one and computed once
+
+
+def is_computation(node: Node) -> bool:
+    """
+    Check if expression has operations, shared variables and literals are not worth computing once
+
+    :param node: expression node
+    :return: True if node or nodes wrapped by it have operations
+    """
+    while True:
+        if isinstance(node, UnaryOperationNode):
+            return True
+        if isinstance(node, OperationsNode):
+            if node.children['operations']:
+                return True
+            node = node.children['operands'][0]
+        elif isinstance(node, FactorNode) and isinstance(getattr(node, "value", None), Node):
+            node = node.value
+        else:
+            return False
+
+
+# Optimization pass hash-consing expression subtrees: equal subtrees of one basic block are replaced by one node.
+# Key of subtree is its class, operations and nodes of operands, variable is identified by slot and number of
+# assignments to it, so equal keys mean equal values. Blocks are the same as in ControlFlowGraph, backends compute
+# value of shared node once per execution of block.
+class CommonSubexpressionElimination(Visitor):
+    def __init__(self, tree: AbstractSyntaxTree):
+        """
+        Initialize pass
+
+        :param tree: checked syntax tree, it is changed in place, it should not be changed by other passes after it
+        """
+        self.tree = tree
+        self.table: dict[tuple, Node] = {}
+        self.versions = [0] * len(tree.symbols)
+        self.uses: dict[int, int] = {}      # id of shared node -> number of places
+        self.shared: dict[int, Node] = {}
+        self.changes: list[Change] = []
+
+    def run(self) -> list[Change]:
+        """
+        Run pass
+
+        :return: list of changes
+        """
+        for operator in self.tree.root.children['operators']:
+            self.visit(operator)
+        self.tree.shared_expressions = [node for key, node in self.shared.items() if self.uses[key] > 1]
+        return self.changes
+
+    def new_block(self):
+        self.table.clear()
+
+    def assign(self, variable: Variable):
+        self.versions[variable.slot] += 1
+
+    # Operators
+    def generic_visit(self, node: Node):
+        # Only operators are visited, expressions are interned by operators containing them
+        pass
+
+    def visit_CompositeOperatorNode(self, node: CompositeOperatorNode):
+        for operator in node.children['operators']:
+            self.visit(operator)
+
+    def visit_AssignmentOperatorNode(self, node: AssignmentOperatorNode):
+        node.children['expression'] = self.intern(node.children['expression'])
+        self.assign(node.identifier_variable)
+
+    def visit_ReadOperationNode(self, node: ReadOperationNode):
+        for variable in node.children['values']:
+            self.assign(variable)
+
+    def visit_WriteOperationNode(self, node: WriteOperationNode):
+        node.children['expressions'] = [self.intern(expression) for expression in node.children['expressions']]
+
+    def visit_ConditionalOperatorNode(self, node: ConditionalOperatorNode):
+        node.children['if'] = self.intern(node.children['if'])
+        for key in ("then", "else"):
+            self.new_block()
+            if node.children[key] is not None:
+                self.visit(node.children[key])
+        self.new_block()
+
+    def visit_ConditionalLoopOperatorNode(self, node: ConditionalLoopOperatorNode):
+        self.new_block()
+        node.children['while'] = self.intern(node.children['while'])
+        self.new_block()
+        self.visit(node.children['do'])
+        self.new_block()
+
+    def visit_FixedLoopOperatorNode(self, node: FixedLoopOperatorNode):
+        self.visit(node.children['for'])
+        self.new_block()
+        node.children['to'] = self.intern(node.children['to'])
+        if node.children['step'] is not None:
+            node.children['step'] = self.intern(node.children['step'])
+        self.new_block()
+        self.visit(node.children['do'])
+        self.new_block()
+
+    # Expressions
+    def intern(self, node: Node) -> Node:
+        """
+        Replace equal subtrees of expression with nodes seen before in block, children first
+
+        :param node: expression node
+        :return: node equal to given one, which should be placed instead of it
+        """
+        changes = len(self.changes)
+        if isinstance(node, OperationsNode):
+            operands = node.children['operands'] = [self.intern(operand) for operand in node.children['operands']]
+            key = (type(node), tuple(operation.lexeme_type for operation in node.children['operations']),
+                   tuple(id(operand) for operand in operands))
+        elif isinstance(node, UnaryOperationNode):
+            value = node.children['value'] = self.intern(node.children['value'])
+            key = (UnaryOperationNode, id(value))
+        elif isinstance(node, FactorNode) and hasattr(node, "value"):
+            value = node.value
+            if isinstance(value, Variable):
+                key = (FactorNode, value.slot, self.versions[value.slot])
+            elif isinstance(value, Node):
+                value = node.value = self.intern(value)
+                key = (FactorNode, id(value))
+            else:
+                key = (FactorNode, type(value), repr(value))
+        else:
+            return node
+
+        known = self.table.get(key)
+        if known is None:
+            self.table[key] = node
+            return node
+        if known is not node:
+            # Changes inside repeated expression are covered by its replacement
+            del self.changes[changes:]
+            if is_computation(known):
+                self.changes.append(Change(CHANGE_SHARED, node, "повторное вычисление выражения заменено первым"))
+        if is_computation(known):
+            self.shared[id(known)] = known
+            self.uses[id(known)] = self.uses.get(id(known), 1) + 1
+        return known
+
+
+def share_common_subexpressions(tree: AbstractSyntaxTree) -> list[Change]:
+    """
+    Run common subexpression elimination on checked tree
+
+    :param tree: checked syntax tree, it is changed in place
+    :return: list of changes
+    """
+    return CommonSubexpressionElimination(tree).run()
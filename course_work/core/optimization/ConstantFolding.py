@@ -0,0 +1,86 @@
+from course_work.core.data.lexemes import LexemeType
+from course_work.core.data.variables import Variable
+from course_work.core.models.AbstractSyntaxTree2 import (
+    Node,
+    OperationsNode,
+    FactorNode,
+    UnaryOperationNode,
+)
+from course_work.core.models.Visitor import child_nodes
+from course_work.core.runtime.values import BINARY_OPERATIONS, literal_value
+
+
+# Marker of expression which value is not known at compile time
+class NotConstant:
+    def __repr__(self):
+        return "NOT_CONSTANT"
+
+
+NOT_CONSTANT = NotConstant()
+
+
+def evaluate_constant(node: Node | None):
+    """
+    Evaluate expression at compile time
+
+    :param node: expression node, full or flat
+    :return: value of expression or NOT_CONSTANT if it depends on variables or fails (division by zero)
+    """
+    if node is None:
+        return NOT_CONSTANT
+
+    if isinstance(node, FactorNode):
+        value = getattr(node, "value", None)
+        if value is None or isinstance(value, Variable):
+            return NOT_CONSTANT
+        if isinstance(value, Node):
+            return evaluate_constant(value)
+        return literal_value(value)
+
+    if isinstance(node, UnaryOperationNode):
+        value = evaluate_constant(node.children.get('value'))
+        return NOT_CONSTANT if value is NOT_CONSTANT else not value
+
+    if isinstance(node, OperationsNode):
+        operands = [evaluate_constant(operand) for operand in node.children['operands']]
+        operations = [lexeme.lexeme_type for lexeme in node.children['operations']]
+        # Logical operation with absorbing operand is constant even if other operands are not, unless they can fail
+        if operations and all(operation == LexemeType.LIM_AND for operation in operations) and False in operands \
+                and is_removable(node):
+            return False
+        if operations and all(operation == LexemeType.LIM_OR for operation in operations) and True in operands \
+                and is_removable(node):
+            return True
+        if any(operand is NOT_CONSTANT for operand in operands):
+            return NOT_CONSTANT
+        result = operands[0]
+        try:
+            for operation, operand in zip(operations, operands[1:]):
+                result = BINARY_OPERATIONS[operation](result, operand)
+        except ZeroDivisionError:
+            return NOT_CONSTANT
+        return result
+
+    return NOT_CONSTANT
+
+
+def is_removable(node: Node | None) -> bool:
+    """
+    Check if expression can be removed without changing behaviour of program, i.e. it can not fail at runtime
+
+    :param node: expression node
+    :return: true if every divisor of expression is non-zero constant
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            continue
+        if isinstance(node, OperationsNode):
+            for i, lexeme in enumerate(node.children['operations']):
+                if lexeme.lexeme_type == LexemeType.LIM_DIV:
+                    divisor = evaluate_constant(node.children['operands'][i + 1])
+                    if divisor is NOT_CONSTANT or divisor == 0:
+                        return False
+        stack.extend(child_nodes(node))
+    return True
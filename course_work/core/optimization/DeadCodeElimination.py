@@ -0,0 +1,189 @@
+from course_work.core.analysis.ControlFlowGraph import ControlFlowGraph
+from course_work.core.analysis.Liveness import Liveness
+from course_work.core.models.AbstractSyntaxTree2 import (
+    AbstractSyntaxTree,
+    Node,
+    ProgramNode,
+    CompositeOperatorNode,
+    ConditionalOperatorNode,
+    ConditionalLoopOperatorNode,
+    FixedLoopOperatorNode,
+    AssignmentOperatorNode,
+    OperationsNode,
+)
+from course_work.core.models.Visitor import Transformer
+from course_work.core.optimization.ConstantFolding import evaluate_constant, is_removable
+from course_work.core.optimization.changes import Change
+
+# Kinds of removals
+REMOVAL_BRANCH = "branch"           # branch of if with constant condition
+REMOVAL_LOOP = "loop"               # while loop with false condition
+REMOVAL_UNREACHABLE = "unreachable" # operator after infinite loop
+REMOVAL_DEAD_STORE = "dead_store"   # assignment to variable which value is never read
+
+
+# Removal of unreachable operators: branches and loops with constant conditions and operators after infinite loops.
+# Visiting method returns operator replacing visited one, required operator removed from loop or branch is replaced
+# by empty composite operator
+class UnreachableCodeRemover(Transformer):
+    def __init__(self, elimination: "DeadCodeElimination"):
+        """
+        Initialize remover
+
+        :param elimination: pass collecting removed operators
+        """
+        self.elimination = elimination
+
+    def replace_removed(self, node: Node, key: str, child: Node) -> Node:
+        return empty_operator(node)
+
+    def visit_OperationsNode(self, node: OperationsNode) -> Node:
+        # Expressions have no operators
+        return node
+
+    def visit_ProgramNode(self, node: ProgramNode) -> Node:
+        node.children['operators'] = self.visit_operators(node.children['operators'])
+        return node
+
+    def visit_CompositeOperatorNode(self, node: CompositeOperatorNode) -> Node:
+        node.children['operators'] = self.visit_operators(node.children['operators'])
+        return node
+
+    def visit_operators(self, operators: list[Node]) -> list[Node]:
+        result = []
+        for i, operator in enumerate(operators):
+            operator = self.visit(operator)
+            if operator is None:
+                continue
+            result.append(operator)
+            if isinstance(operator, ConditionalLoopOperatorNode) and evaluate_constant(operator.children['while']) is True:
+                # There are no jumps out of loops, so operators after infinite loop are never executed
+                for unreachable in operators[i + 1:]:
+                    self.elimination.remove(REMOVAL_UNREACHABLE, unreachable, "оператор после бесконечного цикла")
+                break
+        return result
+
+    def visit_ConditionalOperatorNode(self, node: ConditionalOperatorNode) -> Node | None:
+        condition = evaluate_constant(node.children['if'])
+        if condition is True:
+            self.elimination.remove(REMOVAL_BRANCH, node.children['else'], "ветвь else условия, всегда истинного")
+            return self.visit(node.children['then'])
+        if condition is False:
+            self.elimination.remove(REMOVAL_BRANCH, node.children['then'], "ветвь условия, всегда ложного")
+            return self.visit(node.children['else']) if node.children['else'] is not None else None
+        return self.generic_visit(node)
+
+    def visit_ConditionalLoopOperatorNode(self, node: ConditionalLoopOperatorNode) -> Node | None:
+        if evaluate_constant(node.children['while']) is False:
+            self.elimination.remove(REMOVAL_LOOP, node, "цикл с всегда ложным условием")
+            return None
+        return self.generic_visit(node)
+
+
+# Removal of dead assignments found by liveness, removed body of loop or then branch is replaced by empty composite
+# operator, removed else branch is dropped
+class DeadStoreRemover(Transformer):
+    def __init__(self, dead: set[int]):
+        """
+        Initialize remover
+
+        :param dead: ids of dead assignment nodes
+        """
+        self.dead = dead
+
+    def replace_removed(self, node: Node, key: str, child: Node) -> Node:
+        return empty_operator(child)
+
+    def visit_OperationsNode(self, node: OperationsNode) -> Node:
+        return node
+
+    def visit_AssignmentOperatorNode(self, node: AssignmentOperatorNode) -> Node | None:
+        return None if id(node) in self.dead else node
+
+
+def empty_operator(node: Node) -> CompositeOperatorNode:
+    return CompositeOperatorNode(node.tree, node.starting_lexeme)
+
+
+# Optimization pass removing unreachable operators and dead stores from checked tree
+class DeadCodeElimination:
+    def __init__(self, tree: AbstractSyntaxTree, prune_branches: bool = True, remove_dead_stores: bool = True):
+        """
+        Initialize pass
+
+        :param tree: checked syntax tree, it is changed in place
+        :param prune_branches: remove branches and loops with constant conditions and operators after infinite loops
+        :param remove_dead_stores: remove assignments to variables which values are never read
+        """
+        self.tree = tree
+        self.prune_branches = prune_branches
+        self.remove_dead_stores = remove_dead_stores
+        self.removed: list[Change] = []
+
+    def run(self) -> list[Change]:
+        """
+        Run pass
+
+        :return: list of removed operators
+        """
+        root: ProgramNode = self.tree.root
+        if self.prune_branches:
+            UnreachableCodeRemover(self).visit(root)
+        if self.remove_dead_stores:
+            while True:
+                dead = self.find_dead_stores(root.children['operators'])
+                if not dead:
+                    break
+                DeadStoreRemover(dead).visit(root)
+        return self.removed
+
+    def remove(self, kind: str, node: Node | None, description: str):
+        if node is not None:
+            self.removed.append(Change(kind, node, description))
+
+    # Dead stores
+    def find_dead_stores(self, operators: list[Node]) -> set[int]:
+        """
+        Find assignments which values are never read, using liveness of variables
+
+        :param operators: operator nodes of program
+        :return: ids of dead assignment nodes
+        """
+        graph = ControlFlowGraph.build(operators)
+        liveness = Liveness(graph)
+        liveness.solve()
+
+        # Header assignments of for loops are kept, they define the loop
+        loop_assignments = {
+            id(element.children['for'])
+            for block in graph.blocks for element in block.elements
+            if isinstance(element, FixedLoopOperatorNode)
+        }
+
+        dead = set()
+        for block in graph.reverse_postorder():
+            live = liveness.live_out[block.index]
+            for element, (used, assigned) in zip(reversed(block.elements), reversed(liveness.effects[block.index])):
+                if isinstance(element, AssignmentOperatorNode) and not live & assigned \
+                        and id(element) not in loop_assignments and is_removable(element.children['expression']):
+                    dead.add(id(element))
+                    self.remove(
+                        REMOVAL_DEAD_STORE, element,
+                        f"присвоение переменной {element.identifier_variable.variable_name}, значение не используется"
+                    )
+                    continue
+                live = used | (live & ~assigned)
+        return dead
+
+
+def eliminate_dead_code(tree: AbstractSyntaxTree, level: int = 2) -> list[Change]:
+    """
+    Run dead code elimination on checked tree
+
+    :param tree: checked syntax tree, it is changed in place
+    :param level: optimization level: 0 - nothing, 1 - unreachable code, 2 - also dead stores
+    :return: list of removed operators
+    """
+    if level <= 0:
+        return []
+    return DeadCodeElimination(tree, prune_branches=True, remove_dead_stores=level >= 2).run()
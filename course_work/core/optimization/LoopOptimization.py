@@ -0,0 +1,300 @@
+from course_work.core.analysis.Liveness import uses_mask
+from course_work.core.data.lexemes import Lexeme, LexemeType
+from course_work.core.data.variables import Variable, VariableType
+from course_work.core.models.AbstractSyntaxTree2 import (
+    AbstractSyntaxTree,
+    Node,
+    CompositeOperatorNode,
+    ConditionalOperatorNode,
+    ConditionalLoopOperatorNode,
+    FixedLoopOperatorNode,
+    AssignmentOperatorNode,
+    OperationsNode,
+    OperandNode,
+    TermNode,
+    FactorNode,
+    ReadOperationNode,
+    WriteOperationNode,
+)
+from course_work.core.models.Visitor import Transformer, child_nodes, walk
+from course_work.core.optimization.ConstantFolding import is_removable
+from course_work.core.optimization.changes import Change
+from course_work.core.parsers.PrattSyntaxAnalyzer import CHAIN_CLASSES, expand_expression
+
+# Kinds of changes
+CHANGE_HOIST = "hoist"                          # invariant expression is computed before loop
+CHANGE_BOUND = "bound"                          # bound or step of for loop is computed once
+CHANGE_STRENGTH_REDUCTION = "strength_reduction"  # multiplication by loop variable is replaced by addition
+
+
+def assigned_mask(node: Node | None) -> int:
+    """
+    Get variables assigned inside operator
+
+    :param node: operator node
+    :return: bit vector of assigned slots
+    """
+    mask = 0
+    for child in walk(node):
+        if isinstance(child, AssignmentOperatorNode):
+            mask |= 1 << child.identifier_variable.slot
+        elif isinstance(child, ReadOperationNode):
+            for variable in child.children['values']:
+                mask |= 1 << variable.slot
+    return mask
+
+
+def has_operation(node: Node | None) -> bool:
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, OperationsNode):
+            if node.children['operations']:
+                return True
+            stack.extend(node.children['operands'])
+        elif isinstance(node, FactorNode) and isinstance(getattr(node, "value", None), Node):
+            stack.append(node.value)
+    return False
+
+
+def node_level(node: Node) -> int:
+    return CHAIN_CLASSES.index(type(node)) if type(node) in CHAIN_CLASSES else len(CHAIN_CLASSES)
+
+
+# Optimization pass over loops: hoisting of invariant expressions, bounds computed once, strength reduction.
+# Loops are visited after their bodies, so inner loops are optimized first
+class LoopOptimization(Transformer):
+    def __init__(self, tree: AbstractSyntaxTree, hoist: bool = True, strength_reduction: bool = True):
+        """
+        Initialize pass
+
+        :param tree: checked syntax tree, it is changed in place
+        :param hoist: compute invariant expressions, bounds and steps of loops once before loops
+        :param strength_reduction: replace multiplications by variable of for loop with additions
+        """
+        self.tree = tree
+        self.hoist = hoist
+        self.strength_reduction = strength_reduction
+        self.changes: list[Change] = []
+
+    def run(self) -> list[Change]:
+        """
+        Run pass
+
+        :return: list of changes
+        """
+        self.visit(self.tree.root)
+        return self.changes
+
+    def visit_OperationsNode(self, node: OperationsNode) -> Node:
+        # Expressions have no loops, they are changed when loops containing them are optimized
+        return node
+
+    def visit_ConditionalLoopOperatorNode(self, node: ConditionalLoopOperatorNode) -> Node:
+        return self.optimize_loop(self.generic_visit(node))
+
+    def visit_FixedLoopOperatorNode(self, node: FixedLoopOperatorNode) -> Node:
+        return self.optimize_loop(self.generic_visit(node))
+
+    def optimize_loop(self, loop: Node) -> Node:
+        """
+        Optimize loop, computations moved out of loop are placed before it
+
+        :param loop: ConditionalLoopOperatorNode or FixedLoopOperatorNode
+        :return: loop or composite operator of computations and loop
+        """
+        prologue: list[Node] = []
+        if isinstance(loop, FixedLoopOperatorNode):
+            if self.strength_reduction:
+                self.reduce_strength(loop, prologue)
+            if self.hoist:
+                assigned = assigned_mask(loop)
+                for key, description in (("to", "граница"), ("step", "шаг")):
+                    expression = loop.children[key]
+                    if self.is_hoistable(expression, assigned):
+                        loop.children[key] = self.hoist_expression(expression, prologue)
+                        self.changes.append(Change(
+                            CHANGE_BOUND, expression, f"{description} цикла for вычисляется один раз"
+                        ))
+
+        if self.hoist:
+            assigned = assigned_mask(loop)
+            if isinstance(loop, ConditionalLoopOperatorNode):
+                loop.children['while'] = self.hoist_invariants(loop.children['while'], assigned, prologue)
+            self.hoist_in_operator(loop.children['do'], assigned, prologue)
+
+        if not prologue:
+            return loop
+        composite = CompositeOperatorNode(self.tree, loop.starting_lexeme)
+        composite.children['operators'] = prologue + [loop]
+        return composite
+
+    # Helpers
+    def new_assignment(self, variable: Variable, expression: Node, lexeme: Lexeme) -> AssignmentOperatorNode:
+        assignment = AssignmentOperatorNode(self.tree, lexeme)
+        assignment.identifier_variable = variable
+        assignment.children['expression'] = expand_expression(expression)
+        return assignment
+
+    def new_operation(self, node_class: type, first: Node, operation: LexemeType, value: str, second: Node) -> Node:
+        node = node_class(self.tree, first.starting_lexeme)
+        node.children['operands'] = [first, second]
+        node.children['operations'] = [Lexeme(value, operation, first.starting_lexeme.lexeme_pointer)]
+        return node
+
+    def new_factor(self, variable: Variable, lexeme: Lexeme) -> FactorNode:
+        factor = FactorNode(self.tree, lexeme)
+        factor.value = variable
+        return factor
+
+    # Hoisting
+    @staticmethod
+    def is_hoistable(node: Node | None, assigned: int) -> bool:
+        return (
+            node is not None
+            and has_operation(node)
+            and not uses_mask(node) & assigned
+            and node.get_value_type() is not None
+            and is_removable(node)
+        )
+
+    def hoist_expression(self, node: Node, prologue: list[Node]) -> Node:
+        """
+        Move computation of expression to temporary variable assigned before loop
+
+        :param node: expression node
+        :param prologue: operators executed before loop
+        :return: expression node reading temporary variable
+        """
+        variable = self.tree.symbols.declare_temporary(node.get_value_type())
+        prologue.append(self.new_assignment(variable, node, node.starting_lexeme))
+        return expand_expression(self.new_factor(variable, node.starting_lexeme), node_level(node))
+
+    def hoist_invariants(self, node: Node | None, assigned: int, prologue: list[Node]) -> Node | None:
+        """
+        Hoist largest invariant subexpressions of expression
+
+        :param node: expression node
+        :param assigned: bit vector of slots assigned in loop
+        :param prologue: operators executed before loop
+        :return: expression node replacing node
+        """
+        if node is None:
+            return None
+        if self.is_hoistable(node, assigned):
+            self.changes.append(Change(CHANGE_HOIST, node, "инвариантное выражение вынесено из цикла"))
+            return self.hoist_expression(node, prologue)
+        if isinstance(node, OperationsNode):
+            node.children['operands'] = [
+                self.hoist_invariants(operand, assigned, prologue) for operand in node.children['operands']
+            ]
+        elif isinstance(node, FactorNode) and isinstance(getattr(node, "value", None), Node):
+            node.value = self.hoist_invariants(node.value, assigned, prologue)
+        return node
+
+    def hoist_in_operator(self, node: Node | None, assigned: int, prologue: list[Node]):
+        if isinstance(node, CompositeOperatorNode):
+            for operator in node.children['operators']:
+                self.hoist_in_operator(operator, assigned, prologue)
+        elif isinstance(node, ConditionalOperatorNode):
+            node.children['if'] = self.hoist_invariants(node.children['if'], assigned, prologue)
+            self.hoist_in_operator(node.children['then'], assigned, prologue)
+            self.hoist_in_operator(node.children['else'], assigned, prologue)
+        elif isinstance(node, ConditionalLoopOperatorNode):
+            node.children['while'] = self.hoist_invariants(node.children['while'], assigned, prologue)
+            self.hoist_in_operator(node.children['do'], assigned, prologue)
+        elif isinstance(node, FixedLoopOperatorNode):
+            self.hoist_in_operator(node.children['for'], assigned, prologue)
+            node.children['to'] = self.hoist_invariants(node.children['to'], assigned, prologue)
+            node.children['step'] = self.hoist_invariants(node.children['step'], assigned, prologue)
+            self.hoist_in_operator(node.children['do'], assigned, prologue)
+        elif isinstance(node, AssignmentOperatorNode):
+            node.children['expression'] = self.hoist_invariants(node.children['expression'], assigned, prologue)
+        elif isinstance(node, WriteOperationNode):
+            node.children['expressions'] = [
+                self.hoist_invariants(expression, assigned, prologue) for expression in node.children['expressions']
+            ]
+
+    # Strength reduction
+    def reduce_strength(self, loop: FixedLoopOperatorNode, prologue: list[Node]):
+        """
+        Replace products "k * c" of loop variable k and invariant c by variable r, where r := start * c before loop
+        and r := r + step * c after every iteration
+
+        :param loop: for loop
+        :param prologue: operators executed before loop
+        """
+        header: AssignmentOperatorNode = loop.children['for']
+        loop_variable = header.identifier_variable
+        step = loop.children['step']
+        assigned = assigned_mask(loop)
+        if loop_variable.variable_type != VariableType.TYPE_INT \
+                or assigned_mask(loop.children['do']) >> loop_variable.slot & 1 \
+                or not is_removable(header.children['expression']) \
+                or step is not None and (uses_mask(step) & assigned or not is_removable(step)):
+            return
+
+        def is_loop_variable(node: Node) -> bool:
+            return isinstance(node, FactorNode) and isinstance(getattr(node, "value", None), Variable) \
+                and node.value.slot == loop_variable.slot
+
+        def is_invariant_integer(node: Node) -> bool:
+            return not uses_mask(node) & assigned and node.get_value_type() == VariableType.TYPE_INT \
+                and is_removable(node)
+
+        reduced: dict[str, Variable] = {}
+        increments: list[Node] = []
+        stack = [loop.children['do']]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, OperationsNode) and node.children['operations'] \
+                    and node.children['operations'][0].lexeme_type == LexemeType.LIM_MUL:
+                first, second = node.children['operands'][:2]
+                invariant = second if is_loop_variable(first) else first if is_loop_variable(second) else None
+                if invariant is not None and is_invariant_integer(invariant):
+                    key = expand_expression(invariant, len(CHAIN_CLASSES)).to_string()
+                    product = reduced.get(key)
+                    if product is None:
+                        product = reduced[key] = self.new_product(loop, invariant, prologue, increments)
+                    node.children['operands'][:2] = [
+                        expand_expression(self.new_factor(product, first.starting_lexeme), node_level(first))
+                    ]
+                    node.children['operations'].pop(0)
+                    self.changes.append(Change(
+                        CHANGE_STRENGTH_REDUCTION, node,
+                        f"умножение на переменную цикла {loop_variable.variable_name} заменено сложением"
+                    ))
+            stack.extend(child_nodes(node))
+
+        if increments:
+            body = CompositeOperatorNode(self.tree, loop.children['do'].starting_lexeme)
+            body.children['operators'] = [loop.children['do']] + increments
+            loop.children['do'] = body
+
+    def new_product(self, loop: FixedLoopOperatorNode, invariant: Node, prologue: list[Node],
+                    increments: list[Node]) -> Variable:
+        header: AssignmentOperatorNode = loop.children['for']
+        lexeme = loop.starting_lexeme
+        product = self.tree.symbols.declare_temporary(VariableType.TYPE_INT)
+        delta = self.tree.symbols.declare_temporary(VariableType.TYPE_INT)
+        prologue.append(self.new_assignment(product, self.new_operation(
+            TermNode, header.children['expression'], LexemeType.LIM_MUL, "*", invariant
+        ), lexeme))
+        step = loop.children['step']
+        prologue.append(self.new_assignment(delta, invariant if step is None else self.new_operation(
+            TermNode, step, LexemeType.LIM_MUL, "*", invariant
+        ), lexeme))
+        increments.append(self.new_assignment(product, self.new_operation(
+            OperandNode, self.new_factor(product, lexeme), LexemeType.LIM_PLUS, "+", self.new_factor(delta, lexeme)
+        ), lexeme))
+        return product
+
+
+def optimize_loops(tree: AbstractSyntaxTree) -> list[Change]:
+    """
+    Run loop optimizations on checked tree
+
+    :param tree: checked syntax tree, it is changed in place
+    :return: list of changes
+    """
+    return LoopOptimization(tree).run()
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from course_work.core.models.AbstractSyntaxTree2 import Node
+
+
+# Record of change made by optimization pass
+@dataclass
+class Change:
+    kind: str
+    node: Node
+    description: str
+
+    @property
+    def pointer(self) -> int | None:
+        return self.node.starting_lexeme.lexeme_pointer if self.node.starting_lexeme else None
@@ -0,0 +1,249 @@
+import os
+import re
+from dataclasses import dataclass
+
+from course_work.core.data.lexemes import LexemeType
+from course_work.core.exceptions import GrammarException
+
+PACKAGE_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+GRAMMAR_PATH = os.path.join(PACKAGE_PATH, "grammar.txt")
+PARSE_TABLE_PATH = os.path.join(PACKAGE_PATH, "parse_table.json")
+
+# Terminal matching any lexeme
+ANY = "ANY"
+ANY_CODE = -1
+# Mark of empty string in FIRST sets
+EMPTY = ""
+
+TOKEN_REGEXP = re.compile(r'"[^"]*"|<[^>]*>|->|\||!|[^\s"<>|!]+')
+ACTIONS = ("new", "child", "drop")
+
+
+@dataclass(frozen=True)
+class Terminal:
+    name: str
+    message: str | None = None      # error if current lexeme is not the terminal
+    method: str | None = None       # method of current node getting matched lexeme
+
+
+@dataclass(frozen=True)
+class Nonterminal:
+    name: str
+
+
+@dataclass(frozen=True)
+class Action:
+    kind: str                       # "new", "child" or "drop"
+    argument: str | None = None     # class of new node or method of node getting child
+
+
+Symbol = Terminal | Nonterminal | Action
+
+
+# Context-free grammar with semantic actions, see grammar.txt for format
+class Grammar:
+    def __init__(self, rules: dict[str, list[list[Symbol]]], errors: dict[str, str], start: str):
+        """
+        Initialize grammar
+
+        :param rules: nonterminal -> alternatives
+        :param errors: nonterminal -> error if no alternative starts with current lexeme
+        :param start: start nonterminal
+        """
+        self.rules = rules
+        self.errors = errors
+        self.start = start
+
+    @classmethod
+    def load(cls, path: str = GRAMMAR_PATH) -> "Grammar":
+        with open(path, encoding="utf-8") as f:
+            return cls.parse(f.read())
+
+    @classmethod
+    def parse(cls, text: str) -> "Grammar":
+        """
+        Parse grammar description
+
+        :param text: text of grammar
+        :return: Grammar object
+        :raise GrammarException: if grammar is wrong
+        """
+        tokens = TOKEN_REGEXP.findall("\n".join(line for line in text.splitlines()
+                                                if not line.lstrip().startswith("#")))
+        rules: dict[str, list[list[Symbol]]] = {}
+        errors: dict[str, str] = {}
+        start = None
+        name = None
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if i + 1 < len(tokens) and tokens[i + 1] == "->":
+                name = token
+                if name in rules:
+                    raise GrammarException(f"Правило {name} определено дважды")
+                rules[name] = [[]]
+                start = start or name
+                i += 2
+                continue
+            if name is None:
+                raise GrammarException(f"Символ {token} вне правила")
+            alternative = rules[name][-1]
+            if token == "|":
+                rules[name].append([])
+            elif token == "!":
+                if i + 1 == len(tokens) or not tokens[i + 1].startswith('"'):
+                    raise GrammarException(f"После ! в правиле {name} ожидается текст ошибки")
+                errors[name] = tokens[i + 1][1:-1]
+                i += 1
+            elif token.startswith('"'):
+                if not alternative or not isinstance(alternative[-1], Terminal):
+                    raise GrammarException(f"Текст ошибки {token} в правиле {name} должен следовать за терминалом")
+                terminal = alternative[-1]
+                alternative[-1] = Terminal(terminal.name, token[1:-1], terminal.method)
+            elif token.startswith("<"):
+                kind, *arguments = token[1:-1].split()
+                if kind not in ACTIONS or len(arguments) != (kind != "drop"):
+                    raise GrammarException(f"Неверное действие {token} в правиле {name}")
+                alternative.append(Action(kind, *arguments))
+            elif token[0].isupper():
+                terminal_name, _, method = token.partition(":")
+                if terminal_name != ANY and terminal_name not in LexemeType.__members__:
+                    raise GrammarException(f"Неизвестный терминал {terminal_name} в правиле {name}")
+                alternative.append(Terminal(terminal_name, None, method or None))
+            else:
+                alternative.append(Nonterminal(token))
+            i += 1
+
+        if start is None:
+            raise GrammarException("В грамматике нет правил")
+        for name, alternatives in rules.items():
+            for alternative in alternatives:
+                for symbol in alternative:
+                    if isinstance(symbol, Nonterminal) and symbol.name not in rules:
+                        raise GrammarException(f"Неизвестный нетерминал {symbol.name} в правиле {name}")
+        return cls(rules, errors, start)
+
+    def first_of(self, symbols: list[Symbol], first: dict[str, set[str]]) -> set[str]:
+        """
+        Get FIRST set of sequence of symbols
+
+        :param symbols: symbols, actions are skipped
+        :param first: FIRST sets of nonterminals
+        :return: terminals starting sequence, EMPTY if sequence derives empty string
+        """
+        result = set()
+        for symbol in symbols:
+            if isinstance(symbol, Terminal):
+                result.add(symbol.name)
+                return result
+            if isinstance(symbol, Nonterminal):
+                result |= first[symbol.name] - {EMPTY}
+                if EMPTY not in first[symbol.name]:
+                    return result
+        result.add(EMPTY)
+        return result
+
+    def first_sets(self) -> dict[str, set[str]]:
+        """
+        Compute FIRST sets of nonterminals
+
+        :return: nonterminal -> terminals starting it, EMPTY if it derives empty string
+        """
+        first = {name: set() for name in self.rules}
+        changed = True
+        while changed:
+            changed = False
+            for name, alternatives in self.rules.items():
+                for alternative in alternatives:
+                    symbols = self.first_of(alternative, first)
+                    if not symbols <= first[name]:
+                        first[name] |= symbols
+                        changed = True
+        return first
+
+    def follow_sets(self, first: dict[str, set[str]]) -> dict[str, set[str]]:
+        """
+        Compute FOLLOW sets of nonterminals
+
+        :param first: FIRST sets of nonterminals
+        :return: nonterminal -> terminals which can follow it
+        """
+        follow = {name: set() for name in self.rules}
+        changed = True
+        while changed:
+            changed = False
+            for name, alternatives in self.rules.items():
+                for alternative in alternatives:
+                    for i, symbol in enumerate(alternative):
+                        if not isinstance(symbol, Nonterminal):
+                            continue
+                        symbols = self.first_of(alternative[i + 1:], first)
+                        if EMPTY in symbols:
+                            symbols = (symbols - {EMPTY}) | follow[name]
+                        if not symbols <= follow[symbol.name]:
+                            follow[symbol.name] |= symbols
+                            changed = True
+        return follow
+
+    def build_table(self) -> dict:
+        """
+        Build LL(1) parse table. For every nonterminal the table keeps default alternative (empty one, or the only
+        one) and alternatives predicted by other lexemes, so lexemes leading to default are not stored
+
+        :return: table dict which can be written to JSON
+        :raise GrammarException: with all conflicts if grammar is not LL(1)
+        """
+        first = self.first_sets()
+        follow = self.follow_sets(first)
+        names = list(self.rules)
+        indices = {name: i for i, name in enumerate(names)}
+
+        conflicts = []
+        productions = []
+        defaults = []
+        predict = []
+        for name in names:
+            alternatives = self.rules[name]
+            default = None
+            predicted: dict[str, int] = {}
+            for alternative in alternatives:
+                production = len(productions)
+                productions.append([self.encode_symbol(symbol, indices) for symbol in alternative])
+                symbols = self.first_of(alternative, first)
+                if EMPTY in symbols:
+                    if default is not None and len(alternatives) > 1:
+                        conflicts.append(f"{name}: несколько альтернатив выводят пустую строку")
+                    # ANY in FOLLOW has the lowest priority, so it is not stored, empty alternative is default
+                    symbols = (symbols - {EMPTY}) | (follow[name] - {ANY})
+                    default = production
+                if ANY in symbols and len(alternatives) > 1:
+                    conflicts.append(f"{name}: альтернатива, начинающаяся с ANY, не единственная")
+                for symbol in symbols - {ANY}:
+                    if symbol in predicted and predicted[symbol] != production:
+                        conflicts.append(f"{name}: с {symbol} начинаются несколько альтернатив")
+                    predicted[symbol] = production
+            if default is None and len(alternatives) == 1:
+                default = len(productions) - 1
+            defaults.append(default)
+            codes = {LexemeType[symbol].value: production for symbol, production in predicted.items()}
+            predict.append({str(code): codes[code] for code in sorted(codes) if codes[code] != default})
+
+        if conflicts:
+            raise GrammarException("Грамматика не является LL(1):\n" + "\n".join(conflicts))
+        return {
+            "start": indices[self.start],
+            "nonterminals": names,
+            "errors": [self.errors.get(name) for name in names],
+            "defaults": defaults,
+            "predict": predict,
+            "productions": productions,
+        }
+
+    @staticmethod
+    def encode_symbol(symbol: Symbol, indices: dict[str, int]) -> list:
+        if isinstance(symbol, Terminal):
+            code = ANY_CODE if symbol.name == ANY else LexemeType[symbol.name].value
+            return ["t", code, symbol.message, symbol.method]
+        if isinstance(symbol, Nonterminal):
+            return ["n", indices[symbol.name]]
+        return [symbol.kind] if symbol.argument is None else [symbol.kind, symbol.argument]
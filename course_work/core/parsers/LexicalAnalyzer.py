@@ -2,13 +2,13 @@ from typing import Generator
 
 from course_work.core.data.lexemes import Lexeme
 from course_work.core.models.FiniteStateMachine import FiniteStateMachine
-from course_work.core.data.LexicalTable import LexicalTable
+from course_work.core.data.LexicalTable import LexicalTable, ReservedWords
 
 
 class LexicalAnalyzer(FiniteStateMachine):
     def __init__(self,
                  states: dict[str, dict[str, list[str | bool | None]]],
-                 lexical_table: dict[str, list[str]],
+                 lexical_table: LexicalTable | ReservedWords | dict[str, list[str]],
                  symbol_generator: Generator[str, None, None],
                  initial_state: str = "IN",
                  ):
@@ -17,7 +17,8 @@ class LexicalAnalyzer(FiniteStateMachine):
             symbol_generator,
             initial_state,
         )
-        self.lexical_table = LexicalTable(lexical_table)
+        # Table is created for every analysis unless given, reserved words are shared
+        self.lexical_table = lexical_table if isinstance(lexical_table, LexicalTable) else LexicalTable(lexical_table)
         self.current_lexeme: None | tuple[int, int, int] = None
         self.current_lexeme_is_completed = False
 
@@ -25,13 +26,13 @@ class LexicalAnalyzer(FiniteStateMachine):
     def add_number(self):
         token = self.accumulator
         self.lexical_table.add_number(token)
-        self.current_lexeme = self.lexical_table.get_lexeme_tuple(token, self.pointer - len(token) - 1)
+        self.current_lexeme = self.lexical_table.get_lexeme_tuple(token, self.token_start)
         self.current_lexeme_is_completed = True
         self.accumulator = ""
 
     def add_limiter(self):
         token = self.accumulator
-        self.current_lexeme = self.lexical_table.get_lexeme_tuple(token, self.pointer - len(token))
+        self.current_lexeme = self.lexical_table.get_lexeme_tuple(token, self.token_start)
         self.current_lexeme_is_completed = True
         self.accumulator = ""
 
@@ -39,12 +40,12 @@ class LexicalAnalyzer(FiniteStateMachine):
         token = self.accumulator
         if not self.lexical_table.check_identifier_is_keyword(token):
             self.lexical_table.add_identifier(token)
-        self.current_lexeme = self.lexical_table.get_lexeme_tuple(token, self.pointer - len(token) - 1)
+        self.current_lexeme = self.lexical_table.get_lexeme_tuple(token, self.token_start)
         self.current_lexeme_is_completed = True
         self.accumulator = ""
 
     def handle_finish(self):
-        self.current_lexeme = self.lexical_table.get_lexeme_tuple("@", self.pointer - 1)
+        self.current_lexeme = self.lexical_table.get_lexeme_tuple("@", self.pointer)
         self.current_lexeme_is_completed = True
 
     def make_step(self):
@@ -60,6 +61,9 @@ class LexemeIterator:
     def next_lexeme(self) -> Lexeme:
         self.lexical_analyzer.current_lexeme_is_completed = False
         while not self.lexical_analyzer.current_lexeme_is_completed:
+            # After the end of text the end lexeme is returned again
+            if self.lexical_analyzer.finished:
+                break
             self.lexical_analyzer.make_step()
 
         lexeme_tuple: tuple[int, int, int] = self.lexical_analyzer.current_lexeme
@@ -69,4 +73,79 @@ class LexemeIterator:
             lexeme_pointer=lexeme_tuple[2]
         )
 
-        return lexeme
\ No newline at end of file
+        return lexeme
+
+
+# Ring buffer of k lexemes read ahead of parser
+class LookaheadBuffer:
+    def __init__(self,
+                 lexeme_iterator: LexemeIterator,
+                 size: int = 2,
+                 ):
+        """
+        Initialize ring buffer of lookahead lexemes. Lexemes are read lazily, only when they are requested
+
+        :param lexeme_iterator: LexemeIterator object
+        :param size: maximal number of lexemes available for lookahead (k), including current one
+        """
+        self.lexeme_iterator = lexeme_iterator
+        self.size = size
+        self.lexemes: list[Lexeme | None] = [None] * size   # Ring of lexemes
+        self.codes: list[int] = [-1] * size                 # Integer codes of lexeme types
+        self.head = 0                                       # Position of current lexeme in ring
+        self.count = 0                                      # Number of read lexemes in ring
+
+    def fill(self, count: int):
+        """
+        Read lexemes until ring contains at least count lexemes
+
+        :param count: required number of lexemes
+        """
+        if count > self.size:
+            raise ValueError(f"Lookahead {count} exceeds buffer size {self.size}")
+        while self.count < count:
+            lexeme = self.lexeme_iterator.next_lexeme()
+            position = (self.head + self.count) % self.size
+            self.lexemes[position] = lexeme
+            self.codes[position] = lexeme.lexeme_type._value_
+            self.count += 1
+
+    def peek(self, offset: int = 0) -> Lexeme:
+        """
+        Get lexeme at offset from current one
+
+        :param offset: offset, 0 is current lexeme
+        :return: lexeme
+        """
+        self.fill(offset + 1)
+        return self.lexemes[(self.head + offset) % self.size]
+
+    def peek_code(self, offset: int = 0) -> int:
+        """
+        Get integer code of lexeme type at offset from current one
+
+        :param offset: offset, 0 is current lexeme
+        :return: integer code of LexemeType
+        """
+        self.fill(offset + 1)
+        return self.codes[(self.head + offset) % self.size]
+
+    def advance(self) -> int:
+        """
+        Drop current lexeme and read next one
+
+        :return: position of new current lexeme in ring
+        """
+        head = self.head + 1
+        if head == self.size:
+            head = 0
+        self.head = head
+        if self.count > 1:
+            self.count -= 1
+        else:
+            # Fast path without lookahead: only the current lexeme is kept
+            lexeme = self.lexeme_iterator.next_lexeme()
+            self.lexemes[head] = lexeme
+            self.codes[head] = lexeme.lexeme_type._value_
+            self.count = 1
+        return head
@@ -0,0 +1,223 @@
+import multiprocessing
+import queue
+from array import array
+from multiprocessing import shared_memory
+
+from course_work.core.data.lexemes import Lexeme, LexemeType, LexemeTableType
+from course_work.core.data.LexicalTable import LexicalTable, ReservedWords
+from course_work.core.exceptions import FiniteStateMachineException, PipelineException
+from course_work.core.parsers.LexicalAnalyzer import LexicalAnalyzer
+
+# Token record in ring: table number (type code), index in table, offset in text, 8 bytes each
+RECORD_FIELDS = 3
+RECORD_SIZE = RECORD_FIELDS * array("q").itemsize
+# Records are passed in blocks, so processes synchronize once per block, not once per token
+BLOCK_RECORDS = 4096
+RING_BLOCKS = 8
+# Parser checks that lexer process is alive once per this number of seconds while it waits for block
+POLL_SECONDS = 0.1
+
+TABLE_NUMBERS = LexemeTableType.NUMBERS.value
+TABLE_IDENTIFIERS = LexemeTableType.IDENTIFIERS.value
+
+
+def read_text(text: str):
+    for c in text:
+        yield c
+    yield "@"
+
+
+def run_lexer(states: dict,
+              reserved_words: ReservedWords,
+              text: str,
+              memory_name: str,
+              free_blocks,
+              ready_blocks,
+              ):
+    """
+    Lexer process: write token records to ring blocks. Every filled block is announced by message
+    (block, count, new numbers, new identifiers, finished, error), new strings of table are sent before records
+    using them. Error is (message, pointer) of lexical error or text of other error, exceptions are not sent, they
+    may be not picklable
+
+    :param states: states of lexical state machine
+    :param reserved_words: keywords and limiters
+    :param text: program text with new lines replaced by spaces
+    :param memory_name: name of shared memory of ring
+    :param free_blocks: semaphore counting blocks free for writing
+    :param ready_blocks: queue of messages about filled blocks
+    """
+    memory = shared_memory.SharedMemory(name=memory_name)
+    block = 0
+    sent_last = False
+    reason = "Лексический анализатор остановлен"
+    try:
+        lexer = LexicalAnalyzer(states, reserved_words, read_text(text))
+        table = lexer.lexical_table
+        sent_numbers = 0
+        sent_identifiers = 0
+        finished = False
+        while not finished:
+            records = array("q")
+            error = None
+            try:
+                while len(records) < BLOCK_RECORDS * RECORD_FIELDS:
+                    # The same steps as LexemeIterator.next_lexeme
+                    lexer.current_lexeme_is_completed = False
+                    while not lexer.current_lexeme_is_completed and not lexer.finished:
+                        lexer.make_step()
+                    records.extend(lexer.current_lexeme)
+                    if lexer.finished:
+                        finished = True
+                        break
+            except FiniteStateMachineException as e:
+                error, finished = (e.message, e.pointer), True
+            except Exception as e:
+                error, finished = f"{type(e).__name__}: {e}", True
+
+            free_blocks.acquire()
+            start = block * BLOCK_RECORDS * RECORD_SIZE
+            memory.buf[start:start + len(records) * records.itemsize] = records.tobytes()
+            ready_blocks.put((
+                block,
+                len(records) // RECORD_FIELDS,
+                table.numbers[sent_numbers:],
+                table.identifiers[sent_identifiers:],
+                finished,
+                error,
+            ))
+            sent_last = finished
+            sent_numbers = len(table.numbers)
+            sent_identifiers = len(table.identifiers)
+            block = (block + 1) % RING_BLOCKS
+    except Exception as e:
+        reason = f"{type(e).__name__}: {e}"
+    finally:
+        # Parser waits for messages until the last one, so it is sent whatever stopped the lexer
+        if not sent_last:
+            ready_blocks.put((block, 0, [], [], True, reason))
+        memory.close()
+
+
+# Lexeme iterator reading tokens produced by lexer in separate process. Lexer and parser work at the same time, so
+# on multi-core machine lexing time is hidden behind parsing. Lexical table is a replica of lexer's one: its numbers
+# and identifiers are added in the same order, so indices of records are the same in both tables.
+class PipelinedLexemeIterator:
+    def __init__(self,
+                 states: dict,
+                 reserved_words: ReservedWords,
+                 text: str,
+                 ):
+        """
+        Start lexer process
+
+        :param states: states of lexical state machine
+        :param reserved_words: keywords and limiters
+        :param text: program text with new lines replaced by spaces
+        """
+        self.lexical_table = LexicalTable(reserved_words)
+        self.memory = shared_memory.SharedMemory(create=True, size=RING_BLOCKS * BLOCK_RECORDS * RECORD_SIZE)
+        self.free_blocks = multiprocessing.Semaphore(RING_BLOCKS)
+        self.ready_blocks = multiprocessing.Queue()
+        self.process = multiprocessing.Process(
+            target=run_lexer,
+            args=(states, reserved_words, text, self.memory.name, self.free_blocks, self.ready_blocks),
+            daemon=True,
+        )
+        self.process.start()
+
+        # Lexemes of current block
+        self.lexemes: list[Lexeme] = []
+        self.position = 0
+        self.error = None
+        self.last_lexeme: Lexeme | None = None
+
+        # Types and values of keywords and limiters: (table number, index) -> (type, value)
+        self.reserved = {}
+        for index, keyword in enumerate(reserved_words.keywords):
+            self.reserved[(LexemeTableType.KEYWORDS.value, index)] = (LexemeType(index), keyword)
+        for index, limiter in enumerate(reserved_words.limiters):
+            self.reserved[(LexemeTableType.LIMITERS.value, index)] = (
+                LexemeType(len(reserved_words.keywords) + index),
+                limiter,
+            )
+
+    def next_lexeme(self) -> Lexeme:
+        while self.position == len(self.lexemes):
+            if self.error is not None:
+                error, self.error = self.error, None
+                self.close()
+                if isinstance(error, tuple):
+                    raise FiniteStateMachineException(*error)
+                raise PipelineException(f"Ошибка процесса лексического анализатора: {error}")
+            if self.process is None:
+                # After the end of text the end lexeme is returned again
+                return self.last_lexeme
+            self.read_block()
+        lexeme = self.lexemes[self.position]
+        self.position += 1
+        self.last_lexeme = lexeme
+        return lexeme
+
+    def read_block(self):
+        """
+        Wait for next filled block and convert its records to lexemes
+
+        :raise PipelineException: if lexer process exited without the last message
+        """
+        while True:
+            try:
+                message = self.ready_blocks.get(timeout=POLL_SECONDS)
+                break
+            except queue.Empty:
+                exitcode = self.process.exitcode
+                if exitcode is not None:
+                    self.close()
+                    raise PipelineException(f"Процесс лексического анализатора завершился с кодом {exitcode}")
+        block, count, numbers, identifiers, finished, error = message
+        table = self.lexical_table
+        for number in numbers:
+            table.add_number(number)
+        for identifier in identifiers:
+            table.add_identifier(identifier)
+
+        start = block * BLOCK_RECORDS * RECORD_SIZE
+        records = array("q", bytes(self.memory.buf[start:start + count * RECORD_SIZE]))
+        self.free_blocks.release()
+
+        reserved = self.reserved
+        lexemes = []
+        for i in range(0, len(records), RECORD_FIELDS):
+            table_number, index, pointer = records[i], records[i + 1], records[i + 2]
+            if table_number == TABLE_NUMBERS:
+                lexemes.append(Lexeme(table.numbers[index], LexemeType.NUMBER, pointer))
+            elif table_number == TABLE_IDENTIFIERS:
+                lexemes.append(Lexeme(table.identifiers[index], LexemeType.IDENTIFIER, pointer))
+            else:
+                lexeme_type, value = reserved[(table_number, index)]
+                lexemes.append(Lexeme(value, lexeme_type, pointer))
+        self.lexemes = lexemes
+        self.position = 0
+        self.error = error
+        if finished and error is None:
+            self.close()
+
+    def close(self):
+        """
+        Stop lexer process and release shared memory
+        """
+        if self.process is None:
+            return
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.process = None
+        self.ready_blocks.close()
+        self.memory.close()
+        self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,152 @@
+import copy
+
+from course_work.core.models.AbstractSyntaxTree2 import (
+    Node,
+    ExpressionNode,
+    OperandNode,
+    TermNode,
+    FactorNode,
+    UnaryOperationNode,
+)
+from course_work.core.parsers.SyntaxAnalyzer import (
+    SyntaxAnalyzer,
+    RELATION_CODES,
+    ADDITION_CODES,
+    MULTIPLICATION_CODES,
+    BOOL_CODES,
+    IDENTIFIER,
+    NUMBER,
+)
+
+# Precedence level of operation codes: 0 - relations, 1 - additions, 2 - multiplications
+OPERATION_LEVELS: dict[int, int] = {
+    **{code: 0 for code in RELATION_CODES},
+    **{code: 1 for code in ADDITION_CODES},
+    **{code: 2 for code in MULTIPLICATION_CODES},
+}
+
+# Chain node class of every precedence level
+CHAIN_CLASSES = (ExpressionNode, OperandNode, TermNode)
+
+# Nodes that can stand in place of expression
+EXPRESSION_CLASSES = (ExpressionNode, OperandNode, TermNode, FactorNode, UnaryOperationNode)
+
+# Codes of lexemes that are stored in FactorNode directly
+SIMPLE_FACTOR_CODES = frozenset((IDENTIFIER, NUMBER, *BOOL_CODES))
+
+
+# Syntax parser with operator-precedence expression engine
+class PrattSyntaxAnalyzer(SyntaxAnalyzer):
+    """
+    Expressions are parsed by precedence climbing into flat chains: a level node (ExpressionNode, OperandNode,
+    TermNode) is created only if it has operations, so "a" is a single FactorNode and "a + b * c" is an
+    OperandNode of FactorNode and TermNode. Types, semantic checks and error positions are the same as in
+    SyntaxAnalyzer, the full tree is available through expand()
+    """
+
+    def func_expression(self):
+        operand = self.func_primary()
+        chains: list[Node] = []     # Open chains, precedence level grows to the top of stack
+        levels: list[int] = []
+
+        level = OPERATION_LEVELS.get(self.current_code)
+        while level is not None:
+            # Operations of higher precedence are completed by the operand
+            while levels and levels[-1] > level:
+                levels.pop()
+                chain = chains.pop()
+                chain.children['operands'].append(operand)
+                operand = chain
+
+            if levels and levels[-1] == level:
+                chain = chains[-1]
+                chain.children['operands'].append(operand)
+            else:
+                chain = CHAIN_CLASSES[level](self.AST, operand.starting_lexeme)
+                chain.children['operands'].append(operand)
+                chains.append(chain)
+                levels.append(level)
+
+            chain.children['operations'].append(self.current_lexeme)
+            self.read_next_lexeme()
+            operand = self.func_primary()
+            level = OPERATION_LEVELS.get(self.current_code)
+
+        while chains:
+            chain = chains.pop()
+            chain.children['operands'].append(operand)
+            operand = chain
+
+        return operand
+
+    def func_primary(self):
+        if self.current_code in SIMPLE_FACTOR_CODES:
+            factor_node = FactorNode(
+                self.AST,
+                self.current_lexeme
+            )
+            factor_node.set_value(self.current_lexeme)
+            self.read_next_lexeme()
+            return factor_node
+        return self.func_factor()
+
+
+def expand_expression(node: Node, level: int = 0) -> Node:
+    """
+    Get full ExpressionNode -> OperandNode -> TermNode -> FactorNode view of flat expression
+
+    :param node: flat expression node
+    :param level: level of required node: 0 - expression, 1 - operand, 2 - term, 3 - factor
+    :return: expanded node
+    """
+    if isinstance(node, UnaryOperationNode):
+        # Negated value is a factor
+        unary_node = copy.copy(node)
+        unary_node.children = {"value": expand_expression(node.children['value'], len(CHAIN_CLASSES))}
+        return unary_node
+
+    if level == len(CHAIN_CLASSES):
+        if isinstance(node, FactorNode):
+            value = getattr(node, "value", None)
+            if not isinstance(value, Node):
+                return node
+            factor_node = copy.copy(node)
+            factor_node.value = expand_expression(value)
+            return factor_node
+        factor_node = FactorNode(node.tree, node.starting_lexeme)
+        factor_node.value = expand_expression(node)
+        return factor_node
+
+    chain_class = CHAIN_CLASSES[level]
+    if type(node) is chain_class:
+        chain = copy.copy(node)
+        chain.children = {
+            "operands": [expand_expression(operand, level + 1) for operand in node.children['operands']],
+            "operations": node.children['operations'],
+        }
+        return chain
+
+    chain = chain_class(node.tree, node.starting_lexeme)
+    chain.children['operands'].append(expand_expression(node, level + 1))
+    return chain
+
+
+def expand(node: Node) -> Node:
+    """
+    Get view of tree with expanded expressions, to_string of which is the same as for SyntaxAnalyzer tree
+
+    :param node: root of tree built by PrattSyntaxAnalyzer
+    :return: root of expanded tree
+    """
+    if isinstance(node, EXPRESSION_CLASSES):
+        return expand_expression(node)
+
+    expanded = copy.copy(node)
+    expanded.children = {}
+    for key, child in node.children.items():
+        if isinstance(child, Node):
+            child = expand(child)
+        elif isinstance(child, list):
+            child = [expand(item) if isinstance(item, Node) else item for item in child]
+        expanded.children[key] = child
+    return expanded
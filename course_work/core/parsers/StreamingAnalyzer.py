@@ -0,0 +1,89 @@
+from typing import Generator
+
+from course_work.core.models.AbstractSyntaxTree2 import Node, ProgramNode
+from course_work.core.parsers.SyntaxAnalyzer import (
+    SyntaxAnalyzer,
+    K_BEGIN,
+    K_END,
+    K_PROGRAM,
+    K_VAR,
+    LIM_END,
+    LIM_SEMICOLON,
+)
+
+
+# Streaming analysis of program: descriptions and top-level operators are parsed, checked and given to caller one
+# at a time, and program node does not keep them. Memory depends on the largest top-level operator and number of
+# variables, not on length of program.
+class StreamingAnalyzer:
+    def __init__(self, parser: SyntaxAnalyzer, release_numbers: bool = True):
+        """
+        Initialize streaming analyzer
+
+        :param parser: syntax analyzer over lexemes of program, its parsing rules are used for every statement
+        :param release_numbers: remove numbers from lexical table after every operator
+        """
+        self.parser = parser
+        self.release_numbers = release_numbers
+        # Sites of definitions and uses grow with length of program, they are not needed to check it
+        parser.AST.symbols.record_sites = False
+        self.assigned = 0       # Bit vector of variable slots definitely assigned after checked operators
+        self.descriptions = 0   # Number of checked descriptions
+        self.operators = 0      # Number of checked top-level operators
+
+    def parse(self) -> Generator[tuple[str, Node], None, None]:
+        """
+        Parse and check program statement by statement. Operator is checked before the next one is parsed, so
+        semantic error of operator is reported even if the program has syntax error after it, and when operator has
+        both type and initialization errors, type error is reported even if initialization error is earlier in text
+
+        :return: generator of pairs: key of program node children ("descriptions" or "operators") and checked node
+        """
+        parser = self.parser
+        tree = parser.AST
+        parser.read_next_lexeme()
+        tree.root = parser.new_node(ProgramNode)
+        if parser.current_code == K_PROGRAM:
+            parser.read_next_lexeme()
+        else:
+            parser.raise_exception("Неверное начало программы!")
+        if parser.current_code == K_VAR:
+            parser.read_next_lexeme()
+        else:
+            parser.raise_exception("Неверное начало описания!")
+
+        # Variables are added to symbol table while descriptions are parsed
+        yield "descriptions", self.check_description(parser.func_description())
+        while parser.current_code == LIM_SEMICOLON:
+            parser.read_next_lexeme()
+            yield "descriptions", self.check_description(parser.func_description())
+
+        if parser.current_code == K_BEGIN:
+            parser.read_next_lexeme()
+        else:
+            parser.raise_exception("Неверное начало программы!")
+
+        yield "operators", self.check_operator(parser.func_operator())
+        while parser.current_code == LIM_SEMICOLON:
+            parser.read_next_lexeme()
+            yield "operators", self.check_operator(parser.func_operator())
+
+        if parser.current_code != K_END:
+            parser.raise_exception("Неверное завершение программы!")
+        parser.read_next_lexeme()
+        if parser.current_code != LIM_END:
+            parser.raise_exception("Неверное завершение программы!")
+
+    def check_description(self, description_node: Node) -> Node:
+        description_node.semantic_check()
+        self.descriptions += 1
+        return description_node
+
+    def check_operator(self, operator_node: Node) -> Node:
+        operator_node.semantic_check()
+        # Top-level operators follow each other, so state after previous ones is state before this one
+        self.assigned = self.parser.AST.check_definite_assignment([operator_node], self.assigned)
+        self.operators += 1
+        if self.release_numbers:
+            self.parser.lexical_table.clear_numbers()
+        return operator_node
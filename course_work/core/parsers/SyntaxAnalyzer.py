@@ -9,6 +9,7 @@ from course_work.core.data.LexicalTable import (
 
 from course_work.core.models.AbstractSyntaxTree2 import (
     AbstractSyntaxTree,
+    Node,
     ProgramNode,
     DescriptionNode,
     CompositeOperatorNode,
@@ -24,38 +25,100 @@ from course_work.core.models.AbstractSyntaxTree2 import (
     FactorNode,
     UnaryOperationNode,
 )
-from course_work.core.parsers.LexicalAnalyzer import LexemeIterator
-
-
-class SyntaxException(Exception):
-    def __init__(self, message: str, lexeme: Lexeme | None = None, *args):
-        self.lexeme = lexeme
-        self.message = message
-        super().__init__(self.message, *args)
+from course_work.core.exceptions import SyntaxException
+from course_work.core.parsers.LexicalAnalyzer import LexemeIterator, LookaheadBuffer
+
+# Integer codes of lexeme types, compared instead of LexemeType values
+K_TRUE = LexemeType.K_TRUE.value
+K_FALSE = LexemeType.K_FALSE.value
+K_PROGRAM = LexemeType.K_PROGRAM.value
+K_VAR = LexemeType.K_VAR.value
+K_END = LexemeType.K_END.value
+K_BEGIN = LexemeType.K_BEGIN.value
+K_INT = LexemeType.K_INT.value
+K_FLOAT = LexemeType.K_FLOAT.value
+K_BOOL = LexemeType.K_BOOL.value
+K_IF = LexemeType.K_IF.value
+K_ELSE = LexemeType.K_ELSE.value
+K_FOR = LexemeType.K_FOR.value
+K_TO = LexemeType.K_TO.value
+K_STEP = LexemeType.K_STEP.value
+K_NEXT = LexemeType.K_NEXT.value
+K_WHILE = LexemeType.K_WHILE.value
+K_READLN = LexemeType.K_READLN.value
+K_WRITELN = LexemeType.K_WRITELN.value
+LIM_COMMA = LexemeType.LIM_COMMA.value
+LIM_NOT = LexemeType.LIM_NOT.value
+LIM_SEMICOLON = LexemeType.LIM_SEMICOLON.value
+LIM_OPEN_PAREN = LexemeType.LIM_OPEN_PAREN.value
+LIM_CLOSE_PAREN = LexemeType.LIM_CLOSE_PAREN.value
+LIM_ASSIGN = LexemeType.LIM_ASSIGN.value
+LIM_END = LexemeType.LIM_END.value
+NUMBER = LexemeType.NUMBER.value
+IDENTIFIER = LexemeType.IDENTIFIER.value
+
+TYPE_CODES = frozenset((K_INT, K_FLOAT, K_BOOL))
+BOOL_CODES = frozenset((K_TRUE, K_FALSE))
+RELATION_CODES = frozenset(lexeme_type.value for lexeme_type in (
+    LexemeType.LIM_EQ,
+    LexemeType.LIM_NE,
+    LexemeType.LIM_GT,
+    LexemeType.LIM_GTE,
+    LexemeType.LIM_LT,
+    LexemeType.LIM_LTE,
+))
+ADDITION_CODES = frozenset(lexeme_type.value for lexeme_type in (
+    LexemeType.LIM_PLUS,
+    LexemeType.LIM_OR,
+    LexemeType.LIM_MINUS,
+))
+MULTIPLICATION_CODES = frozenset(lexeme_type.value for lexeme_type in (
+    LexemeType.LIM_MUL,
+    LexemeType.LIM_DIV,
+    LexemeType.LIM_AND,
+))
+
+# FIRST sets of operator productions: lexeme code -> rule
+OPERATOR_DISPATCH = {
+    K_BEGIN: "func_composite_operator",
+    IDENTIFIER: "func_assignment_operator",
+    K_IF: "func_condition_operator",
+    K_FOR: "func_fixed_loop_operator",
+    K_WHILE: "func_conditional_loop_operator",
+    K_READLN: "func_read",
+    K_WRITELN: "func_write",
+}
 
 
 # Syntax parser
 class SyntaxAnalyzer:
-    def __init__(self, lexical_table: LexicalTable, lexeme_iterator: LexemeIterator):
+    def __init__(self, lexical_table: LexicalTable, lexeme_iterator: LexemeIterator, lookahead: int = 2):
         self.lexical_table = lexical_table          # LexicalTable object
         self.lexeme_iterator = lexeme_iterator      # LexemeIterator object
+        self.lexemes = LookaheadBuffer(             # Ring buffer of lookahead lexemes
+            lexeme_iterator,
+            lookahead,
+        )
         self.current_lexeme: Lexeme | None = None   # Current lexeme
+        self.current_code: int = -1                 # Integer code of current lexeme type
         self.AST = AbstractSyntaxTree()
 
     def read_next_lexeme(self):
         """
         Read next lexeme and save it in current lexeme
         """
-        self.current_lexeme = self.lexeme_iterator.next_lexeme()
+        head = self.lexemes.advance()
+        self.current_lexeme = self.lexemes.lexemes[head]
+        self.current_code = self.lexemes.codes[head]
 
-    def check_current_lexeme(self, *args):
+    def peek_code(self, offset: int = 1) -> int:
         """
-        Checks lexeme corresponding provided type
+        Get integer code of lexeme type after the current one
 
-        :param args: list of lexeme type options
-        :return: true if lexeme corresponds at least one option else false
+        :param offset: offset from current lexeme
+        :return: integer code of LexemeType
         """
-        return any(self.current_lexeme.lexeme_type == lexeme_type for lexeme_type in args)
+        return self.lexemes.peek_code(offset)
 
     def raise_exception(self, message):
         """
@@ -68,44 +131,50 @@ class SyntaxAnalyzer:
             self.current_lexeme,
         )
 
+    def new_node(self, node_class: type[Node]) -> Node:
+        """
+        Create node of tree starting at current lexeme
+
+        :param node_class: class of node
+        :return: new node
+        """
+        return node_class(self.AST, self.current_lexeme)
+
     # Recursive functions
     def func_program(self):
-        program_node = ProgramNode(
-            self.AST,
-            self.current_lexeme,
-        )
-        if self.check_current_lexeme(LexemeType.K_PROGRAM):
+        program_node = self.new_node(ProgramNode)
+        if self.current_code == K_PROGRAM:
             self.read_next_lexeme()
         else:
             self.raise_exception("Неверное начало программы!")
-        if self.check_current_lexeme(LexemeType.K_VAR):
+        if self.current_code == K_VAR:
             self.read_next_lexeme()
         else:
             self.raise_exception("Неверное начало описания!")
 
         program_node.add_description_node(self.func_description())
-        while self.check_current_lexeme(LexemeType.LIM_SEMICOLON):
+        while self.current_code == LIM_SEMICOLON:
             self.read_next_lexeme()
             program_node.add_description_node(self.func_description())
 
-        if self.check_current_lexeme(LexemeType.K_BEGIN):
+        if self.current_code == K_BEGIN:
             self.read_next_lexeme()
         else:
             self.raise_exception("Неверное начало программы!")
 
         program_node.add_operator_node(self.func_operator())
-        while self.check_current_lexeme(LexemeType.LIM_SEMICOLON):
+        while self.current_code == LIM_SEMICOLON:
             self.read_next_lexeme()
             program_node.add_operator_node(self.func_operator())
 
-        if self.check_current_lexeme(LexemeType.K_END):
+        if self.current_code == K_END:
             pass
         else:
             self.raise_exception("Неверное завершение программы!")
 
         self.read_next_lexeme()
 
-        if self.check_current_lexeme(LexemeType.LIM_END):
+        if self.current_code == LIM_END:
             pass
         else:
             self.raise_exception("Неверное завершение программы!")
@@ -113,25 +182,22 @@ class SyntaxAnalyzer:
         return program_node
 
     def func_description(self):
-        description_node = DescriptionNode(
-            self.AST,
-            self.current_lexeme,
-        )
-        if self.check_current_lexeme(LexemeType.K_INT, LexemeType.K_FLOAT, LexemeType.K_BOOL):
+        description_node = self.new_node(DescriptionNode)
+        if self.current_code in TYPE_CODES:
             description_node.set_variable_type_lexeme(self.current_lexeme)
             self.read_next_lexeme()
         else:
             self.raise_exception(f"Неверное описание программы!")
 
-        if self.check_current_lexeme(LexemeType.IDENTIFIER):
+        if self.current_code == IDENTIFIER:
             description_node.add_variable(self.current_lexeme)
             self.read_next_lexeme()
         else:
             self.raise_exception("Неверное объявление типов!")
 
-        while self.check_current_lexeme(LexemeType.LIM_COMMA):
+        while self.current_code == LIM_COMMA:
             self.read_next_lexeme()
-            if self.check_current_lexeme(LexemeType.IDENTIFIER):
+            if self.current_code == IDENTIFIER:
                 description_node.add_variable(self.current_lexeme)
                 self.read_next_lexeme()
             else:
@@ -140,39 +206,24 @@ class SyntaxAnalyzer:
         return description_node
 
     def func_operator(self):
-        if self.check_current_lexeme(LexemeType.K_BEGIN):
-            return self.func_composite_operator()
-        elif self.check_current_lexeme(LexemeType.IDENTIFIER):
-            return self.func_assignment_operator()
-        elif self.check_current_lexeme(LexemeType.K_IF):
-            return self.func_condition_operator()
-        elif self.check_current_lexeme(LexemeType.K_FOR):
-            return self.func_fixed_loop_operator()
-        elif self.check_current_lexeme(LexemeType.K_WHILE):
-            return self.func_conditional_loop_operator()
-        elif self.check_current_lexeme(LexemeType.K_READLN):
-            return self.func_read()
-        elif self.check_current_lexeme(LexemeType.K_WRITELN):
-            return self.func_write()
-        else:
+        rule = OPERATOR_DISPATCH.get(self.current_code)
+        if rule is None:
             self.raise_exception("Неверный синтаксис оператора!")
+        return getattr(self, rule)()
 
     def func_composite_operator(self):
-        composite_operator_node = CompositeOperatorNode(
-            self.AST,
-            self.current_lexeme,
-        )
-        if self.check_current_lexeme(LexemeType.K_BEGIN):
+        composite_operator_node = self.new_node(CompositeOperatorNode)
+        if self.current_code == K_BEGIN:
             self.read_next_lexeme()
         else:
             self.raise_exception("Неверное начало составного оператора!")
 
         composite_operator_node.add_operator_node(self.func_operator())
-        while self.check_current_lexeme(LexemeType.LIM_SEMICOLON):
+        while self.current_code == LIM_SEMICOLON:
             self.read_next_lexeme()
             composite_operator_node.add_operator_node(self.func_operator())
 
-        if self.check_current_lexeme(LexemeType.K_END):
+        if self.current_code == K_END:
             self.read_next_lexeme()
         else:
             self.raise_exception("Неверное завершение составного оператора!")
@@ -180,15 +231,12 @@ class SyntaxAnalyzer:
         return composite_operator_node
 
     def func_assignment_operator(self):
-        assignment_operator_node = AssignmentOperatorNode(
-            self.AST,
-            self.current_lexeme,
-        )
-        if not self.check_current_lexeme(LexemeType.IDENTIFIER):
+        assignment_operator_node = self.new_node(AssignmentOperatorNode)
+        if self.current_code != IDENTIFIER:
             self.raise_exception("Неверное начало оператор присвоения!")
         assignment_operator_node.set_identifier(self.current_lexeme)
         self.read_next_lexeme()
-        if not self.check_current_lexeme(LexemeType.LIM_ASSIGN):
+        if self.current_code != LIM_ASSIGN:
             self.raise_exception("При присвоении после идентификатора должен следовать оператор присвоения!")
         self.read_next_lexeme()
         assignment_operator_node.set_expression_node(self.func_expression())
@@ -196,64 +244,58 @@ class SyntaxAnalyzer:
         return assignment_operator_node
 
     def func_condition_operator(self):
-        condition_operator_node = ConditionalOperatorNode(
-            self.AST,
-            self.current_lexeme,
-        )
-        if not self.check_current_lexeme(LexemeType.K_IF):
+        condition_operator_node = self.new_node(ConditionalOperatorNode)
+        if self.current_code != K_IF:
             self.raise_exception("Неверное начало условного оператора!")
         self.read_next_lexeme()
-        if not self.check_current_lexeme(LexemeType.LIM_OPEN_PAREN):
+        if self.current_code != LIM_OPEN_PAREN:
             self.raise_exception("Выражение условного оператора должно быть заключено в скобки!")
         self.read_next_lexeme()
         condition_operator_node.set_condition_expression_node(self.func_expression())
-        if not self.check_current_lexeme(LexemeType.LIM_CLOSE_PAREN):
+        if self.current_code != LIM_CLOSE_PAREN:
             self.raise_exception("Выражение условного оператора должно быть заключено в скобки!")
         self.read_next_lexeme()
         condition_operator_node.set_if_operator(self.func_operator())
-        self.read_next_lexeme()
-        if self.check_current_lexeme(LexemeType.K_ELSE):
+        # Lexeme after body is skipped (ANY of grammar), else branch is predicted by the lexeme following it
+        if self.peek_code(1) == K_ELSE:
+            self.read_next_lexeme()
             self.read_next_lexeme()
             condition_operator_node.set_else_operator(self.func_operator())
+        else:
+            self.read_next_lexeme()
 
         return condition_operator_node
 
     def func_fixed_loop_operator(self):
-        fixed_loop_operator_node = FixedLoopOperatorNode(
-            self.AST,
-            self.current_lexeme,
-        )
-        if not self.check_current_lexeme(LexemeType.K_FOR):
+        fixed_loop_operator_node = self.new_node(FixedLoopOperatorNode)
+        if self.current_code != K_FOR:
             self.raise_exception("Неверное начало оператора фиксированного цикла!")
         self.read_next_lexeme()
         fixed_loop_operator_node.set_assignment_operator_node(self.func_assignment_operator())
-        if not self.check_current_lexeme(LexemeType.K_TO):
+        if self.current_code != K_TO:
             self.raise_exception("Неверный синтаксис оператора фиксированного цикла!")
         self.read_next_lexeme()
         fixed_loop_operator_node.set_condition_expression_node(self.func_expression())
-        if self.check_current_lexeme(LexemeType.K_STEP):
+        if self.current_code == K_STEP:
             self.read_next_lexeme()
             fixed_loop_operator_node.set_step_expression_node(self.func_expression())
         fixed_loop_operator_node.set_operator_node(self.func_operator())
-        if not self.check_current_lexeme(LexemeType.K_NEXT):
+        if self.current_code != K_NEXT:
             self.raise_exception("Неверное завершение оператора фиксированного цикла!")
         self.read_next_lexeme()
 
         return fixed_loop_operator_node
 
     def func_conditional_loop_operator(self):
-        conditional_loop_operator_node = ConditionalLoopOperatorNode(
-            self.AST,
-            self.current_lexeme,
-        )
-        if not self.check_current_lexeme(LexemeType.K_WHILE):
+        conditional_loop_operator_node = self.new_node(ConditionalLoopOperatorNode)
+        if self.current_code != K_WHILE:
             self.raise_exception("Неверное начало оператора условного цикла!")
         self.read_next_lexeme()
-        if not self.check_current_lexeme(LexemeType.LIM_OPEN_PAREN):
+        if self.current_code != LIM_OPEN_PAREN:
             self.raise_exception("Выражение оператора условного цикла должно быть заключено в скобки!")
         self.read_next_lexeme()
         conditional_loop_operator_node.set_condition_expression_node(self.func_expression())
-        if not self.check_current_lexeme(LexemeType.LIM_CLOSE_PAREN):
+        if self.current_code != LIM_CLOSE_PAREN:
             self.raise_exception("Выражение оператора условного цикла должно быть заключено в скобки!")
         self.read_next_lexeme()
         conditional_loop_operator_node.set_while_operator(self.func_operator())
@@ -262,24 +304,21 @@ class SyntaxAnalyzer:
         return conditional_loop_operator_node
 
     def func_read(self):
-        read_operator_node = ReadOperationNode(
-            self.AST,
-            self.current_lexeme,
-        )
-        if self.check_current_lexeme(LexemeType.K_READLN):
+        read_operator_node = self.new_node(ReadOperationNode)
+        if self.current_code == K_READLN:
             self.read_next_lexeme()
         else:
             self.raise_exception(f"Неверное начало оператора ввода!")
 
-        if self.check_current_lexeme(LexemeType.IDENTIFIER):
+        if self.current_code == IDENTIFIER:
             read_operator_node.add_variable(self.current_lexeme)
             self.read_next_lexeme()
         else:
             self.raise_exception("Оператор ввода должен принимать идентификаторы!")
 
-        while self.check_current_lexeme(LexemeType.LIM_COMMA):
+        while self.current_code == LIM_COMMA:
             self.read_next_lexeme()
-            if self.check_current_lexeme(LexemeType.IDENTIFIER):
+            if self.current_code == IDENTIFIER:
                 read_operator_node.add_variable(self.current_lexeme)
                 self.read_next_lexeme()
             else:
@@ -289,36 +328,24 @@ class SyntaxAnalyzer:
 
 
     def func_write(self):
-        write_operator_node = WriteOperationNode(
-            self.AST,
-            self.current_lexeme
-        )
-        if self.check_current_lexeme(LexemeType.K_WRITELN):
+        write_operator_node = self.new_node(WriteOperationNode)
+        if self.current_code == K_WRITELN:
             self.read_next_lexeme()
         else:
             self.raise_exception(f"Неверное начало оператора вывода!")
 
         write_operator_node.add_expression_node(self.func_expression())
 
-        while self.check_current_lexeme(LexemeType.LIM_COMMA):
+        while self.current_code == LIM_COMMA:
             self.read_next_lexeme()
             write_operator_node.add_expression_node(self.func_expression())
 
         return write_operator_node
 
     def func_expression(self):
-        expression_node = ExpressionNode(
-            self.AST,
-            self.current_lexeme
-        )
+        expression_node = self.new_node(ExpressionNode)
         expression_node.add_operand_node(self.func_operand())
-        while self.check_current_lexeme(
-                LexemeType.LIM_EQ,
-                LexemeType.LIM_NE,
-                LexemeType.LIM_GT,
-                LexemeType.LIM_GTE,
-                LexemeType.LIM_LT,
-                LexemeType.LIM_LTE):
+        while self.current_code in RELATION_CODES:
             expression_node.add_operation_lexeme(self.current_lexeme)
             self.read_next_lexeme()
             expression_node.add_operand_node(self.func_operand())
@@ -326,15 +353,9 @@ class SyntaxAnalyzer:
         return expression_node
 
     def func_operand(self):
-        operand_node = OperandNode(
-            self.AST,
-            self.current_lexeme
-        )
+        operand_node = self.new_node(OperandNode)
         operand_node.add_term_node(self.func_term())
-        while self.check_current_lexeme(
-                LexemeType.LIM_PLUS,
-                LexemeType.LIM_OR,
-                LexemeType.LIM_MINUS):
+        while self.current_code in ADDITION_CODES:
             operand_node.add_operation_lexeme(self.current_lexeme)
             self.read_next_lexeme()
             operand_node.add_term_node(self.func_term())
@@ -342,15 +363,9 @@ class SyntaxAnalyzer:
         return operand_node
 
     def func_term(self):
-        term_node = TermNode(
-            self.AST,
-            self.current_lexeme
-        )
+        term_node = self.new_node(TermNode)
         term_node.add_factor_node(self.func_factor())
-        while self.check_current_lexeme(
-                LexemeType.LIM_MUL,
-                LexemeType.LIM_DIV,
-                LexemeType.LIM_AND):
+        while self.current_code in MULTIPLICATION_CODES:
             term_node.add_operation_lexeme(self.current_lexeme)
             self.read_next_lexeme()
             term_node.add_factor_node(self.func_factor())
@@ -358,30 +373,25 @@ class SyntaxAnalyzer:
         return term_node
 
     def func_factor(self):
-        factor_node = FactorNode(
-            self.AST,
-            self.current_lexeme
-        )
-        if self.check_current_lexeme(LexemeType.IDENTIFIER):
+        factor_node = self.new_node(FactorNode)
+        if self.current_code == IDENTIFIER:
             factor_node.set_value(self.current_lexeme)
             self.read_next_lexeme()
-        elif self.check_current_lexeme(LexemeType.NUMBER):
+        elif self.current_code == NUMBER:
             factor_node.set_value(self.current_lexeme)
             self.read_next_lexeme()
-        elif self.check_current_lexeme(LexemeType.K_FALSE, LexemeType.K_TRUE):
+        elif self.current_code in BOOL_CODES:
             factor_node.set_value(self.current_lexeme)
             self.read_next_lexeme()
-        elif self.check_current_lexeme(LexemeType.LIM_NOT):
-            unary_operation_node = UnaryOperationNode(
-                self.AST,
-                self.current_lexeme
-            )
+        elif self.current_code == LIM_NOT:
+            unary_operation_node = self.new_node(UnaryOperationNode)
             self.read_next_lexeme()
             unary_operation_node.set_value(self.func_factor())
-        elif self.check_current_lexeme(LexemeType.LIM_OPEN_PAREN):
+            factor_node.set_value(unary_operation_node)
+        elif self.current_code == LIM_OPEN_PAREN:
             self.read_next_lexeme()
             factor_node.set_value(self.func_expression())
-            if not self.check_current_lexeme(LexemeType.LIM_CLOSE_PAREN):
+            if self.current_code != LIM_CLOSE_PAREN:
                 self.raise_exception("Открытая скобка в выражении должна быть закрыта!")
             self.read_next_lexeme()
         else:
@@ -0,0 +1,36 @@
+from course_work.core.models.AbstractSyntaxTree2 import Node
+from course_work.core.parsers.SyntaxAnalyzer import SyntaxAnalyzer
+
+
+def ignore(*args):
+    pass
+
+
+# Stand-in for every node of tree when only syntax is checked: building methods of nodes do nothing
+class NullNode:
+    __slots__ = ()
+
+
+# Methods called by rules of SyntaxAnalyzer on nodes
+for _method in (
+    "add_description_node", "add_operator_node", "set_variable_type_lexeme", "add_variable", "set_identifier",
+    "set_expression_node", "set_condition_expression_node", "set_if_operator", "set_else_operator",
+    "set_assignment_operator_node", "set_step_expression_node", "set_operator_node", "set_while_operator",
+    "add_expression_node", "add_operand_node", "add_operation_lexeme", "add_term_node", "add_factor_node",
+    "set_value",
+):
+    setattr(NullNode, _method, staticmethod(ignore))
+
+NULL_NODE = NullNode()
+
+
+# Recognizer running grammar of SyntaxAnalyzer without building tree. It reports the same syntax errors, but not
+# semantic ones found while building tree, such as repeated or unknown variables
+class SyntaxRecognizer(SyntaxAnalyzer):
+    def new_node(self, node_class: type[Node]) -> NullNode:
+        return NULL_NODE
+
+    def parse(self):
+        self.read_next_lexeme()
+        self.func_program()
+        self.AST.root = None
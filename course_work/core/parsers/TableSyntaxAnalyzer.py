@@ -0,0 +1,143 @@
+import json
+from dataclasses import dataclass
+
+from course_work.core.data.LexicalTable import LexicalTable
+from course_work.core.models import AbstractSyntaxTree2
+from course_work.core.models.AbstractSyntaxTree2 import Node
+from course_work.core.parsers.Grammar import ANY_CODE, PARSE_TABLE_PATH, GrammarException
+from course_work.core.parsers.LexicalAnalyzer import LexemeIterator
+from course_work.core.parsers.SyntaxAnalyzer import SyntaxAnalyzer
+
+# Kinds of stack items
+TERMINAL = 0
+NONTERMINAL = 1
+NEW = 2
+CHILD = 3
+DROP = 4
+
+# Error of terminal without error text in grammar
+UNEXPECTED_LEXEME_MESSAGE = "Неожиданная лексема!"
+
+
+# Parse table prepared for parsing: productions are tuples of stack items (kind, value, error, method) in reverse
+# order, so they are pushed to stack at once. Table is not changed, so it is shared by all parsers
+@dataclass(frozen=True)
+class ParseTable:
+    start: int
+    nonterminals: tuple[str, ...]
+    errors: tuple[str | None, ...]
+    defaults: tuple[int | None, ...]
+    predict: tuple[dict[int, int], ...]
+    productions: tuple[tuple[tuple, ...], ...]
+
+    @classmethod
+    def from_dict(cls, table: dict) -> "ParseTable":
+        """
+        Prepare parse table built by Grammar.build_table
+
+        :param table: table dict
+        :return: ParseTable object
+        :raise GrammarException: if table refers to unknown node class
+        """
+        productions = []
+        for production in table["productions"]:
+            items = []
+            for kind, *arguments in production:
+                if kind == "t":
+                    code, error, method = arguments
+                    items.append((TERMINAL, code, error or UNEXPECTED_LEXEME_MESSAGE, method))
+                elif kind == "n":
+                    items.append((NONTERMINAL, arguments[0], None, None))
+                elif kind == "new":
+                    node_class = getattr(AbstractSyntaxTree2, arguments[0], None)
+                    if not isinstance(node_class, type) or not issubclass(node_class, Node):
+                        raise GrammarException(f"Неизвестный класс узла {arguments[0]}")
+                    items.append((NEW, node_class, None, None))
+                elif kind == "child":
+                    items.append((CHILD, None, None, arguments[0]))
+                else:
+                    items.append((DROP, None, None, None))
+            productions.append(tuple(reversed(items)))
+        return cls(
+            start=table["start"],
+            nonterminals=tuple(table["nonterminals"]),
+            errors=tuple(table["errors"]),
+            defaults=tuple(table["defaults"]),
+            predict=tuple({int(code): production for code, production in predict.items()}
+                          for predict in table["predict"]),
+            productions=tuple(productions),
+        )
+
+
+# Loaded parse tables, path -> ParseTable
+_tables: dict[str, ParseTable] = {}
+
+
+def load_parse_table(path: str = PARSE_TABLE_PATH) -> ParseTable:
+    """
+    Load parse table file, every file is read once
+
+    :param path: path of parse table JSON file
+    :return: ParseTable object
+    """
+    table = _tables.get(path)
+    if table is None:
+        with open(path, encoding="utf-8") as f:
+            table = _tables[path] = ParseTable.from_dict(json.load(f))
+    return table
+
+
+# Table-driven LL(1) parser. Grammar is given by parse table, nodes are built by semantic actions of grammar, so tree
+# is the same as tree of SyntaxAnalyzer. Rules are expanded on explicit stack, so nesting depth is not limited by
+# recursion limit
+class TableSyntaxAnalyzer(SyntaxAnalyzer):
+    def __init__(self,
+                 lexical_table: LexicalTable,
+                 lexeme_iterator: LexemeIterator,
+                 table: ParseTable | None = None,
+                 ):
+        super().__init__(lexical_table, lexeme_iterator)
+        self.table = table if table is not None else load_parse_table()
+
+    def parse(self):
+        table = self.table
+        predict = table.predict
+        defaults = table.defaults
+        productions = table.productions
+        stack = [(NONTERMINAL, table.start, None, None)]
+        nodes = []
+
+        self.read_next_lexeme()
+        while stack:
+            kind, value, error, method = stack.pop()
+            if kind == TERMINAL:
+                if self.current_code != value and value != ANY_CODE:
+                    self.raise_exception(error)
+                if method is not None:
+                    getattr(nodes[-1], method)(self.current_lexeme)
+                # Lexeme after the last terminal of program is not read
+                if stack:
+                    self.read_next_lexeme()
+            elif kind == NONTERMINAL:
+                production = predict[value].get(self.current_code, defaults[value])
+                if production is None:
+                    self.raise_exception(table.errors[value])
+                stack.extend(productions[production])
+            elif kind == NEW:
+                nodes.append(self.new_node(value))
+            elif kind == CHILD:
+                child = self.complete_node(nodes.pop())
+                getattr(nodes[-1], method)(child)
+            else:
+                nodes.pop()
+
+        self.AST.root = self.complete_node(nodes.pop())
+
+    def complete_node(self, node: Node) -> Node:
+        """
+        Node is built, called at the same moments as functions of SyntaxAnalyzer return their nodes
+
+        :param node: built node
+        :return: the same node
+        """
+        return node
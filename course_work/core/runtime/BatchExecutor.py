@@ -0,0 +1,296 @@
+from dataclasses import dataclass, field
+from typing import Sequence
+
+try:
+    import numpy as np
+except ImportError:     # batch execution is optional
+    np = None
+
+from course_work.core.data.lexemes import LexemeType
+from course_work.core.data.variables import Variable, VariableType
+from course_work.core.models.AbstractSyntaxTree2 import (
+    AbstractSyntaxTree,
+    Node,
+    CompositeOperatorNode,
+    ConditionalOperatorNode,
+    ConditionalLoopOperatorNode,
+    FixedLoopOperatorNode,
+    AssignmentOperatorNode,
+    ExpressionNode,
+    OperandNode,
+    TermNode,
+    FactorNode,
+    UnaryOperationNode,
+    ReadOperationNode,
+    WriteOperationNode,
+)
+from course_work.core.runtime.values import RuntimeException, format_value, literal_value, parse_value
+
+# Types of arrays of variable values
+DTYPES = {
+    VariableType.TYPE_INT: "int64",
+    VariableType.TYPE_FLOAT: "float64",
+    VariableType.TYPE_BOOL: "bool",
+}
+
+
+# Result of batch execution, one item per run
+@dataclass
+class BatchResult:
+    outputs: list[list[str]] = field(default_factory=list)             # lines written by writeln
+    errors: list[RuntimeException | None] = field(default_factory=list)
+
+
+def divide(first, second, mask):
+    """
+    Divide arrays, integers are divided with truncation toward zero as in tree interpreter
+
+    :param first: dividend array or scalar
+    :param second: divisor array or scalar
+    :param mask: runs where division happens
+    :return: quotient array and mask of runs dividing by zero
+    """
+    first, second = np.asarray(first), np.asarray(second)
+    zero = (second == 0) & mask
+    safe = np.where(second == 0, np.ones_like(second), second)
+    if first.dtype.kind in "iu" and second.dtype.kind in "iu":
+        quotient = np.floor_divide(first, safe)
+        inexact = (first - quotient * safe) != 0
+        quotient = quotient + (inexact & ((first < 0) != (safe < 0)))
+    else:
+        quotient = np.true_divide(first, safe)
+    return quotient, zero
+
+
+# Binary operations of arrays by lexeme type of operation, division is handled separately
+BINARY_UFUNCS = {} if np is None else {
+    LexemeType.LIM_NE: np.not_equal,
+    LexemeType.LIM_EQ: np.equal,
+    LexemeType.LIM_LT: np.less,
+    LexemeType.LIM_LTE: np.less_equal,
+    LexemeType.LIM_GT: np.greater,
+    LexemeType.LIM_GTE: np.greater_equal,
+    LexemeType.LIM_PLUS: np.add,
+    LexemeType.LIM_MINUS: np.subtract,
+    LexemeType.LIM_OR: np.logical_or,
+    LexemeType.LIM_MUL: np.multiply,
+    LexemeType.LIM_AND: np.logical_and,
+}
+
+
+# Execution backend running checked tree over many inputs at once. Every value is an array with one item per run,
+# operators are executed under mask of runs whose control flow reaches them, loops repeat while any run is in them.
+# Runs stopped by runtime error are removed from all masks.
+class BatchExecutor:
+    def __init__(self, tree: AbstractSyntaxTree, inputs):
+        """
+        Initialize executor
+
+        :param tree: checked syntax tree
+        :param inputs: matrix of readln values, one row per run: numeric NumPy array or sequence of token sequences
+        """
+        if np is None:
+            raise ModuleNotFoundError("Для пакетного выполнения требуется пакет numpy")
+        self.tree = tree
+        self.numeric = isinstance(inputs, np.ndarray) and inputs.ndim == 2 and inputs.dtype.kind in "biuf"
+        self.inputs: "np.ndarray | Sequence[Sequence]" = inputs
+        self.runs = len(inputs)
+        self.lanes = np.arange(self.runs)
+        self.positions = np.zeros(self.runs, dtype="int64")     # index of next input value of every run
+        self.alive = np.ones(self.runs, dtype=bool)
+        self.values: list = []
+        self.result = BatchResult()
+        self.literals: dict[int, object] = {}
+        self.executors = {
+            CompositeOperatorNode: self.execute_composite,
+            ConditionalOperatorNode: self.execute_conditional,
+            ConditionalLoopOperatorNode: self.execute_conditional_loop,
+            FixedLoopOperatorNode: self.execute_fixed_loop,
+            AssignmentOperatorNode: self.execute_assignment,
+            ReadOperationNode: self.execute_read,
+            WriteOperationNode: self.execute_write,
+        }
+        self.evaluators = {
+            ExpressionNode: self.evaluate_operations,
+            OperandNode: self.evaluate_operations,
+            TermNode: self.evaluate_operations,
+            FactorNode: self.evaluate_factor,
+            UnaryOperationNode: self.evaluate_unary,
+        }
+
+    def run(self) -> BatchResult:
+        """
+        Execute program for all runs
+
+        :return: outputs and errors of runs
+        """
+        self.values = [np.zeros(self.runs, dtype=DTYPES[variable.variable_type])
+                       for variable in self.tree.symbols.variables]
+        self.result = BatchResult(outputs=[[] for _ in range(self.runs)], errors=[None] * self.runs)
+        mask = self.alive.copy()
+        # Values of runs outside of mask are computed too, their overflows and divisions are not errors
+        with np.errstate(all="ignore"):
+            for operator in self.tree.root.children['operators']:
+                self.execute(operator, mask)
+        return self.result
+
+    def fail(self, runs, message: str, lexeme):
+        """
+        Stop runs with runtime error
+
+        :param runs: mask of failed runs
+        :param message: error message
+        :param lexeme: lexeme where error happened
+        """
+        runs = runs & self.alive
+        for run in np.flatnonzero(runs):
+            self.result.errors[run] = RuntimeException(message, lexeme)
+        self.alive &= ~runs
+
+    # Operators
+    def execute(self, node: Node | None, mask):
+        if node is not None:
+            self.executors[type(node)](node, mask & self.alive)
+
+    def execute_composite(self, node: CompositeOperatorNode, mask):
+        for operator in node.children['operators']:
+            self.execute(operator, mask)
+
+    def execute_conditional(self, node: ConditionalOperatorNode, mask):
+        condition = np.broadcast_to(self.evaluate(node.children['if'], mask), (self.runs,))
+        mask = mask & self.alive
+        self.execute(node.children['then'], mask & condition)
+        self.execute(node.children['else'], mask & ~condition)
+
+    def execute_conditional_loop(self, node: ConditionalLoopOperatorNode, mask):
+        active = mask
+        while True:
+            active = active & self.alive & self.evaluate(node.children['while'], active)
+            if not active.any():
+                break
+            self.execute(node.children['do'], active)
+
+    def execute_fixed_loop(self, node: FixedLoopOperatorNode, mask):
+        # Bound and step are evaluated before every iteration, loop variable is incremented after body
+        header = node.children['for']
+        self.execute_assignment(header, mask)
+        slot = header.identifier_variable.slot
+        active = mask & self.alive
+        while True:
+            bound = self.evaluate(node.children['to'], active)
+            step = 1 if node.children['step'] is None else self.evaluate(node.children['step'], active)
+            value = self.values[slot]
+            finished = np.where(np.asarray(step) >= 0, value > bound, value < bound)
+            active = active & self.alive & ~finished
+            if not active.any():
+                break
+            self.execute(node.children['do'], active)
+            self.values[slot] = np.where(active & self.alive, self.values[slot] + step, self.values[slot])
+
+    def execute_assignment(self, node: AssignmentOperatorNode, mask):
+        slot = node.identifier_variable.slot
+        value = self.evaluate(node.children['expression'], mask)
+        self.values[slot] = np.where(mask & self.alive, value, self.values[slot])
+
+    def execute_read(self, node: ReadOperationNode, mask):
+        for variable in node.children['values']:
+            mask = mask & self.alive
+            if not mask.any():
+                return
+            self.values[variable.slot] = np.where(mask, self.read(variable, mask, node), self.values[variable.slot])
+            self.positions += mask
+
+    def read(self, variable: Variable, mask, node: ReadOperationNode):
+        """
+        Get next input value of variable for runs
+
+        :param variable: variable read by readln
+        :param mask: runs reading value
+        :param node: readln operator node
+        :return: array of values, items outside of mask are arbitrary
+        """
+        dtype = DTYPES[variable.variable_type]
+        if self.numeric:
+            columns = self.inputs.shape[1]
+            missing = mask & (self.positions >= columns)
+            self.fail(missing, "Недостаточно входных данных для readln!", node.starting_lexeme)
+            raw = self.inputs[self.lanes, np.minimum(self.positions, max(columns - 1, 0))] if columns else \
+                np.zeros(self.runs)
+            if variable.variable_type == VariableType.TYPE_FLOAT:
+                return raw.astype(dtype)
+            # Integer and boolean variables accept only whole numbers, boolean ones only 0 and 1
+            wrong = (raw != np.floor(raw)) if raw.dtype.kind == "f" else np.zeros(self.runs, dtype=bool)
+            if variable.variable_type == VariableType.TYPE_BOOL:
+                wrong |= (raw != 0) & (raw != 1)
+            for run in np.flatnonzero(wrong & mask & self.alive):
+                self.fail(self.lanes == run, f"Значение \"{raw[run]}\" не является значением типа "
+                                             f"\"{variable.variable_type.value}\"!", node.starting_lexeme)
+            return raw.astype(dtype)
+
+        values = np.zeros(self.runs, dtype=dtype)
+        for run in np.flatnonzero(mask):
+            row = self.inputs[run]
+            position = self.positions[run]
+            if position >= len(row):
+                self.fail(self.lanes == run, "Недостаточно входных данных для readln!", node.starting_lexeme)
+                continue
+            token = row[position]
+            text = token if isinstance(token, str) else format_value(token.item() if hasattr(token, "item") else token)
+            try:
+                values[run] = parse_value(text, variable.variable_type)
+            except ValueError:
+                self.fail(self.lanes == run, f"Значение \"{text}\" не является значением типа "
+                                             f"\"{variable.variable_type.value}\"!", node.starting_lexeme)
+        return values
+
+    def execute_write(self, node: WriteOperationNode, mask):
+        values = [np.broadcast_to(self.evaluate(expression, mask), (self.runs,))
+                  for expression in node.children['expressions']]
+        runs = np.flatnonzero(mask & self.alive)
+        columns = [value[runs].tolist() for value in values]
+        outputs = self.result.outputs
+        for i, run in enumerate(runs.tolist()):
+            outputs[run].append(" ".join(format_value(column[i]) for column in columns))
+
+    # Expressions
+    def evaluate(self, node: Node, mask):
+        return self.evaluators[type(node)](node, mask)
+
+    def evaluate_operations(self, node: Node, mask):
+        operands = node.children['operands']
+        result = self.evaluate(operands[0], mask)
+        for i, operation in enumerate(node.children['operations']):
+            second = self.evaluate(operands[i + 1], mask)
+            if operation.lexeme_type == LexemeType.LIM_DIV:
+                result, zero = divide(result, second, mask & self.alive)
+                if zero.any():
+                    self.fail(zero, "Деление на ноль!", operation)
+            else:
+                result = BINARY_UFUNCS[operation.lexeme_type](result, second)
+        return result
+
+    def evaluate_factor(self, node: FactorNode, mask):
+        value = node.value
+        if isinstance(value, Variable):
+            return self.values[value.slot]
+        if isinstance(value, Node):
+            return self.evaluate(value, mask)
+        literal = self.literals.get(id(node))
+        if literal is None:
+            literal = self.literals[id(node)] = np.array(literal_value(value),
+                                                         dtype=DTYPES[node.get_value_type()])
+        return literal
+
+    def evaluate_unary(self, node: UnaryOperationNode, mask):
+        return np.logical_not(self.evaluate(node.children['value'], mask))
+
+
+def execute_batch(tree: AbstractSyntaxTree, inputs) -> BatchResult:
+    """
+    Execute checked tree over many inputs at once
+
+    :param tree: checked syntax tree
+    :param inputs: matrix of readln values, one row per run
+    :return: outputs and errors of runs
+    """
+    return BatchExecutor(tree, inputs).run()
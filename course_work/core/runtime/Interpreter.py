@@ -0,0 +1,206 @@
+from typing import Callable, Iterable
+
+from course_work.core.data.variables import Variable
+from course_work.core.models.AbstractSyntaxTree2 import (
+    AbstractSyntaxTree,
+    Node,
+    CompositeOperatorNode,
+    ConditionalOperatorNode,
+    ConditionalLoopOperatorNode,
+    FixedLoopOperatorNode,
+    AssignmentOperatorNode,
+    ExpressionNode,
+    OperandNode,
+    TermNode,
+    FactorNode,
+    UnaryOperationNode,
+    ReadOperationNode,
+    WriteOperationNode,
+)
+from course_work.core.runtime.values import (
+    RuntimeException,
+    BINARY_OPERATIONS,
+    add,
+    format_value,
+    literal_value,
+    parse_value,
+)
+
+
+# Tree-walking execution backend of checked tree, full or flat
+class Interpreter:
+    def __init__(self, tree: AbstractSyntaxTree, inputs: Iterable[str] | Callable[[Variable], str | None] = ()):
+        """
+        Initialize interpreter
+
+        :param tree: checked (and possibly optimized) syntax tree
+        :param inputs: tokens read by readln, one token per variable, or function returning token for variable
+        """
+        self.tree = tree
+        if callable(inputs):
+            self.read_token = inputs
+        else:
+            tokens = iter(inputs)
+            self.read_token = lambda variable: next(tokens, None)
+        self.values: list = []              # slot -> value
+        self.output: list[str] = []         # lines written by writeln
+        self.literals: dict[int, object] = {}
+        # Shared expressions are computed once per execution of basic block, epoch is number of block execution
+        self.epoch = 0
+        self.shared: dict[Node, Callable] = {}      # shared node -> evaluator computing it once per epoch
+        self.executors = {
+            CompositeOperatorNode: self.execute_composite,
+            ConditionalOperatorNode: self.execute_conditional,
+            ConditionalLoopOperatorNode: self.execute_conditional_loop,
+            FixedLoopOperatorNode: self.execute_fixed_loop,
+            AssignmentOperatorNode: self.execute_assignment,
+            ReadOperationNode: self.execute_read,
+            WriteOperationNode: self.execute_write,
+        }
+        self.evaluators = {
+            ExpressionNode: self.evaluate_operations,
+            OperandNode: self.evaluate_operations,
+            TermNode: self.evaluate_operations,
+            FactorNode: self.evaluate_factor,
+            UnaryOperationNode: self.evaluate_unary,
+        }
+
+    def run(self) -> list[str]:
+        """
+        Execute program
+
+        :return: lines written by writeln
+        :raise RuntimeException: on runtime error
+        """
+        self.values = [None] * len(self.tree.symbols)
+        self.output = []
+        self.epoch = 0
+        self.shared = {node: self.cached(self.evaluators[type(node)]) for node in self.tree.shared_expressions}
+        if self.shared:
+            self.evaluate = self.evaluate_shared
+        for operator in self.tree.root.children['operators']:
+            self.execute(operator)
+        return self.output
+
+    # Operators
+    def execute(self, node: Node | None):
+        if node is not None:
+            self.executors[type(node)](node)
+
+    def execute_composite(self, node: CompositeOperatorNode):
+        for operator in node.children['operators']:
+            self.execute(operator)
+
+    def execute_conditional(self, node: ConditionalOperatorNode):
+        condition = self.evaluate(node.children['if'])
+        self.epoch += 1
+        if condition:
+            self.execute(node.children['then'])
+        else:
+            self.execute(node.children['else'])
+        self.epoch += 1
+
+    def execute_conditional_loop(self, node: ConditionalLoopOperatorNode):
+        condition = node.children['while']
+        body = node.children['do']
+        while True:
+            self.epoch += 1
+            if not self.evaluate(condition):
+                break
+            self.epoch += 1
+            self.execute(body)
+        self.epoch += 1
+
+    def execute_fixed_loop(self, node: FixedLoopOperatorNode):
+        # Bound and step are evaluated before every iteration, loop variable is incremented after body
+        header = node.children['for']
+        self.execute_assignment(header)
+        slot = header.identifier_variable.slot
+        bound_node = node.children['to']
+        step_node = node.children['step']
+        body = node.children['do']
+        while True:
+            self.epoch += 1
+            bound = self.evaluate(bound_node)
+            step = 1 if step_node is None else self.evaluate(step_node)
+            value = self.values[slot]
+            if value > bound if step >= 0 else value < bound:
+                break
+            self.epoch += 1
+            self.execute(body)
+            self.values[slot] = add(self.values[slot], step)
+        self.epoch += 1
+
+    def execute_assignment(self, node: AssignmentOperatorNode):
+        self.values[node.identifier_variable.slot] = self.evaluate(node.children['expression'])
+
+    def execute_read(self, node: ReadOperationNode):
+        for variable in node.children['values']:
+            text = self.read_token(variable)
+            if text is None:
+                raise RuntimeException("Недостаточно входных данных для readln!", node.starting_lexeme)
+            try:
+                self.values[variable.slot] = parse_value(text, variable.variable_type)
+            except ValueError:
+                raise RuntimeException(
+                    f"Значение \"{text}\" не является значением типа \"{variable.variable_type.value}\"!",
+                    node.starting_lexeme,
+                )
+
+    def execute_write(self, node: WriteOperationNode):
+        self.output.append(" ".join(format_value(self.evaluate(expression))
+                                    for expression in node.children['expressions']))
+
+    # Expressions
+    def evaluate(self, node: Node):
+        return self.evaluators[type(node)](node)
+
+    def evaluate_shared(self, node: Node):
+        if node in self.shared:
+            return self.shared[node](node)
+        return self.evaluators[type(node)](node)
+
+    def cached(self, evaluator: Callable) -> Callable:
+        entry = [-1, None]      # epoch and value
+
+        def evaluate(node: Node):
+            if entry[0] != self.epoch:
+                entry[1] = evaluator(node)
+                entry[0] = self.epoch
+            return entry[1]
+        return evaluate
+
+    def evaluate_operations(self, node: Node):
+        operands = node.children['operands']
+        result = self.evaluate(operands[0])
+        for i, operation in enumerate(node.children['operations']):
+            try:
+                result = BINARY_OPERATIONS[operation.lexeme_type](result, self.evaluate(operands[i + 1]))
+            except ZeroDivisionError:
+                raise RuntimeException("Деление на ноль!", operation)
+        return result
+
+    def evaluate_factor(self, node: FactorNode):
+        value = node.value
+        if isinstance(value, Variable):
+            return self.values[value.slot]
+        if isinstance(value, Node):
+            return self.evaluate(value)
+        literal = self.literals.get(id(node))
+        if literal is None:
+            literal = self.literals[id(node)] = literal_value(value)
+        return literal
+
+    def evaluate_unary(self, node: UnaryOperationNode):
+        return not self.evaluate(node.children['value'])
+
+
+def execute(tree: AbstractSyntaxTree, inputs: Iterable[str] | Callable[[Variable], str | None] = ()) -> list[str]:
+    """
+    Execute checked tree
+
+    :param tree: checked syntax tree
+    :param inputs: tokens read by readln or function returning token for variable
+    :return: lines written by writeln
+    """
+    return Interpreter(tree, inputs).run()
@@ -0,0 +1,107 @@
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from course_work.core.data.variables import Variable
+from course_work.core.models.AbstractSyntaxTree2 import AbstractSyntaxTree, Node
+from course_work.core.runtime.Interpreter import Interpreter
+from course_work.core.runtime.values import RuntimeException
+
+
+# Executions of operators starting at one lexeme
+@dataclass
+class OperatorStats:
+    kind: str                   # class name of the first executed node
+    count: int = 0
+    seconds: float = 0.0        # wall time including nested operators
+    self_seconds: float = 0.0   # wall time without nested operators
+    active: bool = False        # operator is being executed, its nested executions are not timed twice
+
+
+# Result of profiled run, runtime error is returned instead of raised, so profile of failed run is kept
+@dataclass
+class ProfiledRun:
+    output: list[str]
+    seconds: float
+    operators: dict[int, OperatorStats] = field(default_factory=dict)    # lexeme pointer -> statistics
+    error: RuntimeException | None = None
+
+
+# Tree interpreter counting executions and time of every operator. Only executors are wrapped: expressions are
+# timed as part of their operators, so overhead is paid once per operator, not once per node
+class OperatorProfiler(Interpreter):
+    def __init__(self, tree: AbstractSyntaxTree, inputs: Iterable[str] | Callable[[Variable], str | None] = ()):
+        """
+        Initialize profiler
+
+        :param tree: checked (and possibly optimized) syntax tree
+        :param inputs: tokens read by readln, one token per variable, or function returning token for variable
+        """
+        super().__init__(tree, inputs)
+        self.operators: dict[int, OperatorStats] = {}
+        # Time of operators finished inside current operator
+        self.nested_seconds = 0.0
+        self.executors = {cls: self.timed(executor) for cls, executor in self.executors.items()}
+
+    def run(self) -> ProfiledRun:
+        """
+        Execute program with profiling
+
+        :return: output, total time, statistics of operators and error which stopped the run
+        """
+        # Dict is kept, wrapped executors refer to it
+        self.operators.clear()
+        self.nested_seconds = 0.0
+        error = None
+        start = time.perf_counter()
+        try:
+            super().run()
+        except RuntimeException as e:
+            error = e
+        return ProfiledRun(self.output, time.perf_counter() - start, dict(self.operators), error)
+
+    def timed(self, executor: Callable) -> Callable:
+        """
+        Wrap executor with counting and timing
+
+        :param executor: executor of operators
+        :return: wrapped executor
+        """
+        operators = self.operators
+        clock = time.perf_counter
+
+        def run(node: Node):
+            pointer = node.starting_lexeme.lexeme_pointer
+            stats = operators.get(pointer)
+            if stats is None:
+                stats = operators[pointer] = OperatorStats(node.__class__.__name__)
+            stats.count += 1
+            if stats.active:
+                return executor(node)
+
+            stats.active = True
+            outer_seconds = self.nested_seconds
+            self.nested_seconds = 0.0
+            start = clock()
+            try:
+                executor(node)
+            finally:
+                elapsed = clock() - start
+                stats.seconds += elapsed
+                stats.self_seconds += elapsed - self.nested_seconds
+                self.nested_seconds = outer_seconds + elapsed
+                stats.active = False
+        return run
+
+
+def run_profiled(tree: AbstractSyntaxTree,
+                 inputs: Iterable[str] | Callable[[Variable], str | None] = (),
+                 ) -> ProfiledRun:
+    """
+    Execute checked tree counting executions and time of operators
+
+    :param tree: checked syntax tree
+    :param inputs: tokens read by readln or function returning token for variable
+    :return: output, total time, statistics of operators and error which stopped the run
+    """
+    return OperatorProfiler(tree, inputs).run()
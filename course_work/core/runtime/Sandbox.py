@@ -0,0 +1,152 @@
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+from course_work.core.data.variables import Variable
+from course_work.core.models.AbstractSyntaxTree2 import AbstractSyntaxTree, Node, WriteOperationNode
+from course_work.core.runtime.Interpreter import Interpreter
+from course_work.core.runtime.values import RuntimeException
+
+# Kinds of exceeded limits
+LIMIT_INSTRUCTIONS = "instructions"
+LIMIT_TIME = "time"
+LIMIT_OUTPUT = "output"
+
+# Wall time is checked once per this number of instructions, checking it on every node costs as much as the node
+TIME_CHECK_PERIOD = 1024
+
+
+# Budgets of one run, None means no limit
+@dataclass(frozen=True)
+class Limits:
+    instructions: int | None = None     # executed operators and evaluated expression nodes
+    seconds: float | None = None        # wall time
+    output: int | None = None           # bytes written by writeln, with line ends
+
+
+# Resources used by one run
+@dataclass
+class ResourceUsage:
+    instructions: int = 0
+    seconds: float = 0.0
+    output: int = 0
+    operations: dict[str, int] = field(default_factory=dict)    # node class name -> number of executions
+    exceeded: str | None = None                                 # kind of exceeded limit
+
+    def to_dict(self) -> dict:
+        return {
+            "instructions": self.instructions,
+            "seconds": self.seconds,
+            "output": self.output,
+            "operations": dict(sorted(self.operations.items(), key=lambda item: -item[1])),
+            "exceeded": self.exceeded,
+        }
+
+
+class LimitExceeded(RuntimeException):
+    def __init__(self, kind: str, message: str, lexeme=None, *args):
+        self.kind = kind
+        super().__init__(message, lexeme, *args)
+
+
+# Result of sandboxed run, runtime errors and exceeded limits are returned instead of raised
+@dataclass
+class SandboxResult:
+    output: list[str]
+    usage: ResourceUsage
+    error: RuntimeException | None = None
+
+
+# Tree interpreter counting every executed node and stopping the run when any budget is spent. Executors and
+# evaluators of interpreter are wrapped, so shared expressions computed once per block are counted once.
+class Sandbox(Interpreter):
+    def __init__(self,
+                 tree: AbstractSyntaxTree,
+                 inputs: Iterable[str] | Callable[[Variable], str | None] = (),
+                 limits: Limits = Limits(),
+                 ):
+        """
+        Initialize sandbox
+
+        :param tree: checked (and possibly optimized) syntax tree
+        :param inputs: tokens read by readln, one token per variable, or function returning token for variable
+        :param limits: budgets of run
+        """
+        super().__init__(tree, inputs)
+        self.limits = limits
+        self.usage = ResourceUsage()
+        self.deadline = 0.0
+        self.executors = {cls: self.counted(cls, executor) for cls, executor in self.executors.items()}
+        self.evaluators = {cls: self.counted(cls, evaluator) for cls, evaluator in self.evaluators.items()}
+        self.executors[WriteOperationNode] = self.counted(WriteOperationNode, self.execute_limited_write)
+
+    def run(self) -> SandboxResult:
+        """
+        Execute program within limits
+
+        :return: output, resource usage and error which stopped the run
+        """
+        self.usage = ResourceUsage()
+        start = time.perf_counter()
+        self.deadline = start + self.limits.seconds if self.limits.seconds is not None else float("inf")
+        error = None
+        try:
+            super().run()
+        except LimitExceeded as e:
+            self.usage.exceeded = e.kind
+            error = e
+        except RuntimeException as e:
+            error = e
+        self.usage.seconds = time.perf_counter() - start
+        return SandboxResult(self.output, self.usage, error)
+
+    def counted(self, cls: type, function: Callable) -> Callable:
+        """
+        Wrap executor or evaluator with counting and checking of budgets
+
+        :param cls: class of nodes handled by function
+        :param function: executor or evaluator
+        :return: wrapped function
+        """
+        name = cls.__name__
+        max_instructions = self.limits.instructions
+
+        def run(node: Node):
+            usage = self.usage
+            # Refused node is not counted, so usage never exceeds budget
+            if max_instructions is not None and usage.instructions >= max_instructions:
+                raise LimitExceeded(LIMIT_INSTRUCTIONS, f"Превышен лимит инструкций ({max_instructions})!",
+                                    node.starting_lexeme)
+            usage.instructions += 1
+            instructions = usage.instructions
+            usage.operations[name] = usage.operations.get(name, 0) + 1
+            if not instructions % TIME_CHECK_PERIOD and time.perf_counter() > self.deadline:
+                raise LimitExceeded(LIMIT_TIME, f"Превышен лимит времени выполнения ({self.limits.seconds} с)!",
+                                    node.starting_lexeme)
+            return function(node)
+        return run
+
+    def execute_limited_write(self, node: WriteOperationNode):
+        self.execute_write(node)
+        size = len(self.output[-1].encode("utf-8")) + 1
+        if self.limits.output is not None and self.usage.output + size > self.limits.output:
+            # Line exceeding limit is not written
+            self.output.pop()
+            raise LimitExceeded(LIMIT_OUTPUT, f"Превышен лимит размера вывода ({self.limits.output} байт)!",
+                                node.starting_lexeme)
+        self.usage.output += size
+
+
+def run_sandboxed(tree: AbstractSyntaxTree,
+                  inputs: Iterable[str] | Callable[[Variable], str | None] = (),
+                  limits: Limits = Limits(),
+                  ) -> SandboxResult:
+    """
+    Execute checked tree within limits
+
+    :param tree: checked syntax tree
+    :param inputs: tokens read by readln or function returning token for variable
+    :param limits: budgets of run
+    :return: output, resource usage and error which stopped the run
+    """
+    return Sandbox(tree, inputs, limits).run()
@@ -0,0 +1,125 @@
+import operator
+from dataclasses import dataclass
+from typing import Callable
+
+from course_work.core.data.lexemes import Lexeme, LexemeType
+from course_work.core.data.variables import VariableType
+from course_work.core.exceptions import RuntimeException
+
+# Bases of integer literals by suffix
+INTEGER_BASES = {"b": 2, "o": 8, "d": 10, "h": 16}
+
+# Integers are signed 64-bit, arithmetic wraps around on overflow
+INTEGER_BITS = 64
+INTEGER_MASK = (1 << INTEGER_BITS) - 1
+INTEGER_SIGN = 1 << (INTEGER_BITS - 1)
+
+
+def wrap_integer(value: int) -> int:
+    return ((value + INTEGER_SIGN) & INTEGER_MASK) - INTEGER_SIGN
+
+
+def parse_integer(literal: str) -> int:
+    """
+    Get value of integer literal
+
+    :param literal: literal string, for example "101b", "17o", "0Ah", "12d" or "12"
+    :return: integer value
+    """
+    base = INTEGER_BASES.get(literal[-1].lower())
+    if base is None:
+        return wrap_integer(int(literal))
+    return wrap_integer(int(literal[:-1], base))
+
+
+def literal_value(value: bool | float | str) -> bool | float | int:
+    """
+    Get runtime value of FactorNode literal
+
+    :param value: value of FactorNode: bool, float or integer literal string
+    :return: runtime value
+    """
+    if isinstance(value, str):
+        return parse_integer(value)
+    return value
+
+
+def divide(first, second):
+    """
+    Divide values, integers are divided with truncation toward zero
+
+    :raise ZeroDivisionError: if second value is zero
+    """
+    if isinstance(first, int) and isinstance(second, int):
+        quotient = abs(first) // abs(second)
+        return wrap_integer(quotient if (first < 0) == (second < 0) else -quotient)
+    return first / second
+
+
+def add(first, second):
+    result = first + second
+    return wrap_integer(result) if type(result) is int else result
+
+
+def subtract(first, second):
+    result = first - second
+    return wrap_integer(result) if type(result) is int else result
+
+
+def multiply(first, second):
+    result = first * second
+    return wrap_integer(result) if type(result) is int else result
+
+
+# Binary operations by lexeme type of operation
+BINARY_OPERATIONS: dict[LexemeType, Callable] = {
+    LexemeType.LIM_NE: operator.ne,
+    LexemeType.LIM_EQ: operator.eq,
+    LexemeType.LIM_LT: operator.lt,
+    LexemeType.LIM_LTE: operator.le,
+    LexemeType.LIM_GT: operator.gt,
+    LexemeType.LIM_GTE: operator.ge,
+    LexemeType.LIM_PLUS: add,
+    LexemeType.LIM_MINUS: subtract,
+    LexemeType.LIM_OR: lambda first, second: first or second,
+    LexemeType.LIM_MUL: multiply,
+    LexemeType.LIM_DIV: divide,
+    LexemeType.LIM_AND: lambda first, second: first and second,
+}
+
+
+def format_value(value) -> str:
+    """
+    Get text of value printed by writeln
+
+    :param value: runtime value
+    :return: text
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def parse_value(text: str, variable_type: VariableType):
+    """
+    Get value read by readln
+
+    :param text: input token
+    :param variable_type: type of variable
+    :return: runtime value
+    :raise ValueError: if text is not a value of type
+    """
+    if variable_type == VariableType.TYPE_INT:
+        return parse_integer(text)
+    if variable_type == VariableType.TYPE_FLOAT:
+        return float(text)
+    if text not in ("true", "false"):
+        raise ValueError(text)
+    return text == "true"
+
+
+# Result of run by tree interpreter or IR executor, lines written before runtime error are kept with the error
+@dataclass
+class ExecutionResult:
+    output: list[str]
+    error: RuntimeException | None = None
@@ -0,0 +1,357 @@
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import click
+
+from course_work import RESERVED_WORDS, STATES_JSON_PATH, read_string
+from course_work.cli import read_file
+from course_work.core.data.lexemes import LexemeType
+from course_work.core.parsers.LexicalAnalyzer import LexicalAnalyzer, LexemeIterator
+from course_work.core.parsers.StreamingAnalyzer import StreamingAnalyzer
+from course_work.core.parsers.SyntaxAnalyzer import SyntaxAnalyzer
+from course_work.core.parsers.SyntaxRecognizer import SyntaxRecognizer
+from course_work.utils.generator import ProgramGenerator, parse_size
+
+# Path to stored baseline, it is found relative to package, not to current directory
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "baseline.json")
+
+# Stages of analysis measured by benchmark
+STAGES = ["lexer", "parser", "recognizer", "semantic", "printer"]
+
+# Programs larger than this are not kept in memory: they are written to temporary file and only stages reading
+# the file are measured
+IN_MEMORY_LIMIT = 1 << 20
+
+# Stages measured on programs written to file
+FILE_STAGES = ["lexer", "recognizer", "streaming"]
+
+
+def make_syntax_analyzer(states: dict, text: str, analyzer_class: type[SyntaxAnalyzer] = SyntaxAnalyzer) -> SyntaxAnalyzer:
+    """
+    Create fresh analyzers for program text
+
+    :param states: states of lexical state machine
+    :param text: program text
+    :param analyzer_class: class of syntax analyzer
+    :return: SyntaxAnalyzer object
+    """
+    lexer = LexicalAnalyzer(states, RESERVED_WORDS, read_string(text.replace("\n", " ") + " "))
+    return analyzer_class(lexer.lexical_table, LexemeIterator(lexer))
+
+
+def run_stages(states: dict, text: str) -> dict[str, float]:
+    """
+    Run all analysis stages once and measure their time
+
+    :param states: states of lexical state machine
+    :param text: program text
+    :return: dict of stage timings in seconds and tokens count
+    """
+    timings = {}
+
+    # Lexer only
+    lex_iterator = make_syntax_analyzer(states, text).lexeme_iterator
+    tokens = 0
+    start = time.perf_counter()
+    while lex_iterator.next_lexeme().lexeme_type != LexemeType.LIM_END:
+        tokens += 1
+    timings["lexer"] = time.perf_counter() - start
+
+    # Parser, including lexing
+    p = make_syntax_analyzer(states, text)
+    start = time.perf_counter()
+    p.parse()
+    timings["parser"] = time.perf_counter() - start
+
+    # Recognizer, including lexing, grammar without building tree
+    recognizer = make_syntax_analyzer(states, text, SyntaxRecognizer)
+    start = time.perf_counter()
+    recognizer.parse()
+    timings["recognizer"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    p.AST.root.semantic_check()
+    timings["semantic"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    p.AST.root.to_string()
+    timings["printer"] = time.perf_counter() - start
+
+    timings["tokens"] = tokens
+    return timings
+
+
+def make_file_analyzer(states: dict, source, analyzer_class: type[SyntaxAnalyzer] = SyntaxAnalyzer) -> SyntaxAnalyzer:
+    """
+    Create fresh analyzers for program read from file
+
+    :param states: states of lexical state machine
+    :param source: opened text file of program
+    :param analyzer_class: class of syntax analyzer
+    :return: SyntaxAnalyzer object
+    """
+    lexer = LexicalAnalyzer(states, RESERVED_WORDS, read_file(source))
+    return analyzer_class(lexer.lexical_table, LexemeIterator(lexer))
+
+
+def run_file_stages(states: dict, path: str) -> dict[str, float]:
+    """
+    Run stages which do not keep the whole program in memory once and measure their time
+
+    :param states: states of lexical state machine
+    :param path: path of program file
+    :return: dict of stage timings in seconds and tokens count
+    """
+    timings = {}
+
+    with open(path, encoding="utf-8") as source:
+        lex_iterator = make_file_analyzer(states, source).lexeme_iterator
+        tokens = 0
+        start = time.perf_counter()
+        while lex_iterator.next_lexeme().lexeme_type != LexemeType.LIM_END:
+            tokens += 1
+        timings["lexer"] = time.perf_counter() - start
+
+    with open(path, encoding="utf-8") as source:
+        recognizer = make_file_analyzer(states, source, SyntaxRecognizer)
+        start = time.perf_counter()
+        recognizer.parse()
+        timings["recognizer"] = time.perf_counter() - start
+
+    # Parser, semantic checker and printer of one operator at a time, including lexing
+    with open(path, encoding="utf-8") as source:
+        p = make_file_analyzer(states, source)
+        start = time.perf_counter()
+        for _, node in StreamingAnalyzer(p).parse():
+            node.to_string(2)
+        timings["streaming"] = time.perf_counter() - start
+
+    timings["tokens"] = tokens
+    return timings
+
+
+def measure_memory(states: dict, text: str) -> int:
+    """
+    Measure peak memory of full analysis
+
+    :param states: states of lexical state machine
+    :param text: program text
+    :return: peak memory in bytes
+    """
+    tracemalloc.start()
+    try:
+        p = make_syntax_analyzer(states, text)
+        p.parse()
+        p.AST.root.semantic_check()
+        p.AST.root.to_string()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_file_memory(states: dict, path: str) -> int:
+    """
+    Measure peak memory of streaming analysis of program file
+
+    :param states: states of lexical state machine
+    :param path: path of program file
+    :return: peak memory in bytes
+    """
+    tracemalloc.start()
+    try:
+        with open(path, encoding="utf-8") as source:
+            for _, node in StreamingAnalyzer(make_file_analyzer(states, source)).parse():
+                node.to_string(2)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmark(states: dict, size: int, seed: int, repeat: int, memory: bool) -> dict:
+    """
+    Benchmark analysis of generated program. Program up to IN_MEMORY_LIMIT characters is analyzed as string by all
+    STAGES, larger program is written to temporary file and analyzed by FILE_STAGES
+
+    :param states: states of lexical state machine
+    :param size: approximate size of program in characters
+    :param seed: random seed of generator
+    :param repeat: number of repetitions, best time is taken
+    :param memory: if true, peak memory is measured
+    :return: benchmark result dict
+    """
+    if size > IN_MEMORY_LIMIT:
+        return run_file_benchmark(states, size, seed, repeat, memory)
+
+    text = ProgramGenerator(seed=seed).generate(size)
+    best: dict[str, float] = {}
+    tokens = 0
+    for _ in range(repeat):
+        timings = run_stages(states, text)
+        tokens = timings.pop("tokens")
+        for stage, seconds in timings.items():
+            best[stage] = min(best.get(stage, seconds), seconds)
+
+    result = {
+        "size": len(text),
+        "tokens": tokens,
+        "mode": "memory",
+        "stages": {
+            stage: {
+                "seconds": best[stage],
+                "bytes_per_second": len(text) / best[stage] if best[stage] > 0 else None,
+                "tokens_per_second": tokens / best[stage] if best[stage] > 0 else None,
+            }
+            for stage in STAGES
+        },
+    }
+    if memory:
+        result["peak_memory"] = measure_memory(states, text)
+    return result
+
+
+def run_file_benchmark(states: dict, size: int, seed: int, repeat: int, memory: bool) -> dict:
+    """
+    Benchmark analysis of generated program written to temporary file
+
+    :param states: states of lexical state machine
+    :param size: approximate size of program in characters
+    :param seed: random seed of generator
+    :param repeat: number of repetitions, best time is taken
+    :param memory: if true, peak memory is measured
+    :return: benchmark result dict
+    """
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        ProgramGenerator(seed=seed).write(path, size)
+        best: dict[str, float] = {}
+        tokens = 0
+        for _ in range(repeat):
+            timings = run_file_stages(states, path)
+            tokens = timings.pop("tokens")
+            for stage, seconds in timings.items():
+                best[stage] = min(best.get(stage, seconds), seconds)
+
+        with open(path, encoding="utf-8") as source:
+            length = sum(len(chunk) for chunk in iter(lambda: source.read(1 << 16), ""))
+        result = {
+            "size": length,
+            "tokens": tokens,
+            "mode": "file",
+            "stages": {
+                stage: {
+                    "seconds": best[stage],
+                    "bytes_per_second": length / best[stage] if best[stage] > 0 else None,
+                    "tokens_per_second": tokens / best[stage] if best[stage] > 0 else None,
+                }
+                for stage in FILE_STAGES
+            },
+        }
+        if memory:
+            result["peak_memory"] = measure_file_memory(states, path)
+        return result
+    finally:
+        os.remove(path)
+
+
+def compare_with_baseline(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Compare benchmark results with baseline
+
+    :param results: current results, size label -> benchmark result
+    :param baseline: baseline results, size label -> benchmark result
+    :param threshold: allowed relative regression, for example 0.2
+    :return: list of regression descriptions
+    """
+    regressions = []
+    for label, result in results.items():
+        if label not in baseline:
+            continue
+        base = baseline[label]
+        for stage, stats in result["stages"].items():
+            current_speed = stats["bytes_per_second"]
+            base_speed = base["stages"].get(stage, {}).get("bytes_per_second")
+            if current_speed and base_speed and current_speed < base_speed * (1 - threshold):
+                regressions.append(
+                    f"{label} {stage}: {current_speed:.0f} B/s < {base_speed:.0f} B/s "
+                    f"({(1 - current_speed / base_speed) * 100:.1f}% slower)"
+                )
+        if result.get("peak_memory") and base.get("peak_memory") and \
+                result["peak_memory"] > base["peak_memory"] * (1 + threshold):
+            regressions.append(
+                f"{label} memory: {result['peak_memory']} B > {base['peak_memory']} B "
+                f"({(result['peak_memory'] / base['peak_memory'] - 1) * 100:.1f}% more)"
+            )
+    return regressions
+
+
+@click.command()
+@click.option('--sizes', default="1KB,16KB,64KB", help="Comma separated sizes of programs, for example 1KB,16MB,1GB. Programs larger than "
+                   "1MB are written to temporary file and measured by lexer, recognizer and streaming analysis only")
+@click.option('--seed', type=int, default=0, help="Random seed of program generator")
+@click.option('--repeat', type=int, default=3, help="Number of repetitions, best time is taken")
+@click.option('--memory/--no-memory', default=True, help="Measure peak memory")
+@click.option('--baseline', 'baseline_path', default=BASELINE_PATH, help="Path to baseline JSON file")
+@click.option('--update-baseline', is_flag=True, help="Save results as new baseline")
+@click.option('--threshold', type=float, default=0.25, help="Allowed relative regression")
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), default=None,
+              help="Write results to JSON file")
+def benchmark(sizes, seed, repeat, memory, baseline_path, update_baseline, threshold, output):
+    """
+    Benchmark lexer, parser, semantic checker and printer on generated programs
+    """
+    if not update_baseline and not os.path.exists(baseline_path):
+        raise click.UsageError(f"Baseline {baseline_path} not found, create it with --update-baseline")
+
+    with open(STATES_JSON_PATH, encoding="utf-8") as f:
+        states = json.load(f)
+
+    results = {}
+    for label in sizes.split(","):
+        label = label.strip()
+        result = run_benchmark(states, parse_size(label), seed, repeat, memory)
+        results[label] = result
+        stages = result["stages"]
+        line = f"{label:>8} ({result['size']} символов, {result['tokens']} лексем): " + ", ".join(
+            f"{stage} {stats['bytes_per_second'] / 1024:.1f} КБ/с" for stage, stats in stages.items()
+        ) + (f", память {result['peak_memory'] / 1024:.1f} КБ" if memory else "")
+        if "parser" in stages:
+            line += (f", распознаватель быстрее парсера в "
+                     f"{stages['parser']['seconds'] / stages['recognizer']['seconds']:.2f} раза")
+        click.echo(line)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": results,
+    }
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if update_baseline:
+        os.makedirs(os.path.dirname(baseline_path) or ".", exist_ok=True)
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        click.echo(f"Базовые результаты сохранены в {baseline_path}")
+        return
+
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare_with_baseline(results, baseline["results"], threshold)
+    if regressions:
+        click.echo("Обнаружены регрессии:")
+        for regression in regressions:
+            click.echo("  " + regression)
+        sys.exit(1)
+    click.echo("Регрессий не обнаружено")
+
+
+if __name__ == "__main__":
+    benchmark()
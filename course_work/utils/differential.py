@@ -0,0 +1,396 @@
+import json
+import random
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+import click
+
+from course_work import RESERVED_WORDS, STATES_JSON_PATH, read_string
+from course_work.core.data.lexemes import LexemeType
+from course_work.core.models.AbstractSyntaxTree2 import ASTException
+from course_work.core.models.FiniteStateMachine import FiniteStateMachineException
+from course_work.core.parsers.LexicalAnalyzer import LexicalAnalyzer, LexemeIterator
+from course_work.core.parsers.PipelinedLexer import PipelinedLexemeIterator
+from course_work.core.parsers.PrattSyntaxAnalyzer import PrattSyntaxAnalyzer, expand
+from course_work.core.parsers.StreamingAnalyzer import StreamingAnalyzer
+from course_work.core.parsers.SyntaxAnalyzer import SyntaxAnalyzer, SyntaxException
+from course_work.core.parsers.TableSyntaxAnalyzer import TableSyntaxAnalyzer
+from course_work.utils.generator import ProgramGenerator
+
+
+# Result of running program through one engine
+@dataclass
+class EngineResult:
+    tokens: list[tuple[str, str, int]] = field(default_factory=list)   # (type, value, pointer)
+    tokens_error: tuple[str, int | None] | None = None                 # error of lexing: (kind, position)
+    ast: str | None = None                                             # printed tree of correct program
+    error: tuple[str, int | None] | None = None                        # error of analysis: (kind, position)
+    message: str | None = None                                         # error message, not compared
+
+
+def describe_error(e: Exception) -> tuple[str, int | None]:
+    """
+    Get kind and position of analysis error
+
+    :param e: exception raised by engine
+    :return: error kind and position in text
+    """
+    if isinstance(e, FiniteStateMachineException):
+        return "lexical", e.pointer
+    if isinstance(e, SyntaxException):
+        return "syntax", e.lexeme.lexeme_pointer if e.lexeme else None
+    if isinstance(e, ASTException):
+        return "semantic", e.lexeme.lexeme_pointer if e.lexeme else None
+    return "crash:" + e.__class__.__name__, None
+
+
+# Reference engine: FiniteStateMachine + SyntaxAnalyzer + AbstractSyntaxTree2
+class Engine:
+    name = "reference"
+    # Errors are reported in the same order as by reference engine, so their kinds and positions are compared
+    exact_errors = True
+
+    def make_syntax_analyzer(self, states: dict, text: str) -> SyntaxAnalyzer:
+        lexer = LexicalAnalyzer(states, RESERVED_WORDS, read_string(text.replace("\n", " ") + " "))
+        return SyntaxAnalyzer(lexer.lexical_table, LexemeIterator(lexer))
+
+    def tokenize(self, states: dict, text: str, result: EngineResult):
+        lex_iterator = self.make_syntax_analyzer(states, text).lexeme_iterator
+        while True:
+            lexeme = lex_iterator.next_lexeme()
+            result.tokens.append((lexeme.lexeme_type.name, lexeme.lexeme_value, lexeme.lexeme_pointer))
+            if lexeme.lexeme_type == LexemeType.LIM_END:
+                break
+
+    def analyze(self, states: dict, text: str) -> str:
+        p = self.make_syntax_analyzer(states, text)
+        p.parse()
+        p.AST.root.semantic_check()
+        return p.AST.root.to_string()
+
+    def run(self, states: dict, text: str) -> EngineResult:
+        """
+        Run program through engine and collect tokens, tree and errors
+
+        :param states: states of lexical state machine
+        :param text: program text
+        :return: EngineResult object
+        """
+        result = EngineResult()
+        try:
+            self.tokenize(states, text, result)
+        except Exception as e:
+            result.tokens_error = describe_error(e)
+        try:
+            result.ast = self.analyze(states, text)
+        except Exception as e:
+            result.error = describe_error(e)
+            result.message = getattr(e, "message", str(e))
+        return result
+
+
+# Registered engines, engine name -> Engine object. First engine is the reference one
+ENGINES: dict[str, Engine] = {}
+
+
+def register_engine(engine: Engine):
+    """
+    Register engine for differential testing
+
+    :param engine: Engine object
+    """
+    ENGINES[engine.name] = engine
+
+
+# Engine with operator-precedence expression parser
+class PrattEngine(Engine):
+    name = "pratt"
+
+    def make_syntax_analyzer(self, states: dict, text: str) -> SyntaxAnalyzer:
+        lexer = LexicalAnalyzer(states, RESERVED_WORDS, read_string(text.replace("\n", " ") + " "))
+        return PrattSyntaxAnalyzer(lexer.lexical_table, LexemeIterator(lexer))
+
+    def analyze(self, states: dict, text: str) -> str:
+        p = self.make_syntax_analyzer(states, text)
+        p.parse()
+        p.AST.root.semantic_check()
+        return expand(p.AST.root).to_string()
+
+
+# Engine with table-driven LL(1) parser
+class TableEngine(Engine):
+    name = "table"
+
+    def make_syntax_analyzer(self, states: dict, text: str) -> SyntaxAnalyzer:
+        lexer = LexicalAnalyzer(states, RESERVED_WORDS, read_string(text.replace("\n", " ") + " "))
+        return TableSyntaxAnalyzer(lexer.lexical_table, LexemeIterator(lexer))
+
+
+# Engine with lexer running in separate process
+class PipelinedEngine(Engine):
+    name = "pipelined"
+
+    def make_syntax_analyzer(self, states: dict, text: str) -> SyntaxAnalyzer:
+        lex_iterator = PipelinedLexemeIterator(states, RESERVED_WORDS, text.replace("\n", " ") + " ")
+        return SyntaxAnalyzer(lex_iterator.lexical_table, lex_iterator)
+
+    def tokenize(self, states: dict, text: str, result: EngineResult):
+        lex_iterator = self.make_syntax_analyzer(states, text).lexeme_iterator
+        try:
+            while True:
+                lexeme = lex_iterator.next_lexeme()
+                result.tokens.append((lexeme.lexeme_type.name, lexeme.lexeme_value, lexeme.lexeme_pointer))
+                if lexeme.lexeme_type == LexemeType.LIM_END:
+                    break
+        finally:
+            lex_iterator.close()
+
+    def analyze(self, states: dict, text: str) -> str:
+        p = self.make_syntax_analyzer(states, text)
+        try:
+            p.parse()
+        finally:
+            p.lexeme_iterator.close()
+        p.AST.root.semantic_check()
+        return p.AST.root.to_string()
+
+
+# Engine checking program one top-level operator at a time. Operator is checked before the next one is parsed, so
+# semantic error may be reported before syntax error later in text: only failure of both engines is compared
+class StreamingEngine(Engine):
+    name = "streaming"
+    exact_errors = False
+
+    def analyze(self, states: dict, text: str) -> str:
+        parts = ["ProgramNode(\n"]
+        current_key = None
+        for key, node in StreamingAnalyzer(self.make_syntax_analyzer(states, text)).parse():
+            if key != current_key:
+                if current_key is not None:
+                    parts.append(" )\n")
+                parts.append(f" {key}: (\n")
+                current_key = key
+            parts.append(node.to_string(2))
+        parts.append(" )\n)ProgramNodeEnd\n")
+        return "".join(parts)
+
+
+register_engine(Engine())
+register_engine(PrattEngine())
+register_engine(TableEngine())
+register_engine(PipelinedEngine())
+register_engine(StreamingEngine())
+
+
+def compare_results(reference: EngineResult, result: EngineResult, exact_errors: bool = True) -> list[str]:
+    """
+    Compare engine result with reference one
+
+    :param reference: result of reference engine
+    :param result: result of tested engine
+    :param exact_errors: compare kinds and positions of analysis errors, otherwise only presence of error is compared
+        when both engines report analysis errors
+    :return: list of differences
+    """
+    differences = []
+    if reference.tokens != result.tokens:
+        for i, (expected, actual) in enumerate(zip(reference.tokens, result.tokens)):
+            if expected != actual:
+                differences.append(f"token {i}: {expected} != {actual}")
+                break
+        else:
+            differences.append(f"tokens count: {len(reference.tokens)} != {len(result.tokens)}")
+    if reference.tokens_error != result.tokens_error:
+        differences.append(f"lexing error: {reference.tokens_error} != {result.tokens_error}")
+    if not exact_errors and reference.error is not None and result.error is not None \
+            and not reference.error[0].startswith("crash:") and not result.error[0].startswith("crash:"):
+        pass
+    elif reference.error != result.error:
+        differences.append(f"error: {reference.error} != {result.error} ({reference.message} / {result.message})")
+    if reference.ast != result.ast:
+        differences.append("tree differs")
+    return differences
+
+
+# States are loaded once per worker process
+_states: dict | None = None
+
+
+def get_states() -> dict:
+    global _states
+    if _states is None:
+        with open(STATES_JSON_PATH, encoding="utf-8") as f:
+            _states = json.load(f)
+    return _states
+
+
+def run_engines(text: str, engines: list[str]) -> dict[str, list[str]]:
+    """
+    Run program through engines and compare them with the first one
+
+    :param text: program text
+    :param engines: names of engines, first is reference
+    :return: engine name -> differences, only engines with differences
+    """
+    states = get_states()
+    reference = ENGINES[engines[0]].run(states, text)
+    mismatches = {}
+    for name in engines[1:]:
+        engine = ENGINES[name]
+        differences = compare_results(reference, engine.run(states, text), engine.exact_errors)
+        if differences:
+            mismatches[name] = differences
+    return mismatches
+
+
+# Mutations
+TOKEN_REGEXP = re.compile(r"\s+|[a-zA-Z0-9.]+|:=|[<>!=]=|&&|\|\||\{[^}]*}|.")
+VOCABULARY = [
+    "program", "var", "begin", "end", "int", "float", "bool", "if", "else", "for", "to", "step", "next", "while",
+    "readln", "writeln", "true", "false", "!=", "==", "<", "<=", ">", ">=", "+", "-", "||", "*", "/", "&&", ",",
+    ";", "(", ")", ":=", "{", "}", "i0", "f0", "b0", "x", "1", "1.5", "101b", "17o", "0Ah", "12d", "1e5", "1.2.3",
+    "12b", "9o", "1ez", ".", "&", "|", ":", "#",
+]
+
+
+def split_tokens(text: str) -> list[str]:
+    return TOKEN_REGEXP.findall(text)
+
+
+def mutate(text: str, rng: random.Random, count: int = 1) -> str:
+    """
+    Apply random token-level mutations to program
+
+    :param text: program text
+    :param rng: random generator
+    :param count: number of mutations
+    :return: mutated program text
+    """
+    tokens = split_tokens(text)
+    for _ in range(count):
+        if not tokens:
+            break
+        i = rng.randrange(len(tokens))
+        r = rng.randrange(6)
+        if r == 0:
+            del tokens[i]
+        elif r == 1:
+            tokens.insert(i, tokens[i])
+        elif r == 2 and i + 1 < len(tokens):
+            tokens[i], tokens[i + 1] = tokens[i + 1], tokens[i]
+        elif r == 3:
+            tokens[i] = rng.choice(VOCABULARY)
+        elif r == 4:
+            tokens.insert(i, " " + rng.choice(VOCABULARY) + " ")
+        else:
+            tokens = tokens[:i]
+    return "".join(tokens)
+
+
+def shrink(text: str, engines: list[str]) -> str:
+    """
+    Shrink program to minimal one which still has mismatch between engines (delta debugging over tokens)
+
+    :param text: program text with mismatch
+    :param engines: names of engines, first is reference
+    :return: minimal program text
+    """
+    tokens = split_tokens(text)
+    granularity = 2
+    while len(tokens) >= 2:
+        chunk_size = max(len(tokens) // granularity, 1)
+        reduced = False
+        start = 0
+        while start < len(tokens):
+            candidate = tokens[:start] + tokens[start + chunk_size:]
+            if candidate and run_engines("".join(candidate), engines):
+                tokens = candidate
+                reduced = True
+            else:
+                start += chunk_size
+        if reduced:
+            granularity = max(granularity - 1, 2)
+        elif chunk_size == 1:
+            break
+        else:
+            granularity = min(granularity * 2, len(tokens))
+    return "".join(tokens)
+
+
+def check_program(job: tuple[int, int, list[str], int]) -> dict | None:
+    """
+    Generate program, run it through engines and shrink it in case of mismatch
+
+    :param job: seed, number of mutations, engine names, program size
+    :return: mismatch description or None
+    """
+    seed, mutations, engines, size = job
+    rng = random.Random(seed)
+    text = ProgramGenerator(seed=seed, max_depth=rng.randint(1, 3)).generate(size)
+    if mutations:
+        text = mutate(text, rng, mutations)
+    try:
+        mismatches = run_engines(text, engines)
+    except RecursionError:
+        return None
+    if not mismatches:
+        return None
+    return {
+        "seed": seed,
+        "mutations": mutations,
+        "mismatches": mismatches,
+        "program": text,
+        "reproducer": shrink(text, engines),
+    }
+
+
+@click.command()
+@click.option('--count', type=int, default=200, help="Number of programs to check")
+@click.option('--seed', type=int, default=0, help="Seed of the first program")
+@click.option('--size', type=int, default=400, help="Approximate size of programs")
+@click.option('--mutated', type=float, default=0.5, help="Part of mutated programs")
+@click.option('--engines', default=None, help="Comma separated engine names, first is reference (default: all)")
+@click.option('--workers', type=int, default=None, help="Number of worker processes (default: CPU count)")
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), default=None,
+              help="Write mismatches to JSON file")
+def differential(count, seed, size, mutated, engines, workers, output):
+    """
+    Differential testing of analysis engines on generated and mutated programs
+    """
+    engine_names = engines.split(",") if engines else list(ENGINES)
+    for name in engine_names:
+        if name not in ENGINES:
+            raise click.BadParameter(f"Unknown engine {name}, available: {', '.join(ENGINES)}")
+
+    rng = random.Random(seed)
+    jobs = [
+        (seed + i, rng.randint(1, 3) if rng.random() < mutated else 0, engine_names, size)
+        for i in range(count)
+    ]
+
+    found = []
+    # Workers of executor are not daemonic, so pipelined engine can start lexer processes in them
+    with ProcessPoolExecutor(workers) as executor:
+        for future in as_completed([executor.submit(check_program, job) for job in jobs]):
+            mismatch = future.result()
+            if mismatch is not None:
+                found.append(mismatch)
+                click.echo(f"Расхождение, seed={mismatch['seed']}:")
+                for name, differences in mismatch["mismatches"].items():
+                    for difference in differences:
+                        click.echo(f"  {name}: {difference}")
+                click.echo("  Минимальная программа: " + repr(mismatch["reproducer"]))
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(found, f, ensure_ascii=False, indent=2)
+
+    click.echo(f"Проверено программ: {count}, движков: {len(engine_names)}, расхождений: {len(found)}")
+    if found:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    differential()
@@ -1,34 +1,97 @@
-from course_work.core.models.AbstractSyntaxTree import ASTException
-from course_work.core.parsers.SyntaxAnalyzer import SyntaxException
+from course_work.core.exceptions import AnalysisException
 
 
-def handle_error(e: ASTException | SyntaxException, original_text: str):
+def handle_error(e: AnalysisException, original_text: str):
     """
     Beautify error
 
-    :param e: ASTException of SyntaxException
+    :param e: exception with lexeme: ASTException, SyntaxException or RuntimeException
     :param original_text: original text of program
     :return: text or error
     """
-    lexeme = e.lexeme
-    position = lexeme.lexeme_pointer
+    if not original_text:
+        return "Ошибка:\nОписание: " + e.message
 
-    start_pos = position
-    end_pos = position
+    ind, start_pos, end_pos, position = locate(original_text, e.lexeme.lexeme_pointer)
+    return format_error(e, ind, original_text[start_pos:end_pos], position - start_pos)
 
-    while original_text[start_pos] != "\n" and start_pos > 0:
-        start_pos -= 1
 
-    while original_text[end_pos] != "\n" and end_pos < len(original_text) - 1:
-        end_pos += 1
+def locate(original_text: str, pointer: int) -> tuple[int, int, int, int]:
+    """
+    Find line of program containing position
+
+    :param original_text: original text of program, not empty
+    :param pointer: position in text, e.g. pointer of lexeme
+    :return: line number from 1, start and end of line, position limited by text
+    """
+    # Lexeme of the end of text points after the last symbol
+    position = max(min(pointer, len(original_text) - 1), 0)
+
+    start_pos = original_text.rfind("\n", 0, position) + 1
+    end_pos = original_text.find("\n", position)
+    if end_pos == -1:
+        end_pos = len(original_text)
+
+    return original_text.count("\n", 0, start_pos) + 1, start_pos, end_pos, position
 
-    line = original_text[start_pos:end_pos + 1]
-    line = line.strip("\n")
 
-    ind = original_text.split("\n").index(line) + 1
+def line_numbers(original_text: str, pointers) -> dict[int, int]:
+    """
+    Find lines of many positions, text is scanned once
+
+    :param original_text: original text of program
+    :param pointers: positions in text
+    :return: position -> line number from 1, the same as line number of locate
+    """
+    result = {}
+    ind = 1
+    counted = 0
+    for pointer in sorted(set(pointers)):
+        position = max(min(pointer, len(original_text) - 1), 0)
+        ind += original_text.count("\n", counted, position)
+        counted = position
+        result[pointer] = ind
+    return result
+
 
+def handle_file_error(e: AnalysisException, file_path: str):
+    """
+    Beautify error of program file without reading the whole file, only lines up to the error are read
+
+    :param e: exception with lexeme: ASTException, SyntaxException or RuntimeException
+    :param file_path: path of program file
+    :return: text or error
+    """
+    position = max(e.lexeme.lexeme_pointer, 0)
+    ind = 0
+    start_pos = 0
+    line = None
+    with open(file_path, encoding="utf-8") as f:
+        for ind, line in enumerate(f, start=1):
+            if start_pos + len(line) > position:
+                break
+            start_pos += len(line)
+        else:
+            if line is None:
+                return "Ошибка:\nОписание: " + e.message
+            # Lexeme of the end of text points after the last symbol
+            start_pos -= len(line)
+            position = start_pos + max(len(line) - 1, 0)
+    return format_error(e, ind, line.rstrip("\n"), position - start_pos)
+
+
+def format_error(e: AnalysisException, ind: int, line: str, column: int):
+    """
+    Format error with line of program and pointer to lexeme
+
+    :param e: exception with lexeme
+    :param ind: line number, from 1
+    :param line: line of program
+    :param column: position of lexeme in line, from 0
+    :return: text of error
+    """
     return (
         "Ошибка:\n" +
         f"{ind}: " + line + "\n"
-        + " " * len(f"{ind}: ") + " " * (position - start_pos) + "^" * len(lexeme.lexeme_value) + "\nОписание: " + e.message
-    )
\ No newline at end of file
+        + " " * len(f"{ind}: ") + " " * column + "^" * len(e.lexeme.lexeme_value) + "\nОписание: " + e.message
+    )
@@ -0,0 +1,87 @@
+import json
+
+from course_work.core.runtime.OperatorProfiler import ProfiledRun
+from course_work.utils.errors_handler import line_numbers
+
+# Number of the hottest operators listed under annotated source
+HOT_OPERATORS = 10
+
+
+def build_report(result: ProfiledRun, original_text: str) -> dict:
+    """
+    Build hot-spot report of profiled run. Time of line is time of operators starting on it without nested
+    operators, so times of all lines sum up to time of run
+
+    :param result: result of profiled run
+    :param original_text: original text of program
+    :return: report dict with operators sorted by time and statistics of lines
+    """
+    lines = line_numbers(original_text, result.operators)
+    total = result.seconds or 1.0
+
+    operators = []
+    for pointer, stats in sorted(result.operators.items(), key=lambda item: (-item[1].seconds, item[0])):
+        operators.append({
+            "offset": pointer,
+            "line": lines[pointer],
+            "kind": stats.kind,
+            "count": stats.count,
+            "seconds": stats.seconds,
+            "self_seconds": stats.self_seconds,
+            "percent": stats.seconds / total * 100,
+        })
+
+    line_stats: dict[int, dict] = {}
+    for pointer, stats in result.operators.items():
+        entry = line_stats.setdefault(lines[pointer], {"line": lines[pointer], "count": 0, "seconds": 0.0})
+        entry["count"] += stats.count
+        entry["seconds"] += stats.self_seconds
+    for entry in line_stats.values():
+        entry["percent"] = entry["seconds"] / total * 100
+
+    return {
+        "seconds": result.seconds,
+        "error": result.error.message if result.error is not None else None,
+        "operators": operators,
+        "lines": [line_stats[ind] for ind in sorted(line_stats)],
+    }
+
+
+def to_json(report: dict) -> str:
+    """
+    Get hot-spot report as JSON string
+    """
+    return json.dumps(report, ensure_ascii=False, indent=2)
+
+
+def format_listing(report: dict, original_text: str) -> str:
+    """
+    Get source of program annotated with executions and time of its lines, followed by the hottest operators
+
+    :param report: report built by build_report
+    :param original_text: original text of program
+    :return: text of listing
+    """
+    line_stats = {entry["line"]: entry for entry in report["lines"]}
+    result = [f"{'Выполнений':>12}{'Время, с':>12}{'%':>7} | Строка"]
+    source_lines = original_text.split("\n")
+    if source_lines[-1] == "":
+        source_lines.pop()
+    for ind, line in enumerate(source_lines, start=1):
+        entry = line_stats.get(ind)
+        if entry is None:
+            prefix = " " * 31
+        else:
+            prefix = f"{entry['count']:>12}{entry['seconds']:>12.6f}{entry['percent']:>7.1f}"
+        result.append(f"{prefix} | {ind:>4}: {line}")
+
+    result.append("")
+    result.append(f"Время выполнения: {report['seconds']:.6f} с")
+    if report["operators"]:
+        result.append("Горячие операторы:")
+        for operator in report["operators"][:HOT_OPERATORS]:
+            result.append(
+                f"  строка {operator['line']:<6}{operator['kind']:<30}{operator['count']:>12}"
+                f"{operator['seconds']:>12.6f}{operator['percent']:>7.1f}"
+            )
+    return "\n".join(result)
@@ -0,0 +1,340 @@
+import random
+from typing import Generator
+
+import click
+
+from course_work.core.data.variables import Variable, VariableType
+
+
+# Generator of random, but syntactically and semantically valid programs
+class ProgramGenerator:
+    def __init__(self,
+                 seed: int | None = None,
+                 variables_per_type: int = 4,
+                 max_depth: int = 3,
+                 max_expression_length: int = 4,
+                 comments: bool = True,
+                 loop_heavy: bool = False,
+                 max_loop_bound: int = 4,
+                 ):
+        """
+        Initialize program generator
+
+        All declared variables are read by "readln" at the beginning of the program, loop counters are assigned
+        only by loop headers, and loops have small constant bounds, so generated programs are valid and terminate.
+
+        :param seed: random seed
+        :param variables_per_type: number of declared variables of every type
+        :param max_depth: maximal nesting of operators
+        :param max_expression_length: maximal number of operands on one level of expression
+        :param comments: if true, comments are inserted between operators
+        :param loop_heavy: if true, most operators are loops with invariant expressions in bodies
+        :param max_loop_bound: maximal bound of loops
+        """
+        self.random = random.Random(seed)
+        self.max_depth = max_depth
+        self.max_expression_length = max_expression_length
+        self.comments = comments
+        self.loop_heavy = loop_heavy
+        self.max_loop_bound = max_loop_bound
+        self.variables = {
+            VariableType.TYPE_INT: [f"i{n}" for n in range(variables_per_type)],
+            VariableType.TYPE_FLOAT: [f"f{n}" for n in range(variables_per_type)],
+            VariableType.TYPE_BOOL: [f"b{n}" for n in range(variables_per_type)],
+        }
+        # Loop counters, one per nesting level
+        self.for_counters = [f"k{n}" for n in range(max_depth + 1)]
+        self.while_counters = [f"w{n}" for n in range(max_depth + 1)]
+
+    # Literals
+    def int_literal(self) -> str:
+        r = self.random.randrange(7)
+        if r == 0:
+            return "".join(self.random.choice("01") for _ in range(self.random.randint(1, 6))) + self.random.choice("bB")
+        if r == 1:
+            return str(self.random.randint(1, 7)) + "".join(
+                self.random.choice("01234567") for _ in range(self.random.randint(0, 3))
+            ) + self.random.choice("oO")
+        if r == 2:
+            # Letters "b", "d" and "e" are avoided, they are number suffixes and exponent
+            return str(self.random.randint(0, 9)) + "".join(
+                self.random.choice("0123456789ACFacf") for _ in range(self.random.randint(0, 3))
+            ) + self.random.choice("hH")
+        if r == 3:
+            return str(self.random.randint(0, 9999)) + self.random.choice("dD")
+        return str(self.random.randint(0, 9999))
+
+    def float_literal(self) -> str:
+        r = self.random.randrange(5)
+        if r == 0:
+            return "." + str(self.random.randint(0, 999))
+        if r == 1:
+            return f"{self.random.randint(0, 999)}.{self.random.randint(0, 999)}e{self.random.choice(['', '+', '-'])}" \
+                   f"{self.random.randint(0, 5)}"
+        if r == 2:
+            return f"{self.random.randint(1, 99)}e{self.random.choice(['', '+', '-'])}{self.random.randint(0, 5)}"
+        return f"{self.random.randint(0, 999)}.{self.random.randint(0, 999)}"
+
+    def non_zero_literal(self, variable_type: VariableType) -> str:
+        if variable_type == VariableType.TYPE_INT:
+            return str(self.random.randint(1, 9))
+        return f"{self.random.randint(1, 9)}.{self.random.randint(0, 9)}"
+
+    def literal(self, variable_type: VariableType) -> str:
+        if variable_type == VariableType.TYPE_INT:
+            return self.int_literal()
+        if variable_type == VariableType.TYPE_FLOAT:
+            return self.float_literal()
+        return self.random.choice(["true", "false"])
+
+    # Expressions
+    def factor(self, variable_type: VariableType, depth: int, counters: list[str]) -> str:
+        if variable_type == VariableType.TYPE_BOOL and self.random.randrange(5) == 0:
+            return "!" + self.factor(variable_type, depth - 1, counters)
+        r = self.random.randrange(10)
+        if r < 4:
+            if variable_type == VariableType.TYPE_INT and counters and r == 0:
+                return self.random.choice(counters)
+            return self.random.choice(self.variables[variable_type])
+        if r < 8 or depth <= 0:
+            return self.literal(variable_type)
+        return "(" + self.expression(variable_type, depth - 1, counters) + ")"
+
+    def term(self, variable_type: VariableType, depth: int, counters: list[str]) -> str:
+        s = self.factor(variable_type, depth, counters)
+        for _ in range(self.random.randint(0, self.max_expression_length - 1) // 2):
+            if variable_type == VariableType.TYPE_BOOL:
+                s += " && " + self.factor(variable_type, depth, counters)
+            elif self.random.randrange(2):
+                # Division only by non-zero constants, so programs can be executed
+                s += " / " + self.non_zero_literal(variable_type)
+            else:
+                s += " * " + self.factor(variable_type, depth, counters)
+        return s
+
+    def operand(self, variable_type: VariableType, depth: int, counters: list[str]) -> str:
+        s = self.term(variable_type, depth, counters)
+        for _ in range(self.random.randint(0, self.max_expression_length - 1)):
+            if variable_type == VariableType.TYPE_BOOL:
+                s += " || " + self.term(variable_type, depth, counters)
+            else:
+                s += f" {self.random.choice('+-')} " + self.term(variable_type, depth, counters)
+        return s
+
+    def relation(self, depth: int, counters: list[str]) -> str:
+        operand_type = self.random.choice([VariableType.TYPE_INT, VariableType.TYPE_FLOAT])
+        return (
+            self.operand(operand_type, depth, counters)
+            + f" {self.random.choice(['<', '<=', '>', '>='])} "
+            + self.operand(operand_type, depth, counters)
+        )
+
+    def equality(self, depth: int, counters: list[str]) -> str:
+        # Value of "==" and "!=" has no type, so it can be only written
+        operand_type = self.random.choice(list(self.variables))
+        return (
+            self.operand(operand_type, depth, counters)
+            + f" {self.random.choice(['==', '!='])} "
+            + self.operand(operand_type, depth, counters)
+        )
+
+    def expression(self, variable_type: VariableType, depth: int, counters: list[str]) -> str:
+        if variable_type == VariableType.TYPE_BOOL:
+            r = self.random.randrange(3)
+            if r == 0:
+                return self.relation(depth, counters)
+            if r == 1 and depth > 0:
+                # Relations inside logical operations must be parenthesized
+                return (
+                    "(" + self.relation(depth - 1, counters) + ")"
+                    + f" {self.random.choice(['||', '&&'])} "
+                    + self.operand(variable_type, depth - 1, counters)
+                )
+        return self.operand(variable_type, depth, counters)
+
+    # Operators
+    def assignment(self, depth: int, counters: list[str]) -> str:
+        variable_type = self.random.choice(list(self.variables))
+        name = self.random.choice(self.variables[variable_type])
+        return f"{name} := {self.expression(variable_type, 2, counters)}"
+
+    def operator(self, depth: int, indent: int, counters: list[str]) -> str:
+        if self.loop_heavy:
+            r = self.random.choice([0, 0, 0, 4, 4, 4, 5, 6]) if depth > 0 else self.random.choice([0, 0, 0, 7])
+        else:
+            r = self.random.randrange(10) if depth > 0 else self.random.choice([0, 0, 0, 7, 8])
+        if r <= 2:
+            s = self.assignment(depth, counters)
+        elif r == 3:
+            s = self.conditional(depth, indent, counters)
+        elif r == 4:
+            s = self.fixed_loop(depth, indent, counters)
+        elif r == 5:
+            s = self.conditional_loop(depth, indent, counters)
+        elif r == 6:
+            s = self.composite(depth, indent, counters)
+        elif r == 7:
+            s = "writeln " + ", ".join(
+                self.equality(1, counters) if self.random.randrange(4) == 0
+                else self.expression(self.random.choice(list(self.variables)), 1, counters)
+                for _ in range(self.random.randint(1, 3))
+            )
+        else:
+            variable_type = self.random.choice(list(self.variables))
+            s = "readln " + ", ".join(
+                self.random.sample(self.variables[variable_type], self.random.randint(1, 2))
+            )
+        if self.comments and self.random.randrange(8) == 0:
+            s = "{ " + self.random.choice(["comment", "TODO", "x := 1; y", "begin end", "(a + b)"]) + " } " + s
+        return s
+
+    def operators_list(self, depth: int, indent: int, counters: list[str]) -> str:
+        separator = ";\n" + " " * indent
+        return " " * indent + separator.join(
+            self.operator(depth - 1, indent, counters) for _ in range(self.random.randint(1, 3))
+        )
+
+    def composite(self, depth: int, indent: int, counters: list[str]) -> str:
+        return "begin\n" + self.operators_list(depth, indent + 2, counters) + "\n" + " " * indent + "end"
+
+    def conditional(self, depth: int, indent: int, counters: list[str]) -> str:
+        # Conditional operator is followed by one skipped lexeme, ";" is used for it
+        s = f"if ({self.expression(VariableType.TYPE_BOOL, 2, counters)}) {self.operator(depth - 1, indent, counters)} ;"
+        if self.random.randrange(2):
+            s += f" else {self.operator(depth - 1, indent, counters)}"
+        return s
+
+    def fixed_loop(self, depth: int, indent: int, counters: list[str]) -> str:
+        counter = self.for_counters[depth]
+        s = f"for {counter} := {self.random.randint(0, 2)} to {self.random.randint(1, self.max_loop_bound)}"
+        if counters and self.random.randrange(2):
+            s += f" + {self.random.choice(counters)}"
+        if self.random.randrange(2):
+            s += f" step {self.random.randint(1, 2)}"
+        return s + " " + self.operator(depth - 1, indent, counters + [counter]) + " next"
+
+    def conditional_loop(self, depth: int, indent: int, counters: list[str]) -> str:
+        # Conditional loop is followed by one skipped lexeme, ";" is used for it
+        counter = self.while_counters[depth]
+        condition = f"{counter} < {self.random.randint(1, self.max_loop_bound)}"
+        if self.random.randrange(2):
+            condition = f"({condition}) && {self.term(VariableType.TYPE_BOOL, 0, counters)}"
+        body_indent = " " * (indent + 2)
+        return (
+            "begin\n"
+            + body_indent + f"{counter} := 0;\n"
+            + body_indent + f"while ({condition}) begin\n"
+            + self.operators_list(depth, indent + 4, counters) + ";\n"
+            + " " * (indent + 4) + f"{counter} := {counter} + 1\n"
+            + body_indent + "end ;\n"
+            + " " * indent + "end"
+        )
+
+    # Program
+    def header(self) -> str:
+        descriptions = [
+            f"{variable_type.value} " + ", ".join(names)
+            for variable_type, names in self.variables.items()
+        ]
+        descriptions.append("int " + ", ".join(self.for_counters + self.while_counters))
+        all_variables = [name for names in self.variables.values() for name in names]
+        return (
+            "program var " + ";\n  ".join(descriptions) + "\n"
+            + "begin\n"
+            + "  readln " + ", ".join(all_variables)
+        )
+
+    def iter_chunks(self, size: int) -> Generator[str, None, None]:
+        """
+        Generate program by chunks
+
+        :param size: approximate size of program in characters
+        """
+        chunk = self.header()
+        written = 0
+        while written + len(chunk) < size:
+            yield chunk
+            written += len(chunk)
+            chunk = ";\n  " + self.operator(self.max_depth, 2, [])
+        yield chunk
+        yield ";\n  writeln " + ", ".join(self.variables[VariableType.TYPE_INT]) + "\nend\n"
+
+    def generate(self, size: int) -> str:
+        """
+        Generate program
+
+        :param size: approximate size of program in characters
+        :return: program text
+        """
+        return "".join(self.iter_chunks(size))
+
+    def write(self, path: str, size: int):
+        """
+        Generate program to file, without keeping the whole program in memory
+
+        :param path: path of file
+        :param size: approximate size of program in characters
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for chunk in self.iter_chunks(size):
+                f.write(chunk)
+
+
+# Source of random readln values for generated programs
+class InputGenerator:
+    def __init__(self, seed: int | None = None, magnitude: int = 10):
+        """
+        Initialize input generator
+
+        :param seed: random seed
+        :param magnitude: maximal absolute value of numbers
+        """
+        self.random = random.Random(seed)
+        self.magnitude = magnitude
+
+    def __call__(self, variable: Variable) -> str:
+        """
+        Get input token for variable read by readln
+
+        :param variable: variable
+        :return: token
+        """
+        if variable.variable_type == VariableType.TYPE_INT:
+            return str(self.random.randint(-self.magnitude, self.magnitude))
+        if variable.variable_type == VariableType.TYPE_FLOAT:
+            return repr(round(self.random.uniform(-self.magnitude, self.magnitude), 3))
+        return self.random.choice(["true", "false"])
+
+
+def parse_size(size: str) -> int:
+    """
+    Parse size string like "1KB", "10MB" or "1GB"
+
+    :param size: size string
+    :return: size in bytes
+    """
+    units = {"KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3, "B": 1}
+    size = size.strip().upper()
+    for unit, multiplier in units.items():
+        if size.endswith(unit):
+            return int(float(size[:-len(unit)]) * multiplier)
+    return int(size)
+
+
+@click.command()
+@click.argument('output_path', type=click.Path(dir_okay=False, writable=True))
+@click.option('--size', default="1KB", help="Approximate size of program, for example 1KB, 10MB, 1GB")
+@click.option('--seed', type=int, default=None, help="Random seed")
+def generate(output_path, size, seed):
+    """
+    Generate random valid program
+
+    :param output_path: path to write program
+    :param size: approximate size of program
+    :param seed: random seed
+    """
+    ProgramGenerator(seed=seed).write(output_path, parse_size(size))
+
+
+if __name__ == "__main__":
+    generate()
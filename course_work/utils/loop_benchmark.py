@@ -0,0 +1,112 @@
+import json
+import sys
+import time
+
+import click
+
+from course_work import STATES_JSON_PATH
+from course_work.core.optimization.CommonSubexpressions import share_common_subexpressions
+from course_work.core.optimization.DeadCodeElimination import eliminate_dead_code
+from course_work.core.optimization.LoopOptimization import optimize_loops
+from course_work.core.runtime.Interpreter import Interpreter
+from course_work.utils.benchmark import make_syntax_analyzer
+from course_work.utils.generator import ProgramGenerator, InputGenerator, parse_size
+
+
+def prepare_tree(states: dict, text: str, level: int):
+    """
+    Analyze program and optimize it
+
+    :param states: states of lexical state machine
+    :param text: program text
+    :param level: optimization level, as in CLI
+    :return: checked syntax tree and number of optimization changes
+    """
+    p = make_syntax_analyzer(states, text)
+    p.parse()
+    p.AST.root.semantic_check()
+    changes = eliminate_dead_code(p.AST, level)
+    if level >= 3:
+        changes += optimize_loops(p.AST)
+    if level >= 2:
+        changes += share_common_subexpressions(p.AST)
+    return p.AST, len(changes)
+
+
+def run_loop_benchmark(states: dict, size: int, seed: int, repeat: int, levels: list[int], max_loop_bound: int) -> dict:
+    """
+    Benchmark execution of loop-heavy generated program on different optimization levels
+
+    :param states: states of lexical state machine
+    :param size: approximate size of program in characters
+    :param seed: random seed of generator and inputs
+    :param repeat: number of repetitions, best time is taken
+    :param levels: optimization levels
+    :param max_loop_bound: maximal bound of generated loops
+    :return: benchmark result dict
+    """
+    text = ProgramGenerator(seed=seed, loop_heavy=True, max_loop_bound=max_loop_bound).generate(size)
+    result = {"size": len(text), "levels": {}}
+    reference_output = None
+    for level in levels:
+        tree, changes = prepare_tree(states, text, level)
+        best = None
+        output = None
+        for _ in range(repeat):
+            interpreter = Interpreter(tree, InputGenerator(seed))
+            start = time.perf_counter()
+            output = interpreter.run()
+            seconds = time.perf_counter() - start
+            best = seconds if best is None else min(best, seconds)
+        if reference_output is None:
+            reference_output = output
+        result["levels"][level] = {
+            "seconds": best,
+            "changes": changes,
+            "output_matches": output == reference_output,
+        }
+    return result
+
+
+@click.command()
+@click.option('--sizes', default="4KB,16KB", help="Comma separated sizes of programs")
+@click.option('--seed', type=int, default=0, help="Random seed of program and input generators")
+@click.option('--repeat', type=int, default=3, help="Number of repetitions, best time is taken")
+@click.option('--levels', default="0,3", help="Comma separated optimization levels, first is the base one")
+@click.option('--max-loop-bound', type=int, default=10, help="Maximal bound of generated loops")
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), default=None,
+              help="Write results to JSON file")
+def loop_benchmark(sizes, seed, repeat, levels, max_loop_bound, output):
+    """
+    Benchmark execution of loop-heavy generated programs with and without optimizations
+    """
+    with open(STATES_JSON_PATH, encoding="utf-8") as f:
+        states = json.load(f)
+    level_list = [int(level) for level in levels.split(",")]
+
+    results = {}
+    failed = False
+    for label in sizes.split(","):
+        label = label.strip()
+        result = run_loop_benchmark(states, parse_size(label), seed, repeat, level_list, max_loop_bound)
+        results[label] = result
+        base = result["levels"][level_list[0]]["seconds"]
+        click.echo(f"{label:>8} ({result['size']} символов): " + ", ".join(
+            f"-O{level} {timing['seconds'] * 1000:.1f} мс (x{base / timing['seconds']:.2f}, "
+            f"изменений {timing['changes']})"
+            for level, timing in result["levels"].items()
+        ))
+        for level, timing in result["levels"].items():
+            if not timing["output_matches"]:
+                failed = True
+                click.echo(f"  Вывод программы на уровне -O{level} отличается от вывода на уровне -O{level_list[0]}")
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump({"seed": seed, "results": results}, f, ensure_ascii=False, indent=2)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    loop_benchmark()
@@ -0,0 +1,42 @@
+import json
+
+import click
+
+from course_work.core.parsers.Grammar import EMPTY, GRAMMAR_PATH, PARSE_TABLE_PATH, Grammar, GrammarException
+
+
+@click.command()
+@click.option('--grammar', 'grammar_path', type=click.Path(exists=True, dir_okay=False), default=GRAMMAR_PATH,
+              help="Grammar file")
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), default=PARSE_TABLE_PATH,
+              help="Parse table JSON file")
+@click.option('--verbose', is_flag=True, help="Print FIRST and FOLLOW sets")
+def build_parse_table(grammar_path, output, verbose):
+    """
+    Build LL(1) parse table of TableSyntaxAnalyzer from grammar file
+    """
+    try:
+        grammar = Grammar.load(grammar_path)
+        table = grammar.build_table()
+    except GrammarException as e:
+        raise click.ClickException(e.message)
+
+    if verbose:
+        first = grammar.first_sets()
+        follow = grammar.follow_sets(first)
+        for name in grammar.rules:
+            symbols = sorted(first[name] - {EMPTY}) + (["ε"] if EMPTY in first[name] else [])
+            click.echo(f"{name}:")
+            click.echo(f"  FIRST:  {' '.join(symbols)}")
+            click.echo(f"  FOLLOW: {' '.join(sorted(follow[name]))}")
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(table, f, ensure_ascii=False, separators=(",", ":"))
+        f.write("\n")
+    click.echo(f"Таблица записана в {output}: нетерминалов {len(table['nonterminals'])}, "
+               f"альтернатив {len(table['productions'])}, "
+               f"переходов {sum(len(predict) for predict in table['predict'])}")
+
+
+if __name__ == "__main__":
+    build_parse_table()
@@ -0,0 +1,289 @@
+import json
+import time
+import tracemalloc
+from collections import Counter
+from typing import Callable
+
+from course_work.core.data.lexemes import Lexeme
+
+
+# Timing of one analysis stage
+class StageTiming:
+    def __init__(self, name: str):
+        self.name = name
+        self.wall = 0.0     # Exclusive wall time, seconds
+        self.cpu = 0.0      # Exclusive CPU time, seconds
+        self.calls = 0      # How many times stage was entered
+
+
+class _StageContext:
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler.start_stage(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.profiler.stop_stage()
+        return False
+
+
+class _NullContext:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_CONTEXT = _NullContext()
+
+
+# Profiler collecting per-stage timings and analysis counters
+class Profiler:
+    def __init__(self, enabled: bool = True, trace_memory: bool = False):
+        """
+        Initialize profiler
+
+        :param enabled: if false, all stages and instrumentation are no-ops
+        :param trace_memory: if true, peak memory is measured with tracemalloc, it slows down all stages
+        """
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.stages: dict[str, StageTiming] = {}
+        self.fsm_transitions: Counter = Counter()   # (state, next state) -> count
+        self.rule_calls: Counter = Counter()        # grammar rule -> count
+        self.tokens = 0
+        self.nodes = 0
+        self.source_size = 0
+        self.peak_memory: int | None = None
+        self.hooks: list[Callable[[str, str, StageTiming], None]] = []
+
+        # Stack of [stage name, wall start, cpu start] for nested stages
+        self._stack: list[list] = []
+        self._started_tracemalloc = False
+
+    # Hook API
+    def add_hook(self, hook: Callable[[str, str, StageTiming], None]):
+        """
+        Add hook called on stage events
+
+        :param hook: callable(event, stage name, stage timing), event is "start" or "stop"
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[str, str, StageTiming], None]):
+        """
+        Remove previously added hook
+
+        :param hook: hook to remove
+        """
+        self.hooks.remove(hook)
+
+    def _call_hooks(self, event: str, name: str):
+        for hook in self.hooks:
+            hook(event, name, self.stages[name])
+
+    # Stages
+    def start(self):
+        """
+        Start profiling session
+        """
+        if self.enabled and self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self):
+        """
+        Stop profiling session and close all unfinished stages
+        """
+        while self._stack:
+            self.stop_stage()
+        if self._started_tracemalloc:
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def start_stage(self, name: str):
+        """
+        Start stage. Time of nested stages is excluded from the outer stage
+
+        :param name: stage name
+        """
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        if self._stack:
+            self._accumulate(self._stack[-1], wall, cpu)
+        if name not in self.stages:
+            self.stages[name] = StageTiming(name)
+        self.stages[name].calls += 1
+        self._stack.append([name, wall, cpu])
+        if self.hooks:
+            self._call_hooks("start", name)
+
+    def stop_stage(self):
+        """
+        Stop the innermost stage
+        """
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        frame = self._stack.pop()
+        self._accumulate(frame, wall, cpu)
+        if self._stack:
+            self._stack[-1][1] = wall
+            self._stack[-1][2] = cpu
+        if self.hooks:
+            self._call_hooks("stop", frame[0])
+
+    def _accumulate(self, frame: list, wall: float, cpu: float):
+        timing = self.stages[frame[0]]
+        timing.wall += wall - frame[1]
+        timing.cpu += cpu - frame[2]
+        frame[1] = wall
+        frame[2] = cpu
+
+    def stage(self, name: str):
+        """
+        Context manager measuring a stage
+
+        :param name: stage name
+        """
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return _StageContext(self, name)
+
+    # Instrumentation
+    def instrument(self, lexer, lexeme_iterator, syntax_analyzer):
+        """
+        Wrap analyzers methods to collect lexing time and counters
+
+        :param lexer: LexicalAnalyzer object, None if lexer runs in other process
+        :param lexeme_iterator: LexemeIterator object
+        :param syntax_analyzer: SyntaxAnalyzer object
+        """
+        if not self.enabled:
+            return
+
+        # Counting FSM transitions
+        if lexer is not None:
+            handle_res = lexer.handle_res
+
+            def counted_handle_res(res):
+                self.fsm_transitions[(lexer.state, res[0])] += 1
+                handle_res(res)
+
+            lexer.handle_res = counted_handle_res
+
+        # Measuring lexing time and counting tokens
+        next_lexeme = lexeme_iterator.next_lexeme
+
+        def timed_next_lexeme() -> Lexeme:
+            self.start_stage("lexing")
+            try:
+                return next_lexeme()
+            finally:
+                self.stop_stage()
+                self.tokens += 1
+
+        lexeme_iterator.next_lexeme = timed_next_lexeme
+
+        # Counting grammar rules
+        for attribute in dir(syntax_analyzer):
+            if attribute.startswith("func_"):
+                setattr(syntax_analyzer, attribute, self._count_rule(attribute, getattr(syntax_analyzer, attribute)))
+
+    def _count_rule(self, name: str, rule: Callable):
+        rule_name = name[len("func_"):]
+
+        def counted_rule(*args, **kwargs):
+            self.rule_calls[rule_name] += 1
+            return rule(*args, **kwargs)
+
+        return counted_rule
+
+    def count_nodes(self, root):
+        """
+        Count nodes of syntax tree
+
+        :param root: root node of tree
+        """
+        if not self.enabled or root is None:
+            return
+        from course_work.core.models.Visitor import walk
+
+        self.nodes = sum(1 for _ in walk(root))
+
+    # Reports
+    def report(self) -> dict:
+        """
+        Build profiling report
+
+        :return: report dict
+        """
+        lexing = self.stages.get("lexing")
+        tokens_per_second = (self.tokens / lexing.wall) if lexing and lexing.wall > 0 else None
+        return {
+            "stages": {
+                name: {"wall": timing.wall, "cpu": timing.cpu, "calls": timing.calls}
+                for name, timing in self.stages.items()
+            },
+            "total": {
+                "wall": sum(timing.wall for timing in self.stages.values()),
+                "cpu": sum(timing.cpu for timing in self.stages.values()),
+            },
+            "source_size": self.source_size,
+            "tokens": self.tokens,
+            "tokens_per_second": tokens_per_second,
+            "nodes": self.nodes,
+            "peak_memory": self.peak_memory,
+            "fsm_transitions": {
+                f"{state}->{next_state}": count
+                for (state, next_state), count in self.fsm_transitions.most_common()
+            },
+            "rules": dict(self.rule_calls.most_common()),
+        }
+
+    def to_json(self) -> str:
+        """
+        Get profiling report as JSON string
+        """
+        return json.dumps(self.report(), ensure_ascii=False, indent=2)
+
+    def format_table(self) -> str:
+        """
+        Get profiling report as human-readable table
+        """
+        report = self.report()
+        total_wall = report["total"]["wall"] or 1.0
+
+        lines = [f"{'Этап':<20}{'Время, с':>12}{'CPU, с':>12}{'Вызовы':>10}{'%':>8}"]
+        for name, timing in report["stages"].items():
+            lines.append(
+                f"{name:<20}{timing['wall']:>12.6f}{timing['cpu']:>12.6f}{timing['calls']:>10}"
+                f"{timing['wall'] / total_wall * 100:>8.1f}"
+            )
+        lines.append(f"{'итого':<20}{report['total']['wall']:>12.6f}{report['total']['cpu']:>12.6f}")
+        lines.append("")
+        lines.append(f"Размер программы: {report['source_size']} символов")
+        lines.append(f"Лексем: {report['tokens']}")
+        if report["tokens_per_second"] is not None:
+            lines.append(f"Лексем в секунду: {report['tokens_per_second']:.0f}")
+        lines.append(f"Узлов дерева: {report['nodes']}")
+        if report["peak_memory"] is not None:
+            lines.append(f"Пиковая память: {report['peak_memory'] / 1024:.1f} КБ")
+
+        if report["rules"]:
+            lines.append("")
+            lines.append("Правила грамматики:")
+            for rule, count in report["rules"].items():
+                lines.append(f"  {rule:<30}{count:>10}")
+
+        if report["fsm_transitions"]:
+            lines.append("")
+            lines.append("Переходы автомата:")
+            for transition, count in report["fsm_transitions"].items():
+                lines.append(f"  {transition:<30}{count:>10}")
+
+        return "\n".join(lines)
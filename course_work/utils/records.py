@@ -0,0 +1,227 @@
+import json
+from typing import Callable, TextIO
+
+from course_work.core.data.lexemes import Lexeme
+from course_work.core.data.type_rules import operation_rule
+from course_work.core.data.variables import Variable, VariableType
+from course_work.core.models.AbstractSyntaxTree2 import (
+    Node,
+    DescriptionNode,
+    AssignmentOperatorNode,
+    OperationsNode,
+    FactorNode,
+    UnaryOperationNode,
+    ReadOperationNode,
+)
+from course_work.core.models.Visitor import NODES, VALUE, child_fields
+
+# Nodes having value type
+TYPED_NODES = (OperationsNode, FactorNode, UnaryOperationNode)
+
+# Children which are not nodes: lexemes of operations and variables of read, they are written after child fields
+DATA_CHILDREN = {
+    OperationsNode: "operations",
+    ReadOperationNode: "values",
+}
+
+
+# Writer of analysis records in JSON or NDJSON format, records are written as soon as they are produced
+class RecordWriter:
+    def __init__(self, stream: TextIO, ndjson: bool = True):
+        """
+        Initialize records writer
+
+        :param stream: output stream
+        :param ndjson: if true, every record is written on its own line, else one JSON document is written
+        """
+        self.stream = stream
+        self.ndjson = ndjson
+        self.records = 0
+        self.next_node_id = 0
+        # Ids of emitted nodes which parents are not emitted yet
+        self.pending: dict[int, int] = {}
+        # Value types of emitted expression nodes which parents are not emitted yet
+        self.types: dict[int, VariableType | None] = {}
+
+    def write(self, record: dict):
+        """
+        Write one record
+
+        :param record: record dict
+        """
+        text = json.dumps(record, ensure_ascii=False)
+        if self.ndjson:
+            self.stream.write(text + "\n")
+            self.stream.flush()
+        else:
+            self.stream.write(('{"records": [\n' if self.records == 0 else ",\n") + text)
+        self.records += 1
+
+    def finish(self, result: dict):
+        """
+        Write result record and finish output
+
+        :param result: result dict
+        """
+        if self.ndjson:
+            self.write({"record": "result", **result})
+        else:
+            if self.records == 0:
+                self.stream.write('{"records": [')
+            self.stream.write("\n], \"result\": " + json.dumps(result, ensure_ascii=False) + "}\n")
+            self.stream.flush()
+
+    def finish_ok(self):
+        self.finish({"status": "ok"})
+
+    def finish_error(self, kind: str, message: str, offset: int | None):
+        self.finish({"status": "error", "error": {"kind": kind, "message": message, "offset": offset}})
+
+    # Tokens
+    def write_lexeme(self, lexeme: Lexeme):
+        self.write({
+            "record": "token",
+            "type": lexeme.lexeme_type.name,
+            "value": lexeme.lexeme_value,
+            "offset": lexeme.lexeme_pointer,
+        })
+
+    # Nodes
+    def write_node(self, node: Node) -> int:
+        """
+        Write node and all its children which are not written yet, children first
+
+        :param node: node
+        :return: id of node record
+        """
+        children = {}
+        child_types = {}
+        for key, kind in child_fields(node.__class__):
+            if kind == NODES:
+                children[key] = [self.child_id(child) for child in node.children[key]]
+                for child in node.children[key]:
+                    child_types[id(child)] = self.types.pop(id(child), None)
+                continue
+            child = getattr(node, key, None) if kind == VALUE else node.children[key]
+            if isinstance(child, Node):
+                children[key] = self.child_id(child)
+                child_types[id(child)] = self.types.pop(id(child), None)
+        for node_class, key in DATA_CHILDREN.items():
+            if isinstance(node, node_class):
+                children[key] = [self.child_value(item) for item in node.children[key]]
+
+        node_id = self.next_node_id
+        self.next_node_id += 1
+        record = {
+            "record": "node",
+            "id": node_id,
+            "kind": node.__class__.__name__,
+            "offset": node.starting_lexeme.lexeme_pointer if node.starting_lexeme else None,
+            "children": children,
+        }
+        if isinstance(node, TYPED_NODES):
+            value_type = self.value_type(node, child_types)
+            self.types[id(node)] = value_type
+            record["value_type"] = value_type.value if value_type is not None else None
+        value = getattr(node, "value", None)
+        if isinstance(node, DescriptionNode):
+            record["variable_type"] = node.variable_type_lexeme.lexeme_value
+            record["variables"] = node.variables_names
+        elif isinstance(node, AssignmentOperatorNode):
+            record["variable"] = node.identifier_variable.variable_name
+        elif isinstance(node, FactorNode) and not isinstance(value, Node):
+            record["value"] = value.variable_name if isinstance(value, Variable) else value
+        elif isinstance(node, ReadOperationNode):
+            record["variables"] = [variable.variable_name for variable in node.children['values']]
+
+        self.write(record)
+        self.pending[id(node)] = node_id
+        return node_id
+
+    def release(self, node: Node):
+        """
+        Forget written node which parent will not be written, so records of streamed operators are not kept
+
+        :param node: written node
+        """
+        self.pending.pop(id(node), None)
+        self.types.pop(id(node), None)
+
+    def child_id(self, child: Node) -> int:
+        if id(child) in self.pending:
+            return self.pending.pop(id(child))
+        node_id = self.write_node(child)
+        del self.pending[id(child)]
+        return node_id
+
+    def child_value(self, child):
+        if isinstance(child, Node):
+            return self.child_id(child)
+        if isinstance(child, Lexeme):
+            return child.lexeme_value
+        if isinstance(child, Variable):
+            return child.variable_name
+        return child
+
+    @staticmethod
+    def value_type(node: Node, child_types: dict[int, VariableType | None]) -> VariableType | None:
+        """
+        Get value type of expression node from types of its children. Nodes are written before semantic check, so
+        type is None if operand types are wrong, as well as type of any node containing such node
+
+        :param node: expression node
+        :param child_types: id of child node -> its value type
+        :return: value type or None
+        """
+        if isinstance(node, OperationsNode):
+            operand_types = [child_types.get(id(operand)) for operand in node.children['operands']]
+            if not operand_types or None in operand_types:
+                return None
+            operations = node.children['operations']
+            for i, operation in enumerate(operations):
+                if operation_rule(operation.lexeme_type._value_, operand_types[i], operand_types[i + 1])[1] is not None:
+                    return None
+            if not operations:
+                return operand_types[0]
+            return operation_rule(operations[0].lexeme_type._value_, operand_types[0], operand_types[0])[0]
+        if isinstance(node, UnaryOperationNode):
+            value = node.children['value']
+            value_type = child_types.get(id(value)) if value is not None else None
+            return value_type if value_type == VariableType.TYPE_BOOL else None
+        value = getattr(node, "value", None)
+        if isinstance(value, Node):
+            return child_types.get(id(value))
+        if value is None:
+            return None
+        return node.get_value_type()
+
+    # Instrumentation
+    def instrument(self, lexeme_iterator, syntax_analyzer):
+        """
+        Wrap analyzers methods to write tokens and nodes as they are produced
+
+        :param lexeme_iterator: LexemeIterator object
+        :param syntax_analyzer: SyntaxAnalyzer object
+        """
+        next_lexeme = lexeme_iterator.next_lexeme
+
+        def writing_next_lexeme() -> Lexeme:
+            lexeme = next_lexeme()
+            self.write_lexeme(lexeme)
+            return lexeme
+
+        lexeme_iterator.next_lexeme = writing_next_lexeme
+
+        # Table-driven parser does not call rule functions, it reports built nodes by complete_node
+        for attribute in dir(syntax_analyzer):
+            if attribute.startswith("func_") or attribute == "complete_node":
+                setattr(syntax_analyzer, attribute, self._writing_rule(getattr(syntax_analyzer, attribute)))
+
+    def _writing_rule(self, rule: Callable):
+        def writing_rule(*args, **kwargs):
+            node = rule(*args, **kwargs)
+            if isinstance(node, Node) and id(node) not in self.pending:
+                self.write_node(node)
+            return node
+
+        return writing_rule
@@ -0,0 +1,99 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import click
+
+from course_work.utils.generator import ProgramGenerator, parse_size
+
+# Entry script of command line analyzer
+ANALYZER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                             "analyzer.py")
+
+
+def parse_importtime(stderr: str) -> list[dict]:
+    """
+    Parse output of python -X importtime
+
+    :param stderr: standard error of process
+    :return: imported modules in import order: name, self and cumulative time in microseconds, nesting level
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:"):].split("|")
+        modules.append({
+            "module": name.strip(),
+            "self": int(self_time),
+            "cumulative": int(cumulative),
+            "level": (len(name) - len(name.lstrip()) - 1) // 2,
+        })
+    return modules
+
+
+def measure_startup(arguments: list[str]) -> dict:
+    """
+    Run analyzer once with import time tracing
+
+    :param arguments: command line arguments of analyzer
+    :return: wall time of process, total import time and imported modules
+    """
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, "-X", "importtime", ANALYZER_PATH, *arguments],
+                             capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    modules = parse_importtime(process.stderr)
+    return {
+        "wall": wall,
+        "imports": sum(module["cumulative"] for module in modules if module["level"] == 0) / 1e6,
+        "modules": modules,
+    }
+
+
+@click.command()
+@click.option('--repeat', type=int, default=5, help="Number of repetitions, best time is taken")
+@click.option('--top', type=int, default=10, help="Number of slowest top-level imports to print")
+@click.option('--size', default="2KB", help="Size of generated program for analysis runs")
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), default=None,
+              help="Write results to JSON file")
+def startup_benchmark(repeat, top, size, output):
+    """
+    Benchmark start of command line analyzer with python -X importtime
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        program_path = os.path.join(directory, "program.txt")
+        with open(program_path, "w", encoding="utf-8") as f:
+            f.write(ProgramGenerator(seed=0).generate(parse_size(size)))
+        scenarios = {
+            "version": ["--version"],
+            "analyze": [program_path],
+            "run": [program_path, "--run", "--input", os.devnull],
+        }
+
+        results = {}
+        for name, arguments in scenarios.items():
+            best = None
+            for _ in range(repeat):
+                result = measure_startup(arguments)
+                if best is None or result["wall"] < best["wall"]:
+                    best = result
+            results[name] = best
+            own = [module for module in best["modules"] if module["module"].startswith("course_work")]
+            click.echo(f"{name:>8}: процесс {best['wall'] * 1000:.1f} мс, импорт {best['imports'] * 1000:.1f} мс, "
+                       f"модулей {len(best['modules'])}, из них пакета {len(own)}")
+            slowest = sorted((module for module in best["modules"] if module["level"] == 0),
+                             key=lambda module: -module["cumulative"])[:top]
+            for module in slowest:
+                click.echo(f"          {module['cumulative'] / 1000:8.1f} мс  {module['module']}")
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "results": results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    startup_benchmark()
@@ -0,0 +1,108 @@
+import pytest
+from click.testing import CliRunner
+
+from course_work.cli import analyze as analyze_command
+from course_work.core.Analyzer import Analyzer
+from course_work.core.exceptions import RuntimeException
+from course_work.core.ir.Executor import Executor
+from course_work.core.ir.Lowering import lower
+from course_work.core.ir.PassManager import PassManager
+from course_work.core.runtime.BatchExecutor import execute_batch
+from course_work.core.runtime.Interpreter import Interpreter
+
+# Program text and inputs of its runs, one list of readln tokens per run
+PROGRAMS = {
+    "arithmetic": (
+        """program var int a, b; float f; bool c
+begin
+  readln a, b, c;
+  f := 2.5 * 4.0 - 1.0 / 4.0;
+  writeln a + b * 2, a - b / 3, f, f / 2.0;
+  writeln a < b, !(a >= b) || c, !c && true, a == b, f != 9.75
+end""",
+        [["1", "2", "true"], ["-7", "3", "false"], ["10", "10", "true"]],
+    ),
+    "control flow": (
+        """program var int a, n, s; bool c
+begin
+  readln n;
+  s := 0;
+  for a := 1 to n step 2 s := s + a next;
+  writeln s;
+  if (s > 10) writeln 1 ; else writeln 0;
+  c := true;
+  a := 0;
+  while (c) begin a := a + 1; c := a < n end ;;
+  writeln a, !c
+end""",
+        [["0"], ["1"], ["5"], ["12"]],
+    ),
+    "runtime error": (
+        """program var int a, b
+begin
+  readln a, b;
+  writeln a;
+  writeln a + 1;
+  writeln a / b;
+  writeln b
+end""",
+        [["1", "0"], ["6", "3"], ["4"]],
+    ),
+}
+
+
+def analyze(text: str, optimize: int):
+    result = Analyzer(optimize=optimize).analyze_text(text)
+    assert result.ok, result.error
+    return result.tree
+
+
+def execute(executor) -> tuple[list[str], str | None]:
+    try:
+        executor.run()
+    except RuntimeException as e:
+        return executor.output, e.message
+    return executor.output, None
+
+
+@pytest.mark.parametrize("optimize", [0, 3])
+@pytest.mark.parametrize("name", list(PROGRAMS))
+def test_tree_and_ir_outputs_are_equal(name, optimize):
+    text, runs = PROGRAMS[name]
+    for inputs in runs:
+        expected = execute(Interpreter(analyze(text, 0), inputs))
+        tree = analyze(text, optimize)
+        assert execute(Interpreter(tree, inputs)) == expected
+        function = lower(tree)
+        PassManager.for_level(optimize).run(function)
+        assert execute(Executor(function, inputs)) == expected
+
+
+def test_output_before_runtime_error_is_kept():
+    text, _ = PROGRAMS["runtime error"]
+    output, error = execute(Interpreter(analyze(text, 0), ["1", "0"]))
+    assert output == ["1", "2"]
+    assert error is not None
+
+
+@pytest.mark.parametrize("name", list(PROGRAMS))
+def test_batch_outputs_are_equal(name):
+    text, runs = PROGRAMS[name]
+    tree = analyze(text, 0)
+    result = execute_batch(tree, runs)
+    assert len(result.outputs) == len(runs)
+    for inputs, output, error in zip(runs, result.outputs, result.errors):
+        assert (output, None if error is None else error.message) == execute(Interpreter(tree, inputs))
+
+
+def test_batch_runs_once_without_input(tmp_path):
+    text, _ = PROGRAMS["runtime error"]
+    program_path = tmp_path / "program.txt"
+    program_path.write_text(text, encoding="utf-8")
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(" \n\n", encoding="utf-8")
+    result = CliRunner().invoke(analyze_command, [str(program_path), "--run", "--backend", "batch",
+                                                  "--input", str(input_path)])
+    assert result.exit_code == 0
+    assert result.output.count("Запуск") == 1
+    assert "Недостаточно входных данных для readln!" in result.output
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from course_work.cli import analyze
+
+VALID = "program var int a begin readln a; writeln a + 1 end"
+LEXICAL_ERROR = "program var int a begin a := 1 # 2 end"
+SYNTAX_ERROR = "program var int a begin a := (1 + 2; writeln a end"
+SEMANTIC_ERROR = "program var int a; bool c begin c := true; a := c end"
+
+OK = "Программа корректна."
+LEXICAL = "Возникла лексическая ошибка!"
+SYNTAX = "Возникла синтаксическая ошибка!"
+SEMANTIC = "Возникла семантическая ошибка!"
+
+
+def check(tmp_path, text: str, *options: str):
+    path = tmp_path / "program.txt"
+    path.write_text(text, encoding="utf-8")
+    return CliRunner().invoke(analyze, [str(path), *options])
+
+
+@pytest.mark.parametrize("text, lex, syntax, semantic", [
+    (VALID, OK, OK, OK),
+    (LEXICAL_ERROR, LEXICAL, LEXICAL, LEXICAL),
+    (SYNTAX_ERROR, OK, SYNTAX, SYNTAX),
+    (SEMANTIC_ERROR, OK, OK, SEMANTIC),
+])
+def test_verdicts(tmp_path, text, lex, syntax, semantic):
+    for level, verdict in (("lex", lex), ("syntax", syntax), ("semantic", semantic)):
+        result = check(tmp_path, text, "--check", level)
+        assert result.exit_code == 0
+        assert result.output.splitlines()[0] == verdict, level
+        # Tree is not printed
+        assert "ProgramNode" not in result.output
+
+
+@pytest.mark.parametrize("options", [["--parser", "table"], ["--expressions", "pratt"]])
+@pytest.mark.parametrize("level", ["syntax", "semantic"])
+@pytest.mark.parametrize("text", [VALID, LEXICAL_ERROR, SYNTAX_ERROR, SEMANTIC_ERROR])
+def test_verdicts_do_not_depend_on_parser(tmp_path, text, level, options):
+    expected = check(tmp_path, text, "--check", level).output.splitlines()[0]
+    assert check(tmp_path, text, "--check", level, *options).output.splitlines()[0] == expected
+
+
+@pytest.mark.parametrize("text, level, kind", [
+    (VALID, "semantic", None),
+    (LEXICAL_ERROR, "lex", "lexical"),
+    (SYNTAX_ERROR, "syntax", "syntax"),
+    (SEMANTIC_ERROR, "semantic", "semantic"),
+])
+def test_json_verdict(tmp_path, text, level, kind):
+    result = check(tmp_path, text, "--check", level, "--format", "json")
+    document = json.loads(result.output)
+    # Only verdict is written
+    assert document["records"] == []
+    if kind is None:
+        assert document["result"] == {"status": "ok"}
+    else:
+        assert document["result"]["status"] == "error"
+        assert document["result"]["error"]["kind"] == kind
+
+
+@pytest.mark.parametrize("options", [["-O", "1"], ["--run"], ["--emit-ir"], ["--save-ast", "tree.ast"]])
+def test_options_ignored_by_check_are_rejected(tmp_path, options):
+    result = check(tmp_path, VALID, "--check", "semantic", *options)
+    assert result.exit_code == 2
+    assert "--check" in result.output
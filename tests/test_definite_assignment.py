@@ -0,0 +1,40 @@
+import pytest
+
+from course_work.core.Analyzer import Analyzer
+
+
+def program(body: str) -> str:
+    return f"program var int a, b; bool c\nbegin\n  readln c;\n  {body}\nend"
+
+
+@pytest.mark.parametrize("body", [
+    "a := 1; writeln a",
+    "readln a; writeln a",
+    "if (c) a := 1 ; else a := 2; writeln a",
+    "if (c) begin a := 1; b := a end ; else readln a; writeln a",
+    "for a := 1 to 3 writeln a next; writeln a",
+    "a := 0; while (c) begin b := a; a := b + 1; c := false end ;; writeln a",
+    "begin begin a := 1 end end; writeln a",
+])
+def test_accepted(body):
+    result = Analyzer().analyze_text(program(body))
+    assert result.ok, result.error
+
+
+@pytest.mark.parametrize("body, use", [
+    ("writeln a", "writeln a"),
+    ("a := a + 1", "a + 1"),
+    ("if (c) a := 1 ;; writeln a", "writeln a"),
+    ("if (c) b := 1 ; else a := 2; writeln a", "writeln a"),
+    ("while (c) begin a := 1; c := false end ;; writeln a", "writeln a"),
+    ("for b := 1 to 3 a := b next; writeln a", "writeln a"),
+    ("b := 1; writeln b; writeln a, b", "a, b"),
+])
+def test_rejected(body, use):
+    text = program(body)
+    result = Analyzer().analyze_text(text)
+    assert not result.ok
+    assert result.error.kind == "semantic"
+    assert result.error.message == "Переменная использована до инициализации!"
+    # The first read of unassigned variable in text is reported
+    assert result.error.offset == text.rindex(use) + use.index("a")
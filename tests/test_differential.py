@@ -0,0 +1,40 @@
+import pytest
+
+from course_work.utils.differential import ENGINES, get_states, run_engines
+from course_work.utils.generator import ProgramGenerator
+
+NEGATION = """program var int a; bool c, d
+begin
+  readln a, c;
+  d := !c;
+  d := !!(a < 2) || !d && !(true);
+  if (!d) writeln !c, a == 1 ; else writeln a != 1;
+  while (!d) d := !d ;;
+  writeln d
+end"""
+
+
+@pytest.mark.parametrize("text, error", [
+    (NEGATION, None),
+    ("program var int a begin a := 1 { comment } end", None),
+    ("program var int a begin a := 1 { comment", "lexical"),
+    ("{", "lexical"),
+    ("program var int a begin a := !1 end", "semantic"),
+])
+def test_reference_result(text, error):
+    result = ENGINES["reference"].run(get_states(), text)
+    assert (result.error and result.error[0]) == error, result.message
+
+
+@pytest.mark.parametrize("text", [
+    NEGATION,
+    "program var int a begin a := 1 { comment",
+    "program var int a begin a := !1 end",
+])
+def test_engines_agree(text):
+    assert run_engines(text, list(ENGINES)) == {}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_engines_agree_on_generated_programs(seed):
+    assert run_engines(ProgramGenerator(seed=seed).generate(1000), list(ENGINES)) == {}
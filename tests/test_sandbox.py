@@ -0,0 +1,80 @@
+import pytest
+
+from course_work.core.Analyzer import Analyzer
+from course_work.core.runtime.Interpreter import execute
+from course_work.core.runtime.Sandbox import (
+    LIMIT_INSTRUCTIONS,
+    LIMIT_OUTPUT,
+    LIMIT_TIME,
+    LimitExceeded,
+    Limits,
+    run_sandboxed,
+)
+
+ENDLESS = """program var int a
+begin
+  a := 0;
+  while (a >= 0) a := a + 1 ;;
+  writeln a
+end"""
+
+WRITES = """program var int a
+begin
+  for a := 1 to 5 writeln a * 100 next
+end"""
+
+
+def analyze(text: str):
+    result = Analyzer().analyze_text(text)
+    assert result.ok, result.error
+    return result.tree
+
+
+def test_without_limits_output_is_the_same_as_interpreter():
+    tree = analyze(WRITES)
+    result = run_sandboxed(tree)
+    assert result.error is None
+    assert result.usage.exceeded is None
+    assert result.output == execute(tree)
+    assert result.usage.output == sum(len(line) + 1 for line in result.output)
+    assert result.usage.instructions == sum(result.usage.operations.values())
+
+
+def test_usage_is_the_same_within_limit():
+    tree = analyze(WRITES)
+    instructions = run_sandboxed(tree).usage.instructions
+    result = run_sandboxed(tree, limits=Limits(instructions=instructions))
+    assert result.error is None
+    assert result.usage.instructions == instructions
+
+
+@pytest.mark.parametrize("max_instructions", [1, 100, 100000])
+def test_instruction_limit(max_instructions):
+    result = run_sandboxed(analyze(ENDLESS), limits=Limits(instructions=max_instructions))
+    assert isinstance(result.error, LimitExceeded)
+    assert result.usage.exceeded == LIMIT_INSTRUCTIONS
+    # Node refused by budget is not counted
+    assert result.usage.instructions == max_instructions
+
+
+def test_time_limit():
+    result = run_sandboxed(analyze(ENDLESS), limits=Limits(seconds=0.05))
+    assert isinstance(result.error, LimitExceeded)
+    assert result.usage.exceeded == LIMIT_TIME
+    assert result.usage.seconds >= 0.05
+
+
+@pytest.mark.parametrize("max_output, lines", [(0, 0), (3, 0), (4, 1), (11, 2), (19, 4)])
+def test_output_limit(max_output, lines):
+    # Lines are "100", "200", ..., four bytes with line end
+    result = run_sandboxed(analyze(WRITES), limits=Limits(output=max_output))
+    assert isinstance(result.error, LimitExceeded)
+    assert result.usage.exceeded == LIMIT_OUTPUT
+    assert result.output == [str(n * 100) for n in range(1, lines + 1)]
+    assert result.usage.output == 4 * lines
+
+
+def test_output_limit_can_be_spent_exactly():
+    result = run_sandboxed(analyze(WRITES), limits=Limits(output=20))
+    assert result.error is None
+    assert result.usage.output == 20
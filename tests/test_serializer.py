@@ -0,0 +1,63 @@
+import pytest
+
+from course_work.core.Analyzer import Analyzer
+from course_work.core.exceptions import ASTSerializerException
+from course_work.core.models.ASTSerializer import dumps, loads
+
+PROGRAMS = [
+    "program var int a begin a := 1; writeln a end",
+    """program var int a, b; float f; bool c
+begin
+  readln a, b;
+  f := 1.5e2 * .5 - 3.0;
+  c := !(a < b) || true && (a > 0);
+  if (c) writeln a ; else writeln b;
+  for a := 1 to 10 step 2 begin b := b + a; f := f / 2.0 end next;
+  while (b > 0) b := b - 1 ;;
+  writeln a, b, f, !c, a == b
+end""",
+]
+
+
+def analyze(text: str):
+    result = Analyzer().analyze_text(text)
+    assert result.ok, result.error
+    return result
+
+
+@pytest.mark.parametrize("text", PROGRAMS)
+def test_round_trip(text):
+    result = analyze(text)
+    data = dumps(result.tree, result.lexical_table)
+    tree, lexical_table = loads(data)
+    assert tree.root.to_string() == result.tree.root.to_string()
+    assert dumps(tree, lexical_table) == data
+
+
+def test_round_trip_keeps_variables():
+    result = analyze(PROGRAMS[1])
+    tree, _ = loads(dumps(result.tree, result.lexical_table))
+    for name in ("a", "b", "f", "c"):
+        original = result.tree.get_variable(name)
+        variable = tree.get_variable(name)
+        assert (variable.variable_type, variable.slot) == (original.variable_type, original.slot)
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"FLT",
+    b"XYZ\x02",
+    b"FLT\x02\x01\x05\xff\xfe",
+    b"FLT\x02" + b"\xff" * 16,
+])
+def test_malformed_data(data):
+    with pytest.raises(ASTSerializerException):
+        loads(data)
+
+
+def test_truncated_data():
+    result = analyze(PROGRAMS[1])
+    data = dumps(result.tree, result.lexical_table)
+    for size in range(len(data)):
+        with pytest.raises(ASTSerializerException):
+            loads(data[:size])